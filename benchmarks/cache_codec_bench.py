@@ -0,0 +1,108 @@
+"""Benchmark de tamanho e tempo dos codecs do RedisCache.
+
+Usa coleções com o formato da SWAPI (82 personagens e 6 filmes com todas as
+listas de URLs), como as gravadas em "<recurso>:collection".
+
+Uso: PYTHONPATH=. python benchmarks/cache_codec_bench.py [repetições]
+"""
+import random
+import sys
+import time
+
+from src.infrastructure.cache.codec import (
+    CacheCodec,
+    available_compressors,
+    available_serializers,
+)
+
+BASE_URL = "https://swapi.dev/api"
+
+
+def urls(resource: str, count: int, total: int) -> list:
+    return [
+        f"{BASE_URL}/{resource}/{i}/" for i in sorted(random.sample(range(1, total + 1), count))
+    ]
+
+
+def people_collection() -> dict:
+    items = []
+    for index in range(1, 83):
+        items.append(
+            {
+                "name": f"Character {index}",
+                "height": str(random.randint(60, 230)),
+                "mass": random.choice(["unknown", str(random.randint(20, 1358))]),
+                "hair_color": random.choice(["blond", "brown", "black", "none", "n/a"]),
+                "skin_color": random.choice(["fair", "gold", "white, blue", "light"]),
+                "eye_color": random.choice(["blue", "yellow", "red", "brown"]),
+                "birth_year": f"{random.randint(8, 900)}BBY",
+                "gender": random.choice(["male", "female", "n/a"]),
+                "homeworld": f"{BASE_URL}/planets/{random.randint(1, 60)}/",
+                "films": urls("films", random.randint(1, 6), 6),
+                "species": urls("species", random.randint(0, 1), 37),
+                "vehicles": urls("vehicles", random.randint(0, 2), 39),
+                "starships": urls("starships", random.randint(0, 3), 36),
+                "created": "2014-12-09T13:50:51.644000Z",
+                "edited": "2014-12-20T21:17:56.891000Z",
+                "url": f"{BASE_URL}/people/{index}/",
+            }
+        )
+    return {"count": len(items), "items": items, "loaded_at": time.time()}
+
+
+def films_collection() -> dict:
+    items = []
+    for index in range(1, 7):
+        items.append(
+            {
+                "title": f"Episode {index}",
+                "episode_id": index,
+                "opening_crawl": "It is a period of civil war. " * 20,
+                "director": "George Lucas",
+                "producer": "Gary Kurtz, Rick McCallum",
+                "release_date": "1977-05-25",
+                "characters": urls("people", random.randint(15, 40), 82),
+                "planets": urls("planets", random.randint(3, 13), 60),
+                "starships": urls("starships", random.randint(4, 12), 36),
+                "vehicles": urls("vehicles", random.randint(4, 12), 39),
+                "species": urls("species", random.randint(5, 20), 37),
+                "created": "2014-12-10T14:23:31.880000Z",
+                "edited": "2014-12-20T19:49:45.256000Z",
+                "url": f"{BASE_URL}/films/{index}/",
+            }
+        )
+    return {"count": len(items), "items": items, "loaded_at": time.time()}
+
+
+def measure(codec: CacheCodec, value: dict, repeat: int) -> tuple:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        encoded = codec.encode(value)
+    encode_time = (time.perf_counter() - start) / repeat
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        codec.decode(encoded)
+    decode_time = (time.perf_counter() - start) / repeat
+
+    return len(encoded), encode_time, decode_time
+
+
+def main(repeat: int) -> None:
+    random.seed(42)
+    fixtures = {"people:collection": people_collection(), "films:collection": films_collection()}
+
+    for name, value in fixtures.items():
+        print(f"\n{name}")
+        print(f"{'codec':<20}{'bytes':>10}{'encode (ms)':>14}{'decode (ms)':>14}")
+        for serializer in available_serializers():
+            for compression in ["none", *available_compressors()]:
+                codec = CacheCodec(serializer, compression, compress_threshold=1024)
+                size, encode_time, decode_time = measure(codec, value, repeat)
+                label = f"{serializer}+{compression}"
+                encode_ms, decode_ms = encode_time * 1000, decode_time * 1000
+                print(f"{label:<20}{size:>10}{encode_ms:>14.3f}{decode_ms:>14.3f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
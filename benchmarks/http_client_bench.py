@@ -0,0 +1,164 @@
+"""Benchmark de vazão do SwapiClient com diferentes configurações do pool httpx.
+
+Sobe um stub ASGI local (uvicorn, em outro processo) que responde como a SWAPI
+após uma latência fixa e conta as conexões TCP abertas pelo cliente. Cada
+configuração faz o mesmo número de GETs com a mesma concorrência.
+
+HTTP/2 só é medido se o pacote h2 estiver instalado; como o httpx negocia
+HTTP/2 via TLS (ALPN) e o stub é HTTP puro, a linha mostra o efeito do
+cliente configurado com http2=True sobre HTTP/1.1.
+
+Uso: PYTHONPATH=. python benchmarks/http_client_bench.py [requisições] [concorrência] [latência ms]
+"""
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+
+from src.infrastructure.http.retry import RetryPolicy
+from src.infrastructure.http.swapi_client import SwapiClient, h2
+
+
+class StubSwapi:
+    """App ASGI que imita /api/people/<id>/ e conta as conexões recebidas.
+
+    GET /stats devolve e zera o número de portas de origem distintas, isto
+    é, de conexões TCP abertas pelo cliente desde a última consulta.
+    """
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.client_ports = set()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return
+        if scope["path"] == "/stats":
+            body = json.dumps({"connections": len(self.client_ports)}).encode()
+            self.client_ports.clear()
+        else:
+            self.client_ports.add(scope["client"][1])
+            await asyncio.sleep(self.latency)
+            person_id = scope["path"].rstrip("/").split("/")[-1]
+            body = json.dumps(
+                {
+                    "name": f"Character {person_id}",
+                    "height": "172",
+                    "films": [f"https://swapi.dev/api/films/{i}/" for i in range(1, 5)],
+                    "url": f"https://swapi.dev/api/people/{person_id}/",
+                }
+            ).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+def stub_app() -> StubSwapi:
+    """Fábrica usada pelo uvicorn no processo do stub."""
+    return StubSwapi(float(os.environ.get("STUB_LATENCY_MS", "5")) / 1000)
+
+
+def start_server(latency_ms: float) -> tuple:
+    """Sobe o stub em outro processo, para não disputar o GIL com o cliente."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "--factory",
+            "benchmarks.http_client_bench:stub_app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+            "--backlog",
+            "4096",
+        ],
+        env={**os.environ, "STUB_LATENCY_MS": str(latency_ms)},
+    )
+    deadline = time.monotonic() + 10
+    while True:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/stats")
+            return process, port
+        except httpx.TransportError:
+            if time.monotonic() > deadline:
+                process.terminate()
+                raise
+            time.sleep(0.05)
+
+
+CONFIGURATIONS = {
+    "padrão do httpx": {"limits": httpx.Limits()},
+    "sem keep-alive": {"limits": httpx.Limits(max_keepalive_connections=0)},
+    "pool 10 conexões": {"limits": httpx.Limits(max_connections=10, max_keepalive_connections=10)},
+    "pool 100, keep-alive 20": {
+        "limits": httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    },
+    "pool 100, keep-alive 100": {
+        "limits": httpx.Limits(max_connections=100, max_keepalive_connections=100)
+    },
+}
+if h2 is not None:
+    CONFIGURATIONS["http2=True"] = {"limits": httpx.Limits(), "http2": True}
+
+
+async def run(port: int, options: dict, requests: int, concurrency: int) -> float:
+    client = SwapiClient(
+        base_url=f"http://127.0.0.1:{port}/api",
+        retry_policy=RetryPolicy(max_attempts=1),
+        timeouts=httpx.Timeout(30),
+        **options,
+    )
+    client.limiter = None
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(index: int) -> None:
+        async with semaphore:
+            await client.get(f"{client.base_url}/people/{index}/")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(fetch(i) for i in range(requests)))
+    elapsed = time.perf_counter() - start
+    await client.close()
+    return requests / elapsed
+
+
+def main(requests: int, concurrency: int, latency_ms: float) -> None:
+    process, port = start_server(latency_ms)
+    print(f"{requests} GETs, concorrência {concurrency}, latência do stub {latency_ms:.0f}ms")
+    if h2 is None:
+        print("(pacote h2 ausente: configuração http2=True não medida)")
+    print(f"{'configuração':<28}{'req/s':>10}{'conexões':>10}")
+    try:
+        for name, options in CONFIGURATIONS.items():
+            httpx.get(f"http://127.0.0.1:{port}/stats")
+            throughput = asyncio.run(run(port, options, requests, concurrency))
+            connections = httpx.get(f"http://127.0.0.1:{port}/stats").json()["connections"]
+            print(f"{name:<28}{throughput:>10.0f}{connections:>10}")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 50,
+        float(sys.argv[3]) if len(sys.argv) > 3 else 5,
+    )
@@ -0,0 +1,44 @@
+"""Microbenchmark de leituras concorrentes no MemoryCache.
+
+Uso: PYTHONPATH=. python benchmarks/memory_cache_bench.py [tarefas] [leituras]
+"""
+import asyncio
+import sys
+import time
+
+from src.infrastructure.cache.memory_cache import MemoryCache
+
+KEYS = 1000
+
+
+async def reader(cache: MemoryCache, reads: int) -> None:
+    for index in range(reads):
+        await cache.get(f"key{index % KEYS}")
+
+
+async def writer(cache: MemoryCache, writes: int) -> None:
+    for index in range(writes):
+        await cache.set(f"key{index % KEYS}", {"value": index}, 3600)
+        await asyncio.sleep(0)
+
+
+async def run(tasks: int, reads: int) -> None:
+    cache = MemoryCache(max_entries=KEYS * 2)
+    for index in range(KEYS):
+        await cache.set(f"key{index}", {"value": index}, 3600)
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        writer(cache, reads // 10),
+        *(reader(cache, reads) for _ in range(tasks)),
+    )
+    elapsed = time.perf_counter() - start
+
+    total = tasks * reads
+    print(f"{tasks} tarefas x {reads} leituras: {total / elapsed:,.0f} hits/s ({elapsed:.3f}s)")
+
+
+if __name__ == "__main__":
+    task_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    read_count = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    asyncio.run(run(task_count, read_count))
@@ -1,5 +1,19 @@
-from typing import Optional, List, Any
+import re
+from typing import Optional, List, Any, Dict
 from pydantic import BaseModel, Field
+from src.config.exceptions import InvalidFilterError
+
+FILTER_EXPRESSION = re.compile(r"^\s*(\w+)\s*(>=|<=|!=|>|<|=|~)\s*(.+?)\s*$")
+
+EXPRESSION_OPERATORS = {
+    ">=": "gte",
+    "<=": "lte",
+    "!=": "ne",
+    ">": "gt",
+    "<": "lt",
+    "=": "eq",
+    "~": "contains",
+}
 
 
 class FilterCriteria(BaseModel):
@@ -69,3 +83,30 @@ class ErrorResponse(BaseModel):
                 "status_code": 404,
             }
         }
+
+
+def parse_filter_expressions(expressions: Optional[List[str]]) -> Optional[Dict[str, Any]]:
+    """Converte expressões como 'height>=180' em filtros do repositório.
+
+    Expressões repetidas para o mesmo campo são combinadas com AND.
+    """
+    if not expressions:
+        return None
+
+    filters: Dict[str, Any] = {}
+    for expression in expressions:
+        match = FILTER_EXPRESSION.match(expression)
+        if not match:
+            raise InvalidFilterError(expression, "Use o formato campo<operador>valor")
+
+        field, symbol, value = match.groups()
+        condition = {"operator": EXPRESSION_OPERATORS[symbol], "value": value}
+
+        if field not in filters:
+            filters[field] = condition
+        elif isinstance(filters[field], list):
+            filters[field].append(condition)
+        else:
+            filters[field] = [filters[field], condition]
+
+    return filters
@@ -22,6 +22,10 @@ class CharacterService:
             raise ResourceNotFoundError("Personagem", character_id)
         return character
 
+    async def get_characters_by_ids(self, character_ids: List[str]) -> List[Character]:
+        """Obtém vários personagens pelos IDs, preservando a ordem."""
+        return await self.repository.get_many(character_ids)
+
     async def list_characters(
         self,
         page: int = 1,
@@ -56,20 +60,12 @@ class CharacterService:
         )
 
         logger.info(f"Buscando personagens do filme {film_id}")
-        characters = []
 
         try:
-            film = await self.repository.http_client.get(
-                f"https://swapi.dev/api/films/{film_id}/"
-            )
-            character_urls = film.get("characters", [])
-
-            for url in character_urls:
-                character_id = url.rstrip("/").split("/")[-1]
-                character = await self.get_character_by_id(character_id)
-                characters.append(character)
-
-            return characters
+            character_ids = await self.repository.get_related_ids("films", film_id)
+            return await self.get_characters_by_ids(character_ids)
+        except ResourceNotFoundError:
+            raise
         except Exception as e:
             logger.error(f"Erro ao buscar personagens do filme {film_id}: {str(e)}")
             return []
@@ -77,19 +73,12 @@ class CharacterService:
     async def get_characters_from_planet(self, planet_id: str) -> List[Character]:
         """Obtém personagens que são nativos de um planeta específico."""
         logger.info(f"Buscando personagens do planeta {planet_id}")
-        characters = []
 
         try:
-            planet_url = f"https://swapi.dev/api/planets/{planet_id}/"
-            planet = await self.repository.http_client.get(planet_url)
-            resident_urls = planet.get("residents", [])
-
-            for url in resident_urls:
-                character_id = url.rstrip("/").split("/")[-1]
-                character = await self.get_character_by_id(character_id)
-                characters.append(character)
-
-            return characters
+            character_ids = await self.repository.get_related_ids("planets", planet_id)
+            return await self.get_characters_by_ids(character_ids)
+        except ResourceNotFoundError:
+            raise
         except Exception as e:
             logger.error(f"Erro ao buscar personagens do planeta {planet_id}: {str(e)}")
             return []
@@ -20,6 +20,10 @@ class FilmService:
             raise ResourceNotFoundError("Filme", film_id)
         return film
 
+    async def get_films_by_ids(self, film_ids: List[str]) -> List[Film]:
+        """Obtém vários filmes pelos IDs, preservando a ordem."""
+        return await self.repository.get_many(film_ids)
+
     async def list_films(
         self,
         page: int = 1,
@@ -58,20 +62,12 @@ class FilmService:
     async def get_films_by_character(self, character_id: str) -> List[Film]:
         """Obtém filmes nos quais um personagem aparece."""
         logger.info(f"Buscando filmes do personagem {character_id}")
-        films = []
 
         try:
-            character = await self.repository.http_client.get(
-                f"https://swapi.dev/api/people/{character_id}/"
-            )
-            film_urls = character.get("films", [])
-
-            for url in film_urls:
-                film_id = url.rstrip("/").split("/")[-1]
-                film = await self.get_film_by_id(film_id)
-                films.append(film)
-
-            return films
+            film_ids = await self.repository.get_related_ids("people", character_id)
+            return await self.get_films_by_ids(film_ids)
+        except ResourceNotFoundError:
+            raise
         except Exception as e:
             logger.error(f"Erro ao buscar filmes do personagem {character_id}: {str(e)}")
             return []
@@ -79,20 +75,12 @@ class FilmService:
     async def get_films_by_planet(self, planet_id: str) -> List[Film]:
         """Obtém filmes nos quais um planeta aparece."""
         logger.info(f"Buscando filmes do planeta {planet_id}")
-        films = []
 
         try:
-            planet = await self.repository.http_client.get(
-                f"https://swapi.dev/api/planets/{planet_id}/"
-            )
-            film_urls = planet.get("films", [])
-
-            for url in film_urls:
-                film_id = url.rstrip("/").split("/")[-1]
-                film = await self.get_film_by_id(film_id)
-                films.append(film)
-
-            return films
+            film_ids = await self.repository.get_related_ids("planets", planet_id)
+            return await self.get_films_by_ids(film_ids)
+        except ResourceNotFoundError:
+            raise
         except Exception as e:
             logger.error(f"Erro ao buscar filmes do planeta {planet_id}: {str(e)}")
             return []
@@ -100,20 +88,12 @@ class FilmService:
     async def get_films_by_starship(self, starship_id: str) -> List[Film]:
         """Obtém filmes nos quais uma nave aparece."""
         logger.info(f"Buscando filmes da nave {starship_id}")
-        films = []
 
         try:
-            starship = await self.repository.http_client.get(
-                f"https://swapi.dev/api/starships/{starship_id}/"
-            )
-            film_urls = starship.get("films", [])
-
-            for url in film_urls:
-                film_id = url.rstrip("/").split("/")[-1]
-                film = await self.get_film_by_id(film_id)
-                films.append(film)
-
-            return films
+            film_ids = await self.repository.get_related_ids("starships", starship_id)
+            return await self.get_films_by_ids(film_ids)
+        except ResourceNotFoundError:
+            raise
         except Exception as e:
             logger.error(f"Erro ao buscar filmes da nave {starship_id}: {str(e)}")
             return []
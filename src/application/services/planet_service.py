@@ -22,6 +22,10 @@ class PlanetService:
             raise ResourceNotFoundError("Planeta", planet_id)
         return planet
 
+    async def get_planets_by_ids(self, planet_ids: List[str]) -> List[Planet]:
+        """Obtém vários planetas pelos IDs, preservando a ordem."""
+        return await self.repository.get_many(planet_ids)
+
     async def list_planets(
         self,
         page: int = 1,
@@ -52,20 +56,12 @@ class PlanetService:
     async def get_planets_by_film(self, film_id: str) -> List[Planet]:
         """Obtém planetas que aparecem em um filme específico."""
         logger.info(f"Buscando planetas do filme {film_id}")
-        planets = []
 
         try:
-            film = await self.repository.http_client.get(
-                f"https://swapi.dev/api/films/{film_id}/"
-            )
-            planet_urls = film.get("planets", [])
-
-            for url in planet_urls:
-                planet_id = url.rstrip("/").split("/")[-1]
-                planet = await self.get_planet_by_id(planet_id)
-                planets.append(planet)
-
-            return planets
+            planet_ids = await self.repository.get_related_ids("films", film_id)
+            return await self.get_planets_by_ids(planet_ids)
+        except ResourceNotFoundError:
+            raise
         except Exception as e:
             logger.error(f"Erro ao buscar planetas do filme {film_id}: {str(e)}")
             return []
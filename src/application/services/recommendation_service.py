@@ -47,28 +47,19 @@ class RecommendationService:
             # Filmes do personagem
             if character.films:
                 film_ids = [url.split("/")[-2] for url in character.films[:limit]]
-                for film_id in film_ids:
-                    try:
-                        film = await film_service.get_film_by_id(film_id)
-                        recommendations["films"].append({
-                            "title": film.title,
-                            "episode": film.episode_id,
-                        })
-                    except Exception:
-                        pass
+                films = await film_service.get_films_by_ids(film_ids)
+                recommendations["films"] = [
+                    {"title": film.title, "episode": film.episode_id} for film in films
+                ]
 
             # Naves do personagem
             if character.starships:
                 starship_ids = [url.split("/")[-2] for url in character.starships[:limit]]
-                for starship_id in starship_ids:
-                    try:
-                        starship = await starship_service.get_starship_by_id(starship_id)
-                        recommendations["starships"].append({
-                            "name": starship.name,
-                            "class": starship.starship_class,
-                        })
-                    except Exception:
-                        pass
+                starships = await starship_service.get_starships_by_ids(starship_ids)
+                recommendations["starships"] = [
+                    {"name": starship.name, "class": starship.starship_class}
+                    for starship in starships
+                ]
 
             return recommendations
         except Exception as e:
@@ -97,22 +88,14 @@ class RecommendationService:
             # Personagens principais
             if film.characters:
                 char_ids = [url.split("/")[-2] for url in film.characters[:limit]]
-                for char_id in char_ids:
-                    try:
-                        character = await character_service.get_character_by_id(char_id)
-                        recommendations["main_characters"].append(character.name)
-                    except Exception:
-                        pass
+                characters = await character_service.get_characters_by_ids(char_ids)
+                recommendations["main_characters"] = [character.name for character in characters]
 
             # Planetas
             if film.planets:
                 planet_ids = [url.split("/")[-2] for url in film.planets[:limit]]
-                for planet_id in planet_ids:
-                    try:
-                        planet = await planet_service.get_planet_by_id(planet_id)
-                        recommendations["planets"].append(planet.name)
-                    except Exception:
-                        pass
+                planets = await planet_service.get_planets_by_ids(planet_ids)
+                recommendations["planets"] = [planet.name for planet in planets]
 
             return recommendations
         except Exception as e:
@@ -22,6 +22,10 @@ class StarshipService:
             raise ResourceNotFoundError("Nave", starship_id)
         return starship
 
+    async def get_starships_by_ids(self, starship_ids: List[str]) -> List[Starship]:
+        """Obtém várias naves pelos IDs, preservando a ordem."""
+        return await self.repository.get_many(starship_ids)
+
     async def list_starships(
         self,
         page: int = 1,
@@ -52,20 +56,12 @@ class StarshipService:
     async def get_starships_by_film(self, film_id: str) -> List[Starship]:
         """Obtém naves que aparecem em um filme específico."""
         logger.info(f"Buscando naves do filme {film_id}")
-        starships = []
 
         try:
-            film = await self.repository.http_client.get(
-                f"https://swapi.dev/api/films/{film_id}/"
-            )
-            starship_urls = film.get("starships", [])
-
-            for url in starship_urls:
-                starship_id = url.rstrip("/").split("/")[-1]
-                starship = await self.get_starship_by_id(starship_id)
-                starships.append(starship)
-
-            return starships
+            starship_ids = await self.repository.get_related_ids("films", film_id)
+            return await self.get_starships_by_ids(starship_ids)
+        except ResourceNotFoundError:
+            raise
         except Exception as e:
             logger.error(f"Erro ao buscar naves do filme {film_id}: {str(e)}")
             return []
@@ -81,19 +77,12 @@ class StarshipService:
     async def get_starships_by_pilot(self, pilot_id: str) -> List[Starship]:
         """Obtém naves pilotadas por um personagem específico."""
         logger.info(f"Buscando naves do piloto {pilot_id}")
-        starships = []
 
         try:
-            pilot_url = f"https://swapi.dev/api/people/{pilot_id}/"
-            pilot = await self.repository.http_client.get(pilot_url)
-            starship_urls = pilot.get("starships", [])
-
-            for url in starship_urls:
-                starship_id = url.rstrip("/").split("/")[-1]
-                starship = await self.get_starship_by_id(starship_id)
-                starships.append(starship)
-
-            return starships
+            starship_ids = await self.repository.get_related_ids("people", pilot_id)
+            return await self.get_starships_by_ids(starship_ids)
+        except ResourceNotFoundError:
+            raise
         except Exception as e:
             logger.error(f"Erro ao buscar naves do piloto {pilot_id}: {str(e)}")
             return []
@@ -1,5 +1,15 @@
 import os
-from typing import Optional
+from typing import Dict, Optional
+
+
+def _parse_ttls(value: str) -> Dict[str, int]:
+    """Converte "films=86400,people=3600" em um dict recurso -> TTL."""
+    ttls: Dict[str, int] = {}
+    for item in value.split(","):
+        if "=" in item:
+            resource, ttl = item.split("=", 1)
+            ttls[resource.strip()] = int(ttl)
+    return ttls
 
 
 class Settings:
@@ -14,11 +24,65 @@ class Settings:
     # API SWAPI
     SWAPI_BASE_URL: str = "https://swapi.dev/api"
     SWAPI_TIMEOUT: int = int(os.getenv("SWAPI_TIMEOUT", "10"))
+    SWAPI_MAX_CONCURRENCY: int = int(os.getenv("SWAPI_MAX_CONCURRENCY", "10"))
+    SWAPI_MAX_CONNECTIONS: int = int(os.getenv("SWAPI_MAX_CONNECTIONS", "100"))
+    SWAPI_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("SWAPI_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    SWAPI_KEEPALIVE_EXPIRY: float = float(os.getenv("SWAPI_KEEPALIVE_EXPIRY", "30"))
+    SWAPI_HTTP2: bool = os.getenv("SWAPI_HTTP2", "False").lower() == "true"
+    SWAPI_CONNECT_TIMEOUT: float = float(os.getenv("SWAPI_CONNECT_TIMEOUT", "3"))
+    SWAPI_READ_TIMEOUT: float = float(
+        os.getenv("SWAPI_READ_TIMEOUT", os.getenv("SWAPI_TIMEOUT", "10"))
+    )
+    SWAPI_POOL_TIMEOUT: float = float(os.getenv("SWAPI_POOL_TIMEOUT", "5"))
+    SWAPI_RETRY_ATTEMPTS: int = int(os.getenv("SWAPI_RETRY_ATTEMPTS", "3"))
+    SWAPI_RETRY_BASE_DELAY: float = float(os.getenv("SWAPI_RETRY_BASE_DELAY", "0.2"))
+    SWAPI_RETRY_MAX_DELAY: float = float(os.getenv("SWAPI_RETRY_MAX_DELAY", "2"))
+    SWAPI_REQUEST_DEADLINE: float = float(os.getenv("SWAPI_REQUEST_DEADLINE", "20"))
+    SWAPI_BREAKER_FAILURE_THRESHOLD: int = int(os.getenv("SWAPI_BREAKER_FAILURE_THRESHOLD", "5"))
+    SWAPI_BREAKER_RECOVERY_TIMEOUT: float = float(os.getenv("SWAPI_BREAKER_RECOVERY_TIMEOUT", "30"))
+    SWAPI_CONDITIONAL_CACHE_SIZE: int = int(os.getenv("SWAPI_CONDITIONAL_CACHE_SIZE", "2000"))
+    SWAPI_HEDGE_ENABLED: bool = os.getenv("SWAPI_HEDGE_ENABLED", "False").lower() == "true"
+    SWAPI_HEDGE_QUANTILE: float = float(os.getenv("SWAPI_HEDGE_QUANTILE", "0.95"))
+    SWAPI_HEDGE_BUDGET: float = float(os.getenv("SWAPI_HEDGE_BUDGET", "0.1"))
+    SWAPI_HEDGE_MIN_DELAY: float = float(os.getenv("SWAPI_HEDGE_MIN_DELAY", "0.05"))
+    SWAPI_ADAPTIVE_CONCURRENCY: bool = (
+        os.getenv("SWAPI_ADAPTIVE_CONCURRENCY", "True").lower() == "true"
+    )
+    SWAPI_CONCURRENCY_INITIAL_LIMIT: int = int(os.getenv("SWAPI_CONCURRENCY_INITIAL_LIMIT", "20"))
+    SWAPI_CONCURRENCY_MIN_LIMIT: int = int(os.getenv("SWAPI_CONCURRENCY_MIN_LIMIT", "2"))
+    SWAPI_CONCURRENCY_MAX_LIMIT: int = int(os.getenv("SWAPI_CONCURRENCY_MAX_LIMIT", "100"))
+    SWAPI_CONCURRENCY_MAX_QUEUE: int = int(os.getenv("SWAPI_CONCURRENCY_MAX_QUEUE", "200"))
+    SWAPI_CONCURRENCY_QUEUE_TIMEOUT: float = float(
+        os.getenv("SWAPI_CONCURRENCY_QUEUE_TIMEOUT", "5")
+    )
 
     # Cache
     CACHE_ENABLED: bool = os.getenv("CACHE_ENABLED", "True").lower() == "true"
     CACHE_TTL: int = int(os.getenv("CACHE_TTL", "3600"))
+    CACHE_TTL_BY_RESOURCE: Dict[str, int] = _parse_ttls(os.getenv("CACHE_TTL_BY_RESOURCE", ""))
+    CACHE_NEGATIVE_TTL: int = int(os.getenv("CACHE_NEGATIVE_TTL", "60"))
+    CACHE_STALE_TTL: int = int(os.getenv("CACHE_STALE_TTL", "600"))
+    CACHE_XFETCH_BETA: float = float(os.getenv("CACHE_XFETCH_BETA", "1.0"))
+    CACHE_NAMESPACE: str = os.getenv("CACHE_NAMESPACE", "starwars-api")
     REDIS_URL: Optional[str] = os.getenv("REDIS_URL")
+    REDIS_MAX_CONNECTIONS: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "20"))
+    REDIS_SOCKET_TIMEOUT: float = float(os.getenv("REDIS_SOCKET_TIMEOUT", "1"))
+    REDIS_HEALTH_CHECK_INTERVAL: float = float(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "5"))
+    CACHE_MAX_ENTRIES: int = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
+    CACHE_MAX_BYTES: int = int(os.getenv("CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    CACHE_EVICTION_POLICY: str = os.getenv("CACHE_EVICTION_POLICY", "lru")
+    CACHE_SWEEP_INTERVAL: float = float(os.getenv("CACHE_SWEEP_INTERVAL", "5"))
+    CACHE_L1_TTL: int = int(os.getenv("CACHE_L1_TTL", "30"))
+    CACHE_L1_MAX_ENTRIES: int = int(os.getenv("CACHE_L1_MAX_ENTRIES", "1000"))
+    CACHE_DISK_PATH: str = os.getenv("CACHE_DISK_PATH", "")
+    CACHE_DISK_MAX_BYTES: int = int(os.getenv("CACHE_DISK_MAX_BYTES", str(256 * 1024 * 1024)))
+    CACHE_DISK_COMPACT_INTERVAL: float = float(os.getenv("CACHE_DISK_COMPACT_INTERVAL", "300"))
+    CACHE_CODEC: str = os.getenv("CACHE_CODEC", "auto")
+    CACHE_COMPRESSION: str = os.getenv("CACHE_COMPRESSION", "zlib")
+    CACHE_COMPRESS_THRESHOLD: int = int(os.getenv("CACHE_COMPRESS_THRESHOLD", "1024"))
+    CACHE_INVALIDATION_CHANNEL: str = os.getenv(
+        "CACHE_INVALIDATION_CHANNEL", "starwars-api:cache:invalidate"
+    )
 
     # JWT
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production")
@@ -37,6 +101,11 @@ class Settings:
     GCP_PROJECT_ID: Optional[str] = os.getenv("GCP_PROJECT_ID")
     GCP_ENVIRONMENT: str = os.getenv("GCP_ENVIRONMENT", "local")
 
+    @classmethod
+    def get_cache_ttl(cls, resource_type: str) -> int:
+        """Retorna o TTL de cache do recurso, ou o TTL padrão."""
+        return cls.CACHE_TTL_BY_RESOURCE.get(resource_type, cls.CACHE_TTL)
+
     @classmethod
     def is_production(cls) -> bool:
         """Verifica se está em ambiente de produção."""
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class ICache(ABC):
@@ -29,3 +29,34 @@ class ICache(ABC):
     async def exists(self, key: str) -> bool:
         """Verifica se uma chave existe no cache."""
         pass
+
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Obtém vários valores do cache, na ordem das chaves."""
+        return [await self.get(key) for key in keys]
+
+    async def get_many_with_ttl(
+        self, keys: List[str]
+    ) -> List[Tuple[Optional[Any], Optional[float]]]:
+        """Obtém vários valores com os segundos de vida que restam a cada um.
+
+        O TTL restante é None quando o cache não sabe informá-lo.
+        """
+        return [(value, None) for value in await self.get_many(keys)]
+
+    async def set_many(self, items: Dict[str, Any], ttl: int) -> None:
+        """Define vários valores no cache com o mesmo TTL."""
+        for key, value in items.items():
+            await self.set(key, value, ttl)
+
+    async def delete_many(self, keys: List[str]) -> None:
+        """Deleta vários valores do cache."""
+        for key in keys:
+            await self.delete(key)
+
+    async def start(self) -> None:
+        """Inicia tarefas de fundo do cache, se houver."""
+        pass
+
+    async def stop(self) -> None:
+        """Encerra tarefas de fundo e libera recursos do cache."""
+        pass
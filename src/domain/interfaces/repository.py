@@ -12,6 +12,11 @@ class IRepository(ABC, Generic[T]):
         """Obtém um recurso pelo ID."""
         pass
 
+    @abstractmethod
+    async def get_many(self, resource_ids: List[str]) -> List[T]:
+        """Obtém vários recursos pelos IDs, preservando a ordem."""
+        pass
+
     @abstractmethod
     async def get_all(
         self,
@@ -1,7 +1,10 @@
 import logging
 from src.domain.interfaces.cache import ICache
+from src.infrastructure.cache.codec import CacheCodec
+from src.infrastructure.cache.disk_cache import DiskCache
 from src.infrastructure.cache.memory_cache import MemoryCache
 from src.infrastructure.cache.redis_cache import RedisCache
+from src.infrastructure.cache.tiered_cache import RedisInvalidationBus, TieredCache
 from src.config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -12,10 +15,66 @@ class CacheFactory:
 
     @staticmethod
     def create_cache() -> ICache:
-        """Cria uma instância de cache baseada na configuração."""
+        """Cria uma instância de cache baseada na configuração.
+
+        Com Redis configurado, retorna um cache em dois níveis: memória local
+        com TTL curto na frente do Redis, com invalidação entre workers. Sem
+        Redis e com CACHE_DISK_PATH, a memória fica na frente de um cache
+        persistente em disco, que sobrevive a reinícios.
+        """
+        codec = CacheCodec(
+            serializer=settings.CACHE_CODEC,
+            compression=settings.CACHE_COMPRESSION,
+            compress_threshold=settings.CACHE_COMPRESS_THRESHOLD,
+        )
         if settings.REDIS_URL:
-            logger.info("Usando Redis como cache")
-            return RedisCache(settings.REDIS_URL)
+            logger.info("Usando Redis como cache, com L1 em memória")
+            redis_cache = RedisCache(
+                settings.REDIS_URL,
+                codec=codec,
+                namespace=settings.CACHE_NAMESPACE,
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+                fallback=MemoryCache(
+                    max_entries=settings.CACHE_MAX_ENTRIES,
+                    max_bytes=settings.CACHE_MAX_BYTES,
+                    policy=settings.CACHE_EVICTION_POLICY,
+                    sweep_interval=settings.CACHE_SWEEP_INTERVAL,
+                ),
+            )
+            local_cache = MemoryCache(
+                max_entries=settings.CACHE_L1_MAX_ENTRIES,
+                max_bytes=settings.CACHE_MAX_BYTES,
+                policy=settings.CACHE_EVICTION_POLICY,
+                sweep_interval=settings.CACHE_SWEEP_INTERVAL,
+            )
+            return TieredCache(
+                l1=local_cache,
+                l2=redis_cache,
+                bus=RedisInvalidationBus(redis_cache, settings.CACHE_INVALIDATION_CHANNEL),
+                l1_ttl=settings.CACHE_L1_TTL,
+            )
+        elif settings.CACHE_DISK_PATH:
+            logger.info(f"Usando cache em disco em {settings.CACHE_DISK_PATH}, com L1 em memória")
+            disk_cache = DiskCache(
+                settings.CACHE_DISK_PATH,
+                max_bytes=settings.CACHE_DISK_MAX_BYTES,
+                codec=codec,
+                compact_interval=settings.CACHE_DISK_COMPACT_INTERVAL,
+            )
+            local_cache = MemoryCache(
+                max_entries=settings.CACHE_L1_MAX_ENTRIES,
+                max_bytes=settings.CACHE_MAX_BYTES,
+                policy=settings.CACHE_EVICTION_POLICY,
+                sweep_interval=settings.CACHE_SWEEP_INTERVAL,
+            )
+            return TieredCache(l1=local_cache, l2=disk_cache, l1_ttl=settings.CACHE_L1_TTL)
         else:
             logger.info("Usando cache em memória")
-            return MemoryCache()
+            return MemoryCache(
+                max_entries=settings.CACHE_MAX_ENTRIES,
+                max_bytes=settings.CACHE_MAX_BYTES,
+                policy=settings.CACHE_EVICTION_POLICY,
+                sweep_interval=settings.CACHE_SWEEP_INTERVAL,
+            )
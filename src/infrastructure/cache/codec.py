@@ -0,0 +1,228 @@
+import json
+import logging
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+from src.config.exceptions import CacheError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depende do ambiente
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - depende do ambiente
+    msgpack = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - depende do ambiente
+    lz4_frame = None
+
+logger = logging.getLogger(__name__)
+
+# Primeiro byte dos valores gravados pelo codec. Valores antigos, em JSON
+# puro, começam com um caractere imprimível e são lidos como JSON.
+FORMAT_VERSION = 1
+
+JSON_FORMAT = 0
+MSGPACK_FORMAT = 1
+
+NO_COMPRESSION = 0
+ZLIB_COMPRESSION = 1
+LZ4_COMPRESSION = 2
+
+
+class Serializer(ABC):
+    """Converte valores em bytes e vice-versa."""
+
+    name = ""
+    format_id = JSON_FORMAT
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """Serializa um valor."""
+        pass
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """Desserializa bytes produzidos por dumps."""
+        pass
+
+
+class JsonSerializer(Serializer):
+    """JSON da biblioteca padrão."""
+
+    name = "json"
+    format_id = JSON_FORMAT
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonSerializer(Serializer):
+    """JSON com orjson; gera o mesmo formato que JsonSerializer."""
+
+    name = "orjson"
+    format_id = JSON_FORMAT
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgpackSerializer(Serializer):
+    """MessagePack binário."""
+
+    name = "msgpack"
+    format_id = MSGPACK_FORMAT
+
+    def dumps(self, value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True)
+
+    def loads(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, raw=False)
+
+
+class Compressor(ABC):
+    """Comprime e descomprime bytes."""
+
+    name = ""
+    compression_id = NO_COMPRESSION
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Comprime os bytes."""
+        pass
+
+    @abstractmethod
+    def decompress(self, data: bytes) -> bytes:
+        """Descomprime bytes produzidos por compress."""
+        pass
+
+
+class ZlibCompressor(Compressor):
+    name = "zlib"
+    compression_id = ZLIB_COMPRESSION
+
+    def __init__(self, level: int = 6):
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, self.level)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+
+class Lz4Compressor(Compressor):
+    name = "lz4"
+    compression_id = LZ4_COMPRESSION
+
+    def compress(self, data: bytes) -> bytes:
+        return lz4_frame.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return lz4_frame.decompress(data)
+
+
+def available_serializers() -> Dict[str, Serializer]:
+    """Retorna os serializadores cujas dependências estão instaladas."""
+    serializers: Dict[str, Serializer] = {"json": JsonSerializer()}
+    if orjson is not None:
+        serializers["orjson"] = OrjsonSerializer()
+    if msgpack is not None:
+        serializers["msgpack"] = MsgpackSerializer()
+    return serializers
+
+
+def available_compressors() -> Dict[str, Compressor]:
+    """Retorna os compressores cujas dependências estão instaladas."""
+    compressors: Dict[str, Compressor] = {"zlib": ZlibCompressor()}
+    if lz4_frame is not None:
+        compressors["lz4"] = Lz4Compressor()
+    return compressors
+
+
+class CacheCodec:
+    """Codifica valores do cache com cabeçalho de formato e compressão opcional.
+
+    Cada valor gravado começa com três bytes: versão do formato, serializador
+    e compressão. Assim, trocar o codec não invalida entradas existentes, e
+    valores antigos sem cabeçalho continuam sendo lidos como JSON. Só
+    payloads a partir de compress_threshold bytes são comprimidos, e apenas
+    quando a compressão de fato reduz o tamanho.
+    """
+
+    def __init__(
+        self,
+        serializer: str = "auto",
+        compression: Optional[str] = "zlib",
+        compress_threshold: int = 1024,
+    ):
+        serializers = available_serializers()
+        compressors = available_compressors()
+
+        if serializer == "auto":
+            serializer = "orjson" if "orjson" in serializers else "json"
+        if serializer not in serializers:
+            logger.warning(f"Serializador indisponível: {serializer}; usando json")
+            serializer = "json"
+        self.serializer = serializers[serializer]
+
+        self.compressor: Optional[Compressor] = None
+        if compression and compression != "none":
+            self.compressor = compressors.get(compression)
+            if self.compressor is None:
+                logger.warning(f"Compressão indisponível: {compression}; usando zlib")
+                self.compressor = compressors["zlib"]
+        self.compress_threshold = compress_threshold
+
+        # Na leitura, JSON usa a implementação mais rápida disponível
+        json_reader = serializers.get("orjson", serializers["json"])
+        self._readers: Dict[int, Serializer] = {JSON_FORMAT: json_reader}
+        if "msgpack" in serializers:
+            self._readers[MSGPACK_FORMAT] = serializers["msgpack"]
+        self._decompressors: Dict[int, Compressor] = {
+            compressor.compression_id: compressor for compressor in compressors.values()
+        }
+
+    def encode(self, value: Any) -> bytes:
+        """Codifica um valor para gravação no Redis."""
+        payload = self.serializer.dumps(value)
+        compression_id = NO_COMPRESSION
+
+        if self.compressor is not None and len(payload) >= self.compress_threshold:
+            compressed = self.compressor.compress(payload)
+            if len(compressed) < len(payload):
+                payload = compressed
+                compression_id = self.compressor.compression_id
+
+        return bytes((FORMAT_VERSION, self.serializer.format_id, compression_id)) + payload
+
+    def decode(self, data: bytes) -> Any:
+        """Decodifica um valor lido do Redis."""
+        if isinstance(data, str):
+            data = data.encode()
+        if not data or data[0] != FORMAT_VERSION:
+            return self._readers[JSON_FORMAT].loads(data)
+
+        format_id, compression_id, payload = data[1], data[2], data[3:]
+
+        if compression_id != NO_COMPRESSION:
+            decompressor = self._decompressors.get(compression_id)
+            if decompressor is None:
+                raise CacheError(f"Compressão {compression_id} não suportada neste ambiente")
+            payload = decompressor.decompress(payload)
+
+        reader = self._readers.get(format_id)
+        if reader is None:
+            raise CacheError(f"Formato {format_id} não suportado neste ambiente")
+        return reader.loads(payload)
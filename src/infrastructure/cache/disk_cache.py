@@ -0,0 +1,348 @@
+import asyncio
+import logging
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from src.config.exceptions import CacheError
+from src.domain.interfaces.cache import ICache
+from src.infrastructure.cache.codec import CacheCodec
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+"""
+
+# Limite de parâmetros por consulta "IN (...)"
+BATCH_SIZE = 500
+
+# Ao estourar max_bytes, o despejo desce até esta fração do limite
+LOW_WATERMARK = 0.9
+
+
+class DiskCache(ICache):
+    """Implementação de cache persistente em SQLite (modo WAL).
+
+    As entradas sobrevivem a reinícios do processo: uma instância nova
+    reaproveita os valores ainda válidos gravados pela anterior. Os prazos
+    são instantes de time.time(), e não de time.monotonic(), justamente por
+    precisarem valer entre execuções.
+
+    O tamanho do arquivo é limitado por max_bytes (soma dos valores
+    codificados); ao estourar, as entradas acessadas há mais tempo são
+    removidas. compact(), executado na inicialização e a cada
+    compact_interval segundos, apaga as expiradas e devolve o espaço ao
+    sistema de arquivos.
+
+    O SQLite é síncrono, então todas as operações rodam numa única thread
+    dedicada, que também serializa o acesso à conexão.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 256 * 1024 * 1024,
+        codec: Optional[CacheCodec] = None,
+        compact_interval: float = 300.0,
+        touch_interval: float = 60.0,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.codec = codec or CacheCodec()
+        self.compact_interval = compact_interval
+        # Leituras só regravam accessed_at se ele tiver mais que isso
+        self.touch_interval = touch_interval
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.rejections = 0
+        self.compactions = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._compactor: Optional[asyncio.Task] = None
+
+    async def _run(self, func: Callable[..., R], *args: Any) -> R:
+        """Executa uma operação síncrona na thread do SQLite."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="disk-cache")
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._executor, func, *args)
+        except sqlite3.Error as e:
+            logger.error(f"Erro no cache em disco {self.path}: {str(e)}")
+            raise CacheError(f"Erro no cache em disco: {str(e)}")
+
+    def _connection(self) -> sqlite3.Connection:
+        """Abre o banco na primeira operação, criando o esquema se necessário."""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            conn = sqlite3.connect(self.path, isolation_level=None)
+            # auto_vacuum só tem efeito se definido antes de criar as tabelas
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.executescript(SCHEMA)
+            row = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+            self.total_bytes = row[0]
+            self._conn = conn
+            logger.info(f"Cache em disco aberto: {self.path} ({self.total_bytes} bytes)")
+        return self._conn
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Obtém um valor do cache."""
+        return (await self.get_many([key]))[0]
+
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Obtém vários valores com uma consulta por lote de chaves."""
+        if not keys:
+            return []
+        return [value for value, _ in await self.get_many_with_ttl(keys)]
+
+    async def get_many_with_ttl(
+        self, keys: List[str]
+    ) -> List[Tuple[Optional[Any], Optional[float]]]:
+        """Obtém vários valores com os segundos de vida que restam a cada um."""
+        if not keys:
+            return []
+        try:
+            found = await self._run(self._get_many, keys)
+        except CacheError:
+            return [(None, None)] * len(keys)
+        now = time.time()
+        return [
+            (found[key][0], found[key][1] - now) if key in found else (None, None) for key in keys
+        ]
+
+    def _get_many(self, keys: List[str]) -> Dict[str, Tuple[Any, float]]:
+        conn = self._connection()
+        now = time.time()
+        found: Dict[str, Tuple[Any, float]] = {}
+        expired: List[str] = []
+        touched: List[str] = []
+
+        unique_keys = list(dict.fromkeys(keys))
+        for start in range(0, len(unique_keys), BATCH_SIZE):
+            batch = unique_keys[start : start + BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows = conn.execute(
+                "SELECT key, value, expires_at, accessed_at FROM entries "
+                f"WHERE key IN ({placeholders})",
+                batch,
+            ).fetchall()
+            for key, value, expires_at, accessed_at in rows:
+                if expires_at <= now:
+                    expired.append(key)
+                    continue
+                try:
+                    found[key] = (self.codec.decode(value), expires_at)
+                except Exception as e:
+                    logger.error(f"Erro ao decodificar chave {key} do cache em disco: {str(e)}")
+                    expired.append(key)
+                    continue
+                if accessed_at < now - self.touch_interval:
+                    touched.append(key)
+
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        if expired:
+            self.expirations += len(expired)
+            self._delete(conn, expired)
+        if touched:
+            conn.executemany(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?", [(now, key) for key in touched]
+            )
+        return found
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        """Define um valor no cache com TTL."""
+        await self.set_many({key: value}, ttl)
+
+    async def set_many(self, items: Dict[str, Any], ttl: int) -> None:
+        """Define vários valores numa única transação."""
+        if not items:
+            return
+        # A codificação também roda fora do event loop
+        await self._run(self._set_many, items, ttl)
+        logger.debug(f"Cache set: {len(items)} chaves (TTL: {ttl}s)")
+
+    def _set_many(self, items: Dict[str, Any], ttl: int) -> None:
+        conn = self._connection()
+        now = time.time()
+        conn.execute("BEGIN")
+        try:
+            for key, value in items.items():
+                data = self.codec.encode(value)
+                if len(data) > self.max_bytes:
+                    self.rejections += 1
+                    continue
+                previous = conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, size, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, data, len(data), now + ttl, now),
+                )
+                self.total_bytes += len(data) - (previous[0] if previous else 0)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+        if self.total_bytes > self.max_bytes:
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Remove expiradas e, se preciso, as menos acessadas até LOW_WATERMARK."""
+        self._purge_expired(conn)
+        target = int(self.max_bytes * LOW_WATERMARK)
+        while self.total_bytes > target:
+            rows = conn.execute(
+                "SELECT key, size FROM entries ORDER BY accessed_at LIMIT ?", (BATCH_SIZE,)
+            ).fetchall()
+            if not rows:
+                self.total_bytes = 0
+                break
+
+            victims: List[str] = []
+            freed = 0
+            for key, size in rows:
+                if self.total_bytes - freed <= target:
+                    break
+                victims.append(key)
+                freed += size
+            self._delete(conn, victims)
+            self.evictions += len(victims)
+
+    def _purge_expired(self, conn: sqlite3.Connection) -> None:
+        now = time.time()
+        freed, count = conn.execute(
+            "SELECT COALESCE(SUM(size), 0), COUNT(*) FROM entries WHERE expires_at <= ?", (now,)
+        ).fetchone()
+        if count:
+            conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+            self.total_bytes -= freed
+            self.expirations += count
+
+    def _delete(self, conn: sqlite3.Connection, keys: List[str]) -> None:
+        for start in range(0, len(keys), BATCH_SIZE):
+            batch = keys[start : start + BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            freed = conn.execute(
+                f"SELECT COALESCE(SUM(size), 0) FROM entries WHERE key IN ({placeholders})", batch
+            ).fetchone()[0]
+            conn.execute(f"DELETE FROM entries WHERE key IN ({placeholders})", batch)
+            self.total_bytes -= freed
+
+    async def delete(self, key: str) -> None:
+        """Deleta um valor do cache."""
+        await self.delete_many([key])
+
+    async def delete_many(self, keys: List[str]) -> None:
+        """Deleta vários valores do cache."""
+        if keys:
+            await self._run(lambda: self._delete(self._connection(), list(keys)))
+
+    async def clear(self) -> None:
+        """Limpa todo o cache."""
+        await self._run(self._clear)
+        logger.debug("Cache cleared")
+
+    def _clear(self) -> None:
+        self._connection().execute("DELETE FROM entries")
+        self.total_bytes = 0
+
+    async def exists(self, key: str) -> bool:
+        """Verifica se uma chave existe no cache."""
+        try:
+            return await self._run(self._exists, key)
+        except CacheError:
+            return False
+
+    def _exists(self, key: str) -> bool:
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT 1 FROM entries WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        return row is not None
+
+    async def compact(self) -> None:
+        """Apaga entradas expiradas e devolve o espaço livre ao disco."""
+        await self._run(self._compact)
+
+    def _compact(self) -> None:
+        conn = self._connection()
+        self._purge_expired(conn)
+        # Corrige desvios causados por outros processos usando o mesmo arquivo
+        self.total_bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if self.total_bytes > self.max_bytes:
+            self._evict(conn)
+        conn.execute("PRAGMA incremental_vacuum")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self.compactions += 1
+        logger.debug(f"Cache em disco compactado: {self.total_bytes} bytes")
+
+    async def start(self) -> None:
+        """Abre o banco, compacta-o e inicia a compactação periódica."""
+        await self.compact()
+        if self._compactor is None and self.compact_interval > 0:
+            self._compactor = asyncio.create_task(self._compact_periodically())
+
+    async def stop(self) -> None:
+        """Encerra a compactação periódica e fecha o banco."""
+        compactor, self._compactor = self._compactor, None
+        if compactor is not None:
+            compactor.cancel()
+            try:
+                await compactor
+            except asyncio.CancelledError:
+                pass
+
+        if self._executor is not None:
+            await self._run(self._close)
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    async def _compact_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.compact_interval)
+            try:
+                await self.compact()
+            except CacheError:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna os contadores de uso e a ocupação do arquivo."""
+        return {
+            "path": self.path,
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "expirations": self.expirations,
+            "evictions": self.evictions,
+            "rejections": self.rejections,
+            "compactions": self.compactions,
+        }
@@ -0,0 +1,226 @@
+import logging
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class EvictionPolicy(ABC):
+    """Política de despejo do cache em memória.
+
+    O cache informa cada leitura, inserção e remoção; quando precisa de
+    espaço, pede uma vítima e pergunta se o novo item deve ser admitido no
+    lugar dela.
+    """
+
+    @abstractmethod
+    def on_get(self, key: str, hit: bool) -> None:
+        """Registra uma leitura da chave."""
+        pass
+
+    @abstractmethod
+    def on_insert(self, key: str) -> None:
+        """Registra a inserção de uma nova chave."""
+        pass
+
+    @abstractmethod
+    def on_update(self, key: str) -> None:
+        """Registra a regravação de uma chave existente."""
+        pass
+
+    @abstractmethod
+    def on_remove(self, key: str) -> None:
+        """Registra a remoção de uma chave."""
+        pass
+
+    @abstractmethod
+    def victim(self) -> Optional[str]:
+        """Retorna a próxima chave a ser despejada."""
+        pass
+
+    def admit(self, candidate: str, victim: str) -> bool:
+        """Decide se o candidato entra no cache no lugar da vítima."""
+        return True
+
+    def clear(self) -> None:
+        """Descarta o estado da política."""
+        pass
+
+
+class LRUPolicy(EvictionPolicy):
+    """Despeja a chave usada há mais tempo."""
+
+    def __init__(self):
+        self._order: "OrderedDict[str, None]" = OrderedDict()
+
+    def on_get(self, key: str, hit: bool) -> None:
+        if hit:
+            self._order.move_to_end(key)
+
+    def on_insert(self, key: str) -> None:
+        self._order[key] = None
+
+    def on_update(self, key: str) -> None:
+        self._order.move_to_end(key)
+
+    def on_remove(self, key: str) -> None:
+        self._order.pop(key, None)
+
+    def victim(self) -> Optional[str]:
+        return next(iter(self._order), None)
+
+    def clear(self) -> None:
+        self._order.clear()
+
+
+class LFUPolicy(EvictionPolicy):
+    """Despeja a chave menos acessada; empates saem pela ordem de uso.
+
+    Mantém um bucket por frequência, então todas as operações são O(1).
+    """
+
+    def __init__(self):
+        self._frequencies: Dict[str, int] = {}
+        self._buckets: Dict[int, "OrderedDict[str, None]"] = {}
+        self._min_frequency = 0
+
+    def _increment(self, key: str) -> None:
+        frequency = self._frequencies[key]
+        bucket = self._buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[frequency]
+            if self._min_frequency == frequency:
+                self._min_frequency = frequency + 1
+        self._frequencies[key] = frequency + 1
+        self._buckets.setdefault(frequency + 1, OrderedDict())[key] = None
+
+    def on_get(self, key: str, hit: bool) -> None:
+        if hit:
+            self._increment(key)
+
+    def on_insert(self, key: str) -> None:
+        self._frequencies[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_frequency = 1
+
+    def on_update(self, key: str) -> None:
+        self._increment(key)
+
+    def on_remove(self, key: str) -> None:
+        frequency = self._frequencies.pop(key, None)
+        if frequency is None:
+            return
+        bucket = self._buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[frequency]
+            if self._min_frequency == frequency:
+                self._min_frequency = min(self._buckets, default=0)
+
+    def victim(self) -> Optional[str]:
+        bucket = self._buckets.get(self._min_frequency)
+        return next(iter(bucket), None) if bucket else None
+
+    def clear(self) -> None:
+        self._frequencies.clear()
+        self._buckets.clear()
+        self._min_frequency = 0
+
+
+class FrequencySketch:
+    """Count-Min sketch com contadores saturados em 15 e envelhecimento.
+
+    Estima quantas vezes uma chave foi acessada recentemente usando memória
+    fixa. A cada sample_size incrementos todos os contadores são divididos
+    por dois, para que acessos antigos percam peso.
+    """
+
+    DEPTH = 4
+    MAX_COUNT = 15
+
+    def __init__(self, capacity: int):
+        width = 1
+        while width < max(capacity, 16):
+            width <<= 1
+        self._mask = width - 1
+        self._table = [[0] * width for _ in range(self.DEPTH)]
+        self.sample_size = 10 * max(capacity, 16)
+        self._additions = 0
+
+    def _indexes(self, key: Hashable):
+        for depth in range(self.DEPTH):
+            yield depth, hash((depth, key)) & self._mask
+
+    def increment(self, key: Hashable) -> None:
+        """Incrementa a frequência estimada da chave."""
+        for depth, index in self._indexes(key):
+            row = self._table[depth]
+            if row[index] < self.MAX_COUNT:
+                row[index] += 1
+
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            self._reset()
+
+    def estimate(self, key: Hashable) -> int:
+        """Retorna a frequência estimada da chave."""
+        return min(self._table[depth][index] for depth, index in self._indexes(key))
+
+    def _reset(self) -> None:
+        """Divide todos os contadores por dois."""
+        for row in self._table:
+            for index, count in enumerate(row):
+                row[index] = count >> 1
+        self._additions //= 2
+
+
+class TinyLFUPolicy(LRUPolicy):
+    """LRU com admissão TinyLFU.
+
+    A vítima é escolhida por LRU, mas um item novo só entra quando sua
+    frequência estimada supera a da vítima. Assim, varreduras de chaves
+    acessadas uma única vez não expulsam as chaves populares.
+    """
+
+    def __init__(self, capacity: int = 10000):
+        super().__init__()
+        self.sketch = FrequencySketch(capacity)
+
+    def on_get(self, key: str, hit: bool) -> None:
+        self.sketch.increment(key)
+        super().on_get(key, hit)
+
+    def on_insert(self, key: str) -> None:
+        self.sketch.increment(key)
+        super().on_insert(key)
+
+    def on_update(self, key: str) -> None:
+        self.sketch.increment(key)
+        super().on_update(key)
+
+    def admit(self, candidate: str, victim: str) -> bool:
+        return self.sketch.estimate(candidate) > self.sketch.estimate(victim)
+
+    def clear(self) -> None:
+        super().clear()
+        self.sketch = FrequencySketch(self.sketch.sample_size // 10)
+
+
+EVICTION_POLICIES = {
+    "lru": LRUPolicy,
+    "lfu": LFUPolicy,
+    "tinylfu": TinyLFUPolicy,
+}
+
+
+def create_eviction_policy(name: str, capacity: int = 10000) -> EvictionPolicy:
+    """Cria a política de despejo pelo nome, usando LRU para nomes desconhecidos."""
+    policy_class = EVICTION_POLICIES.get(str(name).lower())
+    if policy_class is None:
+        logger.warning(f"Política de despejo desconhecida: {name}; usando LRU")
+        policy_class = LRUPolicy
+    if policy_class is TinyLFUPolicy:
+        return TinyLFUPolicy(capacity)
+    return policy_class()
@@ -0,0 +1,173 @@
+import hashlib
+import json
+import logging
+import re
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.domain.interfaces.cache import ICache
+
+logger = logging.getLogger(__name__)
+
+SIMPLE_PART = re.compile(r"^[A-Za-z0-9_.-]{1,64}$")
+
+# Gerações vivem bem mais que os dados que elas versionam
+GENERATION_TTL = 30 * 24 * 3600
+
+GENERATION_SUFFIX = ":generation"
+REVISION_SUFFIX = ":revision"
+TAG_SEGMENT = ":tag:"
+
+
+def canonical_part(value: Any) -> str:
+    """Representa um componente da chave de forma estável.
+
+    Valores simples (IDs, nomes) ficam legíveis; estruturas como filtros
+    são serializadas com chaves ordenadas e resumidas por hash, então a
+    ordem de inserção de um dict não muda a chave.
+    """
+    if isinstance(value, (str, int)) and not isinstance(value, bool):
+        text = str(value)
+        if SIMPLE_PART.match(text):
+            return text
+    else:
+        text = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def is_generation_key(key: str) -> bool:
+    """Indica se a chave guarda a geração ou a revisão de um recurso.
+
+    As duas são contadores que nunca devem retroceder.
+    """
+    return key.endswith((GENERATION_SUFFIX, REVISION_SUFFIX))
+
+
+def is_tag_key(key: str) -> bool:
+    """Indica se a chave guarda as chaves associadas a uma tag."""
+    return TAG_SEGMENT in key
+
+
+class CacheKeyspace:
+    """Gera chaves de cache com namespace, versão de esquema e geração por recurso.
+
+    Formato: "<namespace>:v<esquema>:<recurso>:g<geração>:<tipo>:<partes>".
+    Incrementar a geração de um recurso invalida, em O(1), todas as chaves
+    dele: as antigas deixam de ser lidas e expiram sozinhas. Tags associam
+    chaves a uma entidade, para removê-las juntas.
+
+    Sem um cache, a geração é sempre 0 e as tags ficam desativadas.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[ICache] = None,
+        namespace: str = "starwars-api",
+        schema_version: int = 1,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.cache = cache
+        self.clock = clock
+        self.namespace = namespace
+        self.schema_version = schema_version
+        self.prefix = f"{namespace}:v{schema_version}"
+
+    def key(self, resource: str, kind: str, *parts: Any, generation: int = 0) -> str:
+        """Monta a chave canônica de um valor derivado de um recurso."""
+        suffix = ":".join(canonical_part(part) for part in parts)
+        key = f"{self.prefix}:{resource}:g{generation}:{kind}"
+        return f"{key}:{suffix}" if suffix else key
+
+    def _generation_key(self, resource: str) -> str:
+        return f"{self.prefix}:{resource}{GENERATION_SUFFIX}"
+
+    def _revision_key(self, resource: str) -> str:
+        return f"{self.prefix}:{resource}{REVISION_SUFFIX}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}{TAG_SEGMENT}{canonical_part(tag)}"
+
+    async def get_generation(self, resource: str) -> int:
+        """Obtém a geração atual do recurso, criando-a se necessário.
+
+        Uma geração nova começa no instante atual em milissegundos, e não em
+        zero, para que a perda da chave de geração não faça chaves antigas
+        voltarem a ser lidas.
+        """
+        if self.cache is None:
+            return 0
+
+        generation = await self.cache.get(self._generation_key(resource))
+        if isinstance(generation, int):
+            return generation
+
+        generation = int(self.clock() * 1000)
+        await self.cache.set(self._generation_key(resource), generation, GENERATION_TTL)
+        return generation
+
+    async def get_version(self, resource: str) -> Tuple[int, int]:
+        """Obtém, em uma única leitura, a geração e a revisão do recurso.
+
+        A revisão avança a cada invalidação de uma entidade (touch). Cópias
+        locais dos dados de um recurso só valem enquanto o par não muda.
+        """
+        if self.cache is None:
+            return 0, 0
+
+        generation, revision = await self.cache.get_many(
+            [self._generation_key(resource), self._revision_key(resource)]
+        )
+        if not isinstance(generation, int):
+            generation = await self.get_generation(resource)
+        return generation, revision if isinstance(revision, int) else 0
+
+    async def touch(self, resource: str) -> int:
+        """Avança a revisão do recurso sem mudar a geração das chaves.
+
+        Como a geração, a revisão parte do instante atual em milissegundos
+        para não repetir um valor já visto se a chave se perder.
+        """
+        if self.cache is None:
+            return 0
+
+        current = await self.cache.get(self._revision_key(resource))
+        revision = int(self.clock() * 1000)
+        if isinstance(current, int):
+            revision = max(revision, current + 1)
+        await self.cache.set(self._revision_key(resource), revision, GENERATION_TTL)
+        return revision
+
+    async def bump(self, resource: str) -> int:
+        """Invalida todas as chaves do recurso passando para a próxima geração."""
+        if self.cache is None:
+            return 0
+
+        generation = await self.get_generation(resource) + 1
+        await self.cache.set(self._generation_key(resource), generation, GENERATION_TTL)
+        logger.info(f"Cache de {resource} invalidado (geração {generation})")
+        return generation
+
+    async def tag(self, keys_by_tag: Dict[str, Iterable[str]], ttl: int) -> None:
+        """Associa chaves a tags, acumulando com as já registradas."""
+        if self.cache is None or not keys_by_tag:
+            return
+
+        tag_keys = [self._tag_key(tag) for tag in keys_by_tag]
+        current = await self.cache.get_many(tag_keys)
+        updated: Dict[str, List[str]] = {}
+        for tag_key, existing, keys in zip(tag_keys, current, keys_by_tag.values()):
+            merged = dict.fromkeys(existing or [])
+            merged.update(dict.fromkeys(keys))
+            updated[tag_key] = list(merged)
+        await self.cache.set_many(updated, ttl)
+
+    async def invalidate_tag(self, tag: str) -> int:
+        """Remove todas as chaves associadas à tag; retorna quantas eram."""
+        if self.cache is None:
+            return 0
+
+        tag_key = self._tag_key(tag)
+        keys = await self.cache.get(tag_key) or []
+        await self.cache.delete_many([*keys, tag_key])
+        logger.debug(f"Tag {tag} invalidada: {len(keys)} chaves")
+        return len(keys)
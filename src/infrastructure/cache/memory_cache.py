@@ -1,61 +1,280 @@
 import asyncio
+import heapq
 import logging
-from typing import Any, Optional
-from datetime import datetime, timedelta
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
 from src.domain.interfaces.cache import ICache
+from src.infrastructure.cache.eviction import EvictionPolicy, create_eviction_policy
 
 logger = logging.getLogger(__name__)
 
 
+def estimate_size(value: Any) -> int:
+    """Estima, em bytes, a memória ocupada por um valor e seus filhos."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item) for item in value)
+    return size
+
+
 class MemoryCache(ICache):
-    """Implementação de cache em memória."""
+    """Implementação de cache em memória.
+
+    O cache é limitado por número de entradas (max_entries) e por uma
+    estimativa do tamanho dos valores (max_bytes). Ao atingir um dos
+    limites, a política de despejo escolhe quem sai; com TinyLFU, um item
+    novo pode ser recusado se for menos frequente que a vítima.
+
+    Nenhuma operação aguarda (await) no meio de uma atualização, então cada
+    uma executa de forma atômica no event loop e dispensa locks: leituras
+    concorrentes não ficam enfileiradas. Expirações usam prazos de
+    time.monotonic(), imunes a ajustes do relógio do sistema.
+
+    Os prazos também ficam num min-heap; uma tarefa de fundo, iniciada por
+    start(), remove a cada sweep_interval segundos apenas as chaves já
+    expiradas, mesmo que nunca mais sejam lidas.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        policy: Union[str, EvictionPolicy] = "lru",
+        sweep_interval: float = 5.0,
+    ):
+        self.cache: dict[str, tuple[Any, float]] = {}
+        self.sizes: Dict[str, int] = {}
+        self.deadlines: List[Tuple[float, str]] = []
+        self.sweep_interval = sweep_interval
+        self._sweeper: Optional[asyncio.Task] = None
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.policy = (
+            create_eviction_policy(policy, max_entries or 10000)
+            if isinstance(policy, str)
+            else policy
+        )
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.rejections = 0
+
+    def _remove(self, key: str) -> None:
+        """Remove uma chave e atualiza os contadores de memória."""
+        del self.cache[key]
+        self.total_bytes -= self.sizes.pop(key, 0)
+        self.policy.on_remove(key)
+
+    def _is_full(self, incoming_bytes: int) -> bool:
+        """Verifica se uma nova entrada excederia algum dos limites."""
+        if self.max_entries is not None and len(self.cache) >= self.max_entries:
+            return True
+        if self.max_bytes is not None and self.total_bytes + incoming_bytes > self.max_bytes:
+            return True
+        return False
+
+    def _make_room(self, key: str, size: int) -> bool:
+        """Despeja entradas até caber a nova; retorna False se ela for recusada."""
+        if self.max_bytes is not None and size > self.max_bytes:
+            return False
 
-    def __init__(self):
-        self.cache: dict[str, tuple[Any, datetime]] = {}
-        self.lock = asyncio.Lock()
+        while self.cache and self._is_full(size):
+            victim = self.policy.victim()
+            if victim is None:
+                break
+            if not self.policy.admit(key, victim):
+                return False
+            self._remove(victim)
+            self.evictions += 1
+
+        return True
 
     async def get(self, key: str) -> Optional[Any]:
         """Obtém um valor do cache."""
-        async with self.lock:
-            if key not in self.cache:
-                return None
+        return self._get(key)
+
+    def _get(self, key: str) -> Optional[Any]:
+        """Lê uma chave, removendo-a se já expirou."""
+        entry = self.cache.get(key)
+        if entry is not None:
+            value, deadline = entry
+            if time.monotonic() < deadline:
+                self.hits += 1
+                self.policy.on_get(key, True)
+                return value
 
-            value, expiration = self.cache[key]
-            if datetime.now() > expiration:
-                del self.cache[key]
-                return None
+            self._remove(key)
+            self.expirations += 1
 
-            return value
+        self.misses += 1
+        self.policy.on_get(key, False)
+        return None
+
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Obtém vários valores do cache, na ordem das chaves."""
+        return [self._get(key) for key in keys]
+
+    async def get_many_with_ttl(
+        self, keys: List[str]
+    ) -> List[Tuple[Optional[Any], Optional[float]]]:
+        """Obtém vários valores com os segundos de vida que restam a cada um."""
+        results: List[Tuple[Optional[Any], Optional[float]]] = []
+        for key in keys:
+            value = self._get(key)
+            remaining = None if value is None else self.cache[key][1] - time.monotonic()
+            results.append((value, remaining))
+        return results
 
     async def set(self, key: str, value: Any, ttl: int) -> None:
         """Define um valor no cache com TTL."""
-        async with self.lock:
-            expiration = datetime.now() + timedelta(seconds=ttl)
-            self.cache[key] = (value, expiration)
+        self._set(key, value, ttl)
+
+    async def set_many(self, items: Dict[str, Any], ttl: int) -> None:
+        """Define vários valores no cache com o mesmo TTL."""
+        for key, value in items.items():
+            self._set(key, value, ttl)
+
+    def _set(self, key: str, value: Any, ttl: int) -> None:
+        """Grava uma chave, despejando outras se necessário."""
+        deadline = time.monotonic() + ttl
+        size = estimate_size(value)
+
+        if key in self.cache:
+            self.total_bytes += size - self.sizes[key]
+            self.cache[key] = (value, deadline)
+            self.sizes[key] = size
+            self.policy.on_update(key)
+            self._schedule(key, deadline)
+            # Uma regravação maior pode estourar o limite de bytes
+            while self.max_bytes is not None and self.total_bytes > self.max_bytes:
+                victim = self.policy.victim()
+                if victim is None:
+                    break
+                self._remove(victim)
+                self.evictions += 1
             logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
+            return
+
+        if not self._make_room(key, size):
+            self.rejections += 1
+            logger.debug(f"Cache set recusado: {key}")
+            return
+
+        self.cache[key] = (value, deadline)
+        self.sizes[key] = size
+        self.total_bytes += size
+        self.policy.on_insert(key)
+        self._schedule(key, deadline)
+        logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
 
     async def delete(self, key: str) -> None:
         """Deleta um valor do cache."""
-        async with self.lock:
+        if key in self.cache:
+            self._remove(key)
+            logger.debug(f"Cache deleted: {key}")
+
+    async def delete_many(self, keys: List[str]) -> None:
+        """Deleta vários valores do cache."""
+        for key in keys:
             if key in self.cache:
-                del self.cache[key]
-                logger.debug(f"Cache deleted: {key}")
+                self._remove(key)
 
     async def clear(self) -> None:
         """Limpa todo o cache."""
-        async with self.lock:
-            self.cache.clear()
-            logger.debug("Cache cleared")
+        self.cache.clear()
+        self.sizes.clear()
+        self.deadlines.clear()
+        self.total_bytes = 0
+        self.policy.clear()
+        logger.debug("Cache cleared")
 
     async def exists(self, key: str) -> bool:
         """Verifica se uma chave existe no cache."""
-        async with self.lock:
-            if key not in self.cache:
-                return False
+        entry = self.cache.get(key)
+        if entry is None:
+            return False
 
-            value, expiration = self.cache[key]
-            if datetime.now() > expiration:
-                del self.cache[key]
-                return False
+        if time.monotonic() >= entry[1]:
+            self._remove(key)
+            self.expirations += 1
+            return False
 
-            return True
+        return True
+
+    def _schedule(self, key: str, deadline: float) -> None:
+        """Registra o prazo da chave no heap de expiração."""
+        heapq.heappush(self.deadlines, (deadline, key))
+
+        # Regravações e remoções deixam prazos obsoletos no heap; quando eles
+        # passam a dominar, o heap é reconstruído só com as chaves vivas.
+        if len(self.deadlines) > 2 * len(self.cache) + 64:
+            self.deadlines = [(entry[1], cached_key) for cached_key, entry in self.cache.items()]
+            heapq.heapify(self.deadlines)
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """Remove as chaves expiradas; custa O(expiradas * log n).
+
+        Retorna quantas chaves foram removidas.
+        """
+        now = time.monotonic() if now is None else now
+        expired = 0
+
+        while self.deadlines and self.deadlines[0][0] <= now:
+            deadline, key = heapq.heappop(self.deadlines)
+            entry = self.cache.get(key)
+            # Ignora prazos obsoletos de chaves regravadas ou removidas
+            if entry is not None and entry[1] == deadline:
+                self._remove(key)
+                expired += 1
+
+        self.expirations += expired
+        return expired
+
+    async def start(self) -> None:
+        """Inicia a tarefa de expiração ativa."""
+        if self._sweeper is None and self.sweep_interval > 0:
+            self._sweeper = asyncio.create_task(self._sweep())
+            logger.debug(f"Expiração ativa iniciada (intervalo: {self.sweep_interval}s)")
+
+    async def stop(self) -> None:
+        """Encerra a tarefa de expiração ativa."""
+        sweeper, self._sweeper = self._sweeper, None
+        if sweeper is not None:
+            sweeper.cancel()
+            try:
+                await sweeper
+            except asyncio.CancelledError:
+                pass
+            logger.debug("Expiração ativa encerrada")
+
+    async def _sweep(self) -> None:
+        """Remove periodicamente as chaves expiradas."""
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                expired = self.expire()
+                if expired:
+                    logger.debug(f"Cache: {expired} chaves expiradas removidas")
+            except Exception as e:
+                logger.error(f"Erro na expiração do cache: {str(e)}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna o uso de memória e os contadores do cache."""
+        return {
+            "entries": len(self.cache),
+            "scheduled_deadlines": len(self.deadlines),
+            "bytes": self.total_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "policy": type(self.policy).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "rejections": self.rejections,
+        }
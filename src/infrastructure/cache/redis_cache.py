@@ -1,93 +1,453 @@
+import asyncio
 import redis.asyncio as redis
 import logging
-import json
-from typing import Any, Optional
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
 from src.domain.interfaces.cache import ICache
 from src.config.exceptions import CacheError
+from src.infrastructure.cache.codec import CacheCodec
+from src.infrastructure.cache.keys import is_generation_key, is_tag_key
+from src.infrastructure.cache.memory_cache import MemoryCache
 
 logger = logging.getLogger(__name__)
 
+# Falhas que indicam Redis indisponível, e não um erro da operação
+CONNECTION_ERRORS = (RedisConnectionError, RedisTimeoutError, OSError, asyncio.TimeoutError)
+
 
 class RedisCache(ICache):
-    """Implementação de cache com Redis."""
+    """Implementação de cache com Redis.
+
+    Usa um pool de conexões com tamanho fixo (max_connections). A conexão é
+    aberta em start() ou, na falta dele, na primeira operação. Enquanto o
+    Redis estiver inacessível, as operações usam um cache em memória local
+    (fallback); uma verificação periódica de saúde (PING) detecta quando o
+    Redis volta, e as remoções feitas durante a queda são reaplicadas. Das
+    escritas, só gerações e tags voltam para o Redis (veja _recover); os
+    demais valores gravados no fallback são descartados.
 
-    def __init__(self, redis_url: str):
+    clear() remove apenas as chaves do namespace da aplicação, sem FLUSHDB,
+    preservando outros dados que compartilhem o mesmo banco.
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        codec: Optional[CacheCodec] = None,
+        max_connections: int = 20,
+        socket_timeout: float = 1.0,
+        health_check_interval: float = 5.0,
+        fallback: Optional[ICache] = None,
+        namespace: str = "starwars-api",
+    ):
         self.redis_url = redis_url
+        self.namespace = namespace
+        self.codec = codec or CacheCodec()
+        self.max_connections = max_connections
+        self.socket_timeout = socket_timeout
+        self.health_check_interval = health_check_interval
+        self.fallback = fallback or MemoryCache(max_entries=1000)
+        self.pool: Optional[redis.ConnectionPool] = None
         self.client: Optional[redis.Redis] = None
+        self.last_error: Optional[str] = None
+        self.connection_failures = 0
+        self.recoveries = 0
+        self.fallback_operations = 0
+        self._down = False
+        self._last_attempt = 0.0
+        self._pending_deletes: set = set()
+        self._pending_writes: Dict[str, int] = {}
+        self._pending_clear = False
+        self._probe_lock = asyncio.Lock()
+        self._health_task: Optional[asyncio.Task] = None
+
+    @property
+    def available(self) -> bool:
+        """Indica se as operações estão indo para o Redis."""
+        return self.client is not None and not self._down
 
     async def connect(self) -> None:
         """Conecta ao Redis."""
-        try:
-            self.client = await redis.from_url(self.redis_url)
-            await self.client.ping()
-            logger.info("Conectado ao Redis com sucesso")
-        except Exception as e:
-            logger.error(f"Erro ao conectar ao Redis: {str(e)}")
-            raise CacheError(f"Erro ao conectar ao Redis: {str(e)}")
+        if not await self._probe():
+            raise CacheError(f"Erro ao conectar ao Redis: {self.last_error}")
 
     async def disconnect(self) -> None:
         """Desconecta do Redis."""
         if self.client:
             await self.client.close()
+            self.client = None
+            if self.pool is not None:
+                await self.pool.disconnect()
+                self.pool = None
             logger.info("Desconectado do Redis")
 
+    async def start(self) -> None:
+        """Conecta ao Redis e inicia a verificação periódica de saúde.
+
+        Se o Redis estiver fora do ar, a aplicação sobe mesmo assim usando o
+        cache local.
+        """
+        await self.fallback.start()
+        if not await self._probe():
+            logger.warning("Redis indisponível na inicialização; usando cache em memória")
+        if self._health_task is None and self.health_check_interval > 0:
+            self._health_task = asyncio.create_task(self._health_check())
+
+    async def stop(self) -> None:
+        """Encerra a verificação de saúde e desconecta do Redis."""
+        task, self._health_task = self._health_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.disconnect()
+        await self.fallback.stop()
+
+    def _create_client(self) -> redis.Redis:
+        """Cria o cliente sobre um pool de conexões dimensionado."""
+        self.pool = redis.ConnectionPool.from_url(
+            self.redis_url,
+            max_connections=self.max_connections,
+            socket_timeout=self.socket_timeout,
+            socket_connect_timeout=self.socket_timeout,
+        )
+        return redis.Redis(connection_pool=self.pool)
+
+    async def _probe(self) -> bool:
+        """Verifica a saúde do Redis com PING, conectando se necessário."""
+        async with self._probe_lock:
+            self._last_attempt = time.monotonic()
+            try:
+                if self.client is None:
+                    self.client = self._create_client()
+                await asyncio.wait_for(self.client.ping(), self.socket_timeout)
+            except Exception as e:
+                self._mark_down(e)
+                return False
+
+            if self._down or self.last_error is not None:
+                await self._recover()
+            logger.debug("Redis saudável")
+            return True
+
+    async def _recover(self) -> None:
+        """Volta a usar o Redis, reaplicando o que mudou durante a queda.
+
+        As remoções são refeitas e, em seguida, as gerações e tags gravadas
+        no fallback são levadas ao Redis; sem isso, uma invalidação feita
+        durante a queda seria desfeita quando ele voltasse.
+        """
+        pending_deletes, self._pending_deletes = self._pending_deletes, set()
+        pending_clear, self._pending_clear = self._pending_clear, False
+        pending_writes, self._pending_writes = self._pending_writes, {}
+        try:
+            if pending_clear:
+                await self._delete_namespace(self.client)
+            elif pending_deletes:
+                await self.client.delete(*pending_deletes)
+            if pending_writes:
+                await self._replay_writes(self.client, pending_writes)
+        except Exception as e:
+            logger.error(f"Erro ao reaplicar alterações no Redis: {str(e)}")
+
+        await self.fallback.clear()
+        if self._down:
+            self.recoveries += 1
+            logger.info("Conexão com o Redis restabelecida")
+        self._down = False
+        self.last_error = None
+
+    async def _replay_writes(self, client: redis.Redis, pending: Dict[str, int]) -> None:
+        """Grava no Redis as gerações e tags escritas no fallback.
+
+        Uma geração nunca retrocede: vale a maior entre o Redis e o fallback,
+        o que pode invalidar um recurso a mais, mas nunca a menos. Tags são
+        unidas às que já estão no Redis.
+        """
+        keys = list(pending)
+        local_values = await self.fallback.get_many(keys)
+        remote_values = await client.mget(keys)
+
+        items: Dict[str, Any] = {}
+        for key, value, remote in zip(keys, local_values, remote_values):
+            if value is None:
+                continue
+            current = None if remote is None else self.codec.decode(remote)
+            if is_generation_key(key):
+                if isinstance(current, int) and current >= value:
+                    continue
+            elif isinstance(current, list):
+                value = list(dict.fromkeys([*current, *value]))
+            items[key] = value
+
+        if items:
+            async with client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.setex(key, pending[key], self.codec.encode(value))
+                await pipe.execute()
+            logger.info(f"{len(items)} gerações e tags reaplicadas no Redis")
+
+    def _mark_down(self, error: Exception) -> None:
+        """Registra a falha e passa a usar o cache local."""
+        self.last_error = str(error) or type(error).__name__
+        self.connection_failures += 1
+        self._last_attempt = time.monotonic()
+        if not self._down:
+            logger.error(f"Redis indisponível, usando cache em memória: {self.last_error}")
+        self._down = True
+
+    async def _get_client(self) -> Optional[redis.Redis]:
+        """Retorna o cliente Redis ou None quando o fallback deve ser usado.
+
+        Sem start(), a primeira operação conecta; durante uma queda, uma nova
+        tentativa é feita no máximo a cada health_check_interval segundos.
+        """
+        if self.available:
+            return self.client
+        if (
+            self.client is not None
+            and time.monotonic() - self._last_attempt < self.health_check_interval
+        ):
+            return None
+        if self._probe_lock.locked():
+            return None
+        return self.client if await self._probe() else None
+
+    async def _health_check(self) -> None:
+        """Verifica periodicamente a saúde do Redis."""
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            await self._probe()
+
     async def get(self, key: str) -> Optional[Any]:
         """Obtém um valor do cache."""
-        if not self.client:
-            raise CacheError("Cliente Redis não inicializado")
+        client = await self._get_client()
+        if client is None:
+            self.fallback_operations += 1
+            return await self.fallback.get(key)
 
         try:
-            value = await self.client.get(key)
+            value = await client.get(key)
             if value is None:
                 return None
-            return json.loads(value)
+            return self.codec.decode(value)
+        except CONNECTION_ERRORS as e:
+            self._mark_down(e)
+            self.fallback_operations += 1
+            return await self.fallback.get(key)
         except Exception as e:
             logger.error(f"Erro ao obter chave {key} do Redis: {str(e)}")
             return None
 
     async def set(self, key: str, value: Any, ttl: int) -> None:
         """Define um valor no cache com TTL."""
-        if not self.client:
-            raise CacheError("Cliente Redis não inicializado")
+        client = await self._get_client()
+        if client is None:
+            self._write_later([key], ttl)
+            await self.fallback.set(key, value, ttl)
+            return
 
         try:
-            await self.client.setex(key, ttl, json.dumps(value))
+            await client.setex(key, ttl, self.codec.encode(value))
             logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
+        except CONNECTION_ERRORS as e:
+            self._mark_down(e)
+            self._write_later([key], ttl)
+            await self.fallback.set(key, value, ttl)
         except Exception as e:
             logger.error(f"Erro ao definir chave {key} no Redis: {str(e)}")
             raise CacheError(f"Erro ao definir chave no Redis: {str(e)}")
 
     async def delete(self, key: str) -> None:
         """Deleta um valor do cache."""
-        if not self.client:
-            raise CacheError("Cliente Redis não inicializado")
+        await self.delete_many([key])
+
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Obtém vários valores com um único MGET."""
+        if not keys:
+            return []
+
+        client = await self._get_client()
+        if client is None:
+            self.fallback_operations += 1
+            return await self.fallback.get_many(keys)
+
+        try:
+            values = await client.mget(keys)
+        except CONNECTION_ERRORS as e:
+            self._mark_down(e)
+            self.fallback_operations += 1
+            return await self.fallback.get_many(keys)
+        except Exception as e:
+            logger.error(f"Erro ao obter {len(keys)} chaves do Redis: {str(e)}")
+            return [None] * len(keys)
+
+        return self._decode_many(keys, values)
+
+    async def get_many_with_ttl(
+        self, keys: List[str]
+    ) -> List[Tuple[Optional[Any], Optional[float]]]:
+        """Obtém vários valores e seus TTLs restantes (PTTL) num único pipeline."""
+        if not keys:
+            return []
+
+        client = await self._get_client()
+        if client is None:
+            self.fallback_operations += 1
+            return await self.fallback.get_many_with_ttl(keys)
+
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.mget(keys)
+                for key in keys:
+                    pipe.pttl(key)
+                values, *ttls = await pipe.execute()
+        except CONNECTION_ERRORS as e:
+            self._mark_down(e)
+            self.fallback_operations += 1
+            return await self.fallback.get_many_with_ttl(keys)
+        except Exception as e:
+            logger.error(f"Erro ao obter {len(keys)} chaves do Redis: {str(e)}")
+            return [(None, None)] * len(keys)
+
+        # PTTL negativo: chave sem expiração (-1) ou já removida (-2)
+        remaining = [ttl / 1000 if ttl >= 0 else None for ttl in ttls]
+        return list(zip(self._decode_many(keys, values), remaining))
+
+    def _decode_many(self, keys: List[str], values: List[Optional[bytes]]) -> List[Optional[Any]]:
+        """Decodifica os valores lidos do Redis, descartando os corrompidos."""
+        results: List[Optional[Any]] = []
+        for key, value in zip(keys, values):
+            try:
+                results.append(None if value is None else self.codec.decode(value))
+            except Exception as e:
+                logger.error(f"Erro ao decodificar chave {key} do Redis: {str(e)}")
+                results.append(None)
+        return results
+
+    async def set_many(self, items: Dict[str, Any], ttl: int) -> None:
+        """Define vários valores com SETEX em um único pipeline."""
+        if not items:
+            return
+
+        client = await self._get_client()
+        if client is None:
+            self._write_later(items, ttl)
+            await self.fallback.set_many(items, ttl)
+            return
 
         try:
-            await self.client.delete(key)
-            logger.debug(f"Cache deleted: {key}")
+            async with client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.setex(key, ttl, self.codec.encode(value))
+                await pipe.execute()
+            logger.debug(f"Cache set: {len(items)} chaves (TTL: {ttl}s)")
+        except CONNECTION_ERRORS as e:
+            self._mark_down(e)
+            self._write_later(items, ttl)
+            await self.fallback.set_many(items, ttl)
         except Exception as e:
-            logger.error(f"Erro ao deletar chave {key} do Redis: {str(e)}")
-            raise CacheError(f"Erro ao deletar chave do Redis: {str(e)}")
+            logger.error(f"Erro ao definir {len(items)} chaves no Redis: {str(e)}")
+            raise CacheError(f"Erro ao definir chaves no Redis: {str(e)}")
+
+    async def delete_many(self, keys: List[str]) -> None:
+        """Deleta vários valores com um único DEL."""
+        if not keys:
+            return
+
+        client = await self._get_client()
+        if client is None:
+            self._delete_later(keys)
+            await self.fallback.delete_many(keys)
+            return
+
+        try:
+            await client.delete(*keys)
+            logger.debug(f"Cache deleted: {len(keys)} chaves")
+        except CONNECTION_ERRORS as e:
+            self._mark_down(e)
+            self._delete_later(keys)
+            await self.fallback.delete_many(keys)
+        except Exception as e:
+            logger.error(f"Erro ao deletar {len(keys)} chaves do Redis: {str(e)}")
+            raise CacheError(f"Erro ao deletar chaves do Redis: {str(e)}")
+
+    def _write_later(self, keys: Iterable[str], ttl: int) -> None:
+        """Guarda as gerações e tags gravadas no fallback para levar ao Redis."""
+        self.fallback_operations += 1
+        for key in keys:
+            if is_generation_key(key) or is_tag_key(key):
+                self._pending_writes[key] = ttl
+
+    def _delete_later(self, keys: List[str]) -> None:
+        """Guarda remoções para reaplicar no Redis quando ele voltar."""
+        self.fallback_operations += 1
+        self._pending_deletes.update(keys)
 
     async def clear(self) -> None:
         """Limpa todo o cache."""
-        if not self.client:
-            raise CacheError("Cliente Redis não inicializado")
+        client = await self._get_client()
+        if client is None:
+            self.fallback_operations += 1
+            self._pending_clear = True
+            await self.fallback.clear()
+            return
 
         try:
-            await self.client.flushdb()
-            logger.debug("Cache cleared")
+            deleted = await self._delete_namespace(client)
+            logger.debug(f"Cache cleared: {deleted} chaves")
+        except CONNECTION_ERRORS as e:
+            self._mark_down(e)
+            self.fallback_operations += 1
+            self._pending_clear = True
+            await self.fallback.clear()
         except Exception as e:
             logger.error(f"Erro ao limpar Redis: {str(e)}")
             raise CacheError(f"Erro ao limpar Redis: {str(e)}")
 
+    async def _delete_namespace(self, client: redis.Redis, batch_size: int = 500) -> int:
+        """Remove, em lotes com SCAN e UNLINK, as chaves do namespace."""
+        deleted = 0
+        batch: List[Any] = []
+        async for key in client.scan_iter(match=f"{self.namespace}:*", count=batch_size):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                deleted += await client.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += await client.unlink(*batch)
+        return deleted
+
     async def exists(self, key: str) -> bool:
         """Verifica se uma chave existe no cache."""
-        if not self.client:
-            raise CacheError("Cliente Redis não inicializado")
+        client = await self._get_client()
+        if client is None:
+            self.fallback_operations += 1
+            return await self.fallback.exists(key)
 
         try:
-            return await self.client.exists(key) > 0
+            return await client.exists(key) > 0
+        except CONNECTION_ERRORS as e:
+            self._mark_down(e)
+            self.fallback_operations += 1
+            return await self.fallback.exists(key)
         except Exception as e:
             logger.error(f"Erro ao verificar existência da chave {key}: {str(e)}")
             return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna o estado da conexão e os contadores de fallback."""
+        return {
+            "available": self.available,
+            "max_connections": self.max_connections,
+            "connection_failures": self.connection_failures,
+            "recoveries": self.recoveries,
+            "fallback_operations": self.fallback_operations,
+            "pending_deletes": len(self._pending_deletes),
+            "pending_writes": len(self._pending_writes),
+            "last_error": self.last_error,
+        }
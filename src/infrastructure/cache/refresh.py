@@ -0,0 +1,97 @@
+import asyncio
+import logging
+import math
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Set, Tuple
+
+from src.infrastructure.http.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+ENVELOPE_MARKER = "__expires_at__"
+
+
+class RefreshPolicy:
+    """Stale-while-revalidate com expiração antecipada probabilística (XFetch).
+
+    Os valores são gravados num envelope com o instante de expiração lógica
+    e o tempo que levaram para ser calculados (delta). A chave fica no
+    cache por mais stale_ttl segundos depois de expirar: nesse intervalo o
+    valor antigo é servido enquanto uma tarefa de fundo o renova. Antes de
+    expirar, cada leitura renova o valor com probabilidade crescente
+    (delta * beta * -ln(rand) >= tempo restante), então chaves quentes são
+    renovadas antes do prazo e nunca expiram todas de uma vez.
+    """
+
+    def __init__(self, stale_ttl: int = 600, beta: float = 1.0):
+        self.stale_ttl = stale_ttl
+        self.beta = beta
+        self.flight = SingleFlight()
+        self.stale_hits = 0
+        self.early_refreshes = 0
+        self.refresh_errors = 0
+        self._tasks: Set[asyncio.Task] = set()
+
+    def wrap(self, value: Any, ttl: int, delta: float) -> Dict[str, Any]:
+        """Cria o envelope gravado no cache."""
+        return {"value": value, ENVELOPE_MARKER: time.time() + ttl, "delta": delta}
+
+    def storage_ttl(self, ttl: int) -> int:
+        """TTL físico da chave: o lógico mais a janela em que o valor pode ser servido vencido."""
+        return ttl + self.stale_ttl
+
+    def unwrap(self, cached: Any) -> Tuple[Any, bool]:
+        """Extrai o valor e indica se ele deve ser renovado em segundo plano.
+
+        Valores gravados sem envelope são tratados como frescos.
+        """
+        if not isinstance(cached, dict) or ENVELOPE_MARKER not in cached:
+            return cached, False
+
+        remaining = cached[ENVELOPE_MARKER] - time.time()
+        if remaining <= 0:
+            self.stale_hits += 1
+            return cached["value"], True
+
+        delta = cached.get("delta") or 0.0
+        if delta > 0 and -delta * self.beta * math.log(1.0 - random.random()) >= remaining:
+            self.early_refreshes += 1
+            return cached["value"], True
+
+        return cached["value"], False
+
+    async def load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Carrega um valor ausente, agrupando chamadas concorrentes da mesma chave."""
+        return await self.flight.do(key, loader)
+
+    def refresh(self, key: str, loader: Callable[[], Awaitable[Any]]) -> None:
+        """Agenda a renovação da chave em segundo plano, uma por vez."""
+        if self.flight.in_flight(key):
+            return
+
+        task = asyncio.ensure_future(self._run_refresh(key, loader))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_refresh(self, key: str, loader: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            await self.flight.do(key, loader)
+            logger.debug(f"Chave renovada em segundo plano: {key}")
+        except Exception as e:
+            self.refresh_errors += 1
+            logger.error(f"Erro ao renovar {key} em segundo plano: {str(e)}")
+
+    async def join(self) -> None:
+        """Aguarda as renovações em andamento."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Retorna os contadores de renovação."""
+        return {
+            "stale_hits": self.stale_hits,
+            "early_refreshes": self.early_refreshes,
+            "refresh_errors": self.refresh_errors,
+            "refreshing": len(self._tasks),
+        }
@@ -0,0 +1,267 @@
+import asyncio
+import json
+import logging
+import math
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from src.domain.interfaces.cache import ICache
+from src.infrastructure.cache.redis_cache import RedisCache
+
+logger = logging.getLogger(__name__)
+
+CLEAR_ALL = "*"
+
+
+class RedisInvalidationBus:
+    """Propaga invalidações de chaves entre processos via pub/sub do Redis.
+
+    Cada instância tem um identificador próprio para ignorar as mensagens
+    que ela mesma publicou. Se a assinatura cair, novas tentativas são
+    feitas com backoff exponencial, de retry_delay até max_retry_delay.
+    """
+
+    def __init__(
+        self,
+        redis_cache: RedisCache,
+        channel: str,
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 30.0,
+    ):
+        self.redis_cache = redis_cache
+        self.channel = channel
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.origin = uuid.uuid4().hex
+        self.published = 0
+        self.received = 0
+        self.outages = 0
+        self._listener: Optional[asyncio.Task] = None
+
+    async def publish(self, key: str) -> None:
+        """Anuncia que uma chave (ou todo o cache, com "*") mudou."""
+        await self.publish_many([key])
+
+    async def publish_many(self, keys: List[str]) -> None:
+        """Anuncia, em uma única mensagem, que várias chaves mudaram."""
+        client = self.redis_cache.client
+        if client is None or not keys:
+            return
+        try:
+            await client.publish(self.channel, json.dumps({"origin": self.origin, "keys": keys}))
+            self.published += 1
+        except Exception as e:
+            logger.error(f"Erro ao publicar invalidação de {len(keys)} chaves: {str(e)}")
+
+    async def start(self, on_invalidate: Callable[[str], Awaitable[None]]) -> None:
+        """Começa a escutar invalidações publicadas por outros processos."""
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen(on_invalidate))
+
+    async def stop(self) -> None:
+        """Para de escutar invalidações."""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.cancel()
+            try:
+                await listener
+            except asyncio.CancelledError:
+                pass
+
+    async def _listen(self, on_invalidate: Callable[[str], Awaitable[None]]) -> None:
+        """Consome o canal, reconectando após falhas.
+
+        Enquanto o Redis estiver indisponível, a assinatura nem é tentada.
+        As mensagens publicadas durante uma queda se perdem, então o L1 é
+        limpo uma única vez, quando a assinatura volta.
+        """
+        delay = self.retry_delay
+        interrupted = False
+        while True:
+            if self.redis_cache.available:
+                try:
+                    pubsub = self.redis_cache.client.pubsub()
+                    await pubsub.subscribe(self.channel)
+                    try:
+                        if interrupted:
+                            logger.info("Escuta de invalidações do cache restabelecida")
+                            await on_invalidate(CLEAR_ALL)
+                            interrupted = False
+                        delay = self.retry_delay
+                        async for message in pubsub.listen():
+                            if message.get("type") != "message":
+                                continue
+                            payload = json.loads(message["data"])
+                            if payload.get("origin") == self.origin:
+                                continue
+                            self.received += 1
+                            for key in payload["keys"]:
+                                await on_invalidate(key)
+                    finally:
+                        await pubsub.unsubscribe(self.channel)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    if not interrupted:
+                        self.outages += 1
+                        logger.error(f"Erro ao escutar invalidações do cache: {str(e)}")
+                    interrupted = True
+            else:
+                interrupted = True
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_retry_delay)
+
+
+class TieredCache(ICache):
+    """Cache em dois níveis: memória local (L1) na frente de um cache compartilhado (L2).
+
+    Leituras tentam o L1 e, em caso de falha, buscam no L2 e preenchem o L1
+    com um TTL curto (l1_ttl), nunca maior que o que resta à chave no L2:
+    expirações não passam pelo barramento, então uma cópia no L1 não pode
+    sobreviver ao original. Escritas e remoções vão para os dois níveis e são
+    anunciadas no barramento de invalidação, para que os L1 dos demais
+    workers descartem a chave.
+    """
+
+    def __init__(
+        self,
+        l1: ICache,
+        l2: ICache,
+        bus: Optional[RedisInvalidationBus] = None,
+        l1_ttl: int = 30,
+    ):
+        self.l1 = l1
+        self.l2 = l2
+        self.bus = bus
+        self.l1_ttl = l1_ttl
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Obtém um valor do L1 ou, na falta dele, do L2."""
+        value = await self.l1.get(key)
+        if value is not None:
+            self.l1_hits += 1
+            return value
+
+        ((value, remaining),) = await self.l2.get_many_with_ttl([key])
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.l2_hits += 1
+        ttl = self._l1_ttl_for(remaining)
+        if ttl > 0:
+            await self.l1.set(key, value, ttl)
+        return value
+
+    def _l1_ttl_for(self, remaining: Optional[float]) -> int:
+        """TTL da cópia no L1 de um valor lido do L2 com remaining segundos de vida."""
+        if remaining is None:
+            return self.l1_ttl
+        return min(self.l1_ttl, math.floor(remaining))
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        """Define um valor nos dois níveis e invalida os L1 remotos."""
+        await self.l2.set(key, value, ttl)
+        await self.l1.set(key, value, min(ttl, self.l1_ttl))
+        if self.bus is not None:
+            await self.bus.publish(key)
+
+    async def delete(self, key: str) -> None:
+        """Deleta um valor dos dois níveis e invalida os L1 remotos."""
+        await self.l2.delete(key)
+        await self.l1.delete(key)
+        if self.bus is not None:
+            await self.bus.publish(key)
+
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Obtém vários valores, buscando no L2 em lote só o que faltou no L1."""
+        values = await self.l1.get_many(keys)
+        missing = [key for key, value in zip(keys, values) if value is None]
+        self.l1_hits += len(keys) - len(missing)
+        if not missing:
+            return values
+
+        found: Dict[str, Any] = {}
+        by_ttl: Dict[int, Dict[str, Any]] = {}
+        for key, (value, remaining) in zip(missing, await self.l2.get_many_with_ttl(missing)):
+            if value is None:
+                continue
+            found[key] = value
+            ttl = self._l1_ttl_for(remaining)
+            if ttl > 0:
+                by_ttl.setdefault(ttl, {})[key] = value
+        self.l2_hits += len(found)
+        self.misses += len(missing) - len(found)
+        for ttl, items in by_ttl.items():
+            await self.l1.set_many(items, ttl)
+
+        return [found.get(key) if value is None else value for key, value in zip(keys, values)]
+
+    async def set_many(self, items: Dict[str, Any], ttl: int) -> None:
+        """Define vários valores nos dois níveis e invalida os L1 remotos."""
+        await self.l2.set_many(items, ttl)
+        await self.l1.set_many(items, min(ttl, self.l1_ttl))
+        if self.bus is not None:
+            await self.bus.publish_many(list(items))
+
+    async def delete_many(self, keys: List[str]) -> None:
+        """Deleta vários valores dos dois níveis e invalida os L1 remotos."""
+        await self.l2.delete_many(keys)
+        await self.l1.delete_many(keys)
+        if self.bus is not None:
+            await self.bus.publish_many(keys)
+
+    async def clear(self) -> None:
+        """Limpa os dois níveis e os L1 remotos."""
+        await self.l2.clear()
+        await self.l1.clear()
+        if self.bus is not None:
+            await self.bus.publish(CLEAR_ALL)
+
+    async def exists(self, key: str) -> bool:
+        """Verifica se uma chave existe em algum dos níveis."""
+        return await self.l1.exists(key) or await self.l2.exists(key)
+
+    async def start(self) -> None:
+        """Inicia os dois níveis e a escuta de invalidações."""
+        await self.l2.start()
+        await self.l1.start()
+        if self.bus is not None:
+            await self.bus.start(self._on_invalidate)
+
+    async def stop(self) -> None:
+        """Encerra a escuta de invalidações e os dois níveis."""
+        if self.bus is not None:
+            await self.bus.stop()
+        await self.l1.stop()
+        await self.l2.stop()
+
+    async def _on_invalidate(self, key: str) -> None:
+        """Descarta do L1 uma chave alterada por outro processo."""
+        if key == CLEAR_ALL:
+            await self.l1.clear()
+        else:
+            await self.l1.delete(key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna os acertos por nível e as métricas de invalidação."""
+        stats: Dict[str, Any] = {
+            "l1_hits": self.l1_hits,
+            "l2_hits": self.l2_hits,
+            "misses": self.misses,
+        }
+        l1_stats = getattr(self.l1, "get_stats", None)
+        if l1_stats is not None:
+            stats["l1"] = l1_stats()
+        l2_stats = getattr(self.l2, "get_stats", None)
+        if l2_stats is not None:
+            stats["l2"] = l2_stats()
+        if self.bus is not None:
+            stats["invalidations_published"] = self.bus.published
+            stats["invalidations_received"] = self.bus.received
+            stats["invalidation_outages"] = self.bus.outages
+        return stats
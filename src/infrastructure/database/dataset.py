@@ -0,0 +1,308 @@
+import logging
+import math
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Generic, Iterable, List, Optional, Sequence, TypeVar
+
+from src.config.exceptions import InvalidFilterError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+UNKNOWN_VALUES = (None, "unknown")
+
+RANGE_OPERATORS = {
+    "gt": lambda a, b: a > b,
+    "gte": lambda a, b: a >= b,
+    "lt": lambda a, b: a < b,
+    "lte": lambda a, b: a <= b,
+}
+
+
+def parse_number(value: Any) -> float:
+    """Converte um valor da SWAPI em número, usando NaN para desconhecidos.
+
+    Aceita separadores de milhar ("1,000,000"); valores como "unknown",
+    "n/a" ou intervalos ("30-165") resultam em NaN.
+    """
+    if isinstance(value, bool) or value is None:
+        return math.nan
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(str(value).replace(",", "").strip())
+    except ValueError:
+        return math.nan
+
+
+def match_filter(field_value: Any, filter_value: Any) -> bool:
+    """Verifica se um valor corresponde ao filtro."""
+    if isinstance(filter_value, list):
+        return all(match_filter(field_value, condition) for condition in filter_value)
+
+    if isinstance(filter_value, dict):
+        operator = filter_value.get("operator", "eq")
+        value = filter_value.get("value")
+
+        if operator == "eq":
+            return _equals(field_value, value)
+        elif operator == "ne":
+            return not _equals(field_value, value)
+        elif operator == "contains":
+            return str(value).lower() in str(field_value).lower()
+        elif operator == "in":
+            return field_value in value
+        elif operator in RANGE_OPERATORS:
+            return RANGE_OPERATORS[operator](parse_number(field_value), parse_number(value))
+        else:
+            return False
+
+    return field_value == filter_value
+
+
+def _equals(field_value: Any, value: Any) -> bool:
+    """Compara valores, aceitando texto numérico para campos numéricos."""
+    if isinstance(field_value, (int, float)) and isinstance(value, str):
+        return field_value == parse_number(value)
+    return field_value == value
+
+
+class Dataset(Generic[T]):
+    """Coleção imutável de entidades indexada em memória.
+
+    Mantém os valores de cada campo em colunas, índices hash para os campos
+    categóricos, colunas numéricas com cópias ordenadas para filtros de
+    intervalo e permutações de ordenação memorizadas. Filtros e ordenações
+    trabalham sobre posições de linha e só as entidades da página pedida são
+    materializadas. Para atualizar os dados, constrói-se um novo Dataset.
+    """
+
+    def __init__(
+        self,
+        entities: List[T],
+        fields: Iterable[str],
+        indexed_fields: Sequence[str] = (),
+        numeric_fields: Sequence[str] = (),
+        version: Any = None,
+    ):
+        self.entities = entities
+        self.version = version
+        self.fields = set(fields)
+        self.columns: Dict[str, List[Any]] = {
+            field: [getattr(entity, field) for entity in entities] for field in self.fields
+        }
+        self.rows_by_id: Dict[str, int] = {
+            url.rstrip("/").split("/")[-1]: row
+            for row, url in enumerate(self.columns.get("url", ()))
+            if url
+        }
+        self.indexes: Dict[str, Dict[Any, List[int]]] = {
+            field: self._build_index(self.columns[field])
+            for field in indexed_fields
+            if field in self.fields
+        }
+        self.numeric_columns: Dict[str, List[float]] = {
+            field: [parse_number(value) for value in self.columns[field]]
+            for field in numeric_fields
+            if field in self.fields
+        }
+        self._numeric_sorted: Dict[str, tuple[List[float], List[int]]] = {
+            field: self._build_sorted(column) for field, column in self.numeric_columns.items()
+        }
+        self._sort_cache: Dict[tuple, List[int]] = {}
+        self._rank_cache: Dict[str, List[Optional[int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def __contains__(self, resource_id: object) -> bool:
+        return resource_id in self.rows_by_id
+
+    def get(self, resource_id: str) -> Optional[T]:
+        """Obtém uma entidade pelo ID da SWAPI."""
+        row = self.rows_by_id.get(resource_id)
+        return None if row is None else self.entities[row]
+
+    @staticmethod
+    def _build_index(column: List[Any]) -> Dict[Any, List[int]]:
+        """Cria um índice valor -> posições para uma coluna."""
+        index: Dict[Any, List[int]] = {}
+        for row, value in enumerate(column):
+            index.setdefault(value, []).append(row)
+        return index
+
+    @staticmethod
+    def _build_sorted(column: List[float]) -> tuple[List[float], List[int]]:
+        """Cria a cópia ordenada (valores, posições) de uma coluna numérica, sem NaN."""
+        pairs = sorted((value, row) for row, value in enumerate(column) if not math.isnan(value))
+        return [value for value, _ in pairs], [row for _, row in pairs]
+
+    def _check_field(self, field: str) -> None:
+        """Valida se o campo existe no dataset."""
+        if field not in self.fields:
+            raise InvalidFilterError(field, f"Campo '{field}' não existe")
+
+    def query(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_by: Optional[str] = None,
+        sort_order: str = "asc",
+    ) -> List[int]:
+        """Retorna as posições das linhas que atendem aos filtros, ordenadas."""
+        rows = self.filter(filters) if filters else None
+        if sort_by:
+            return self.sort(rows, sort_by, sort_order)
+        return list(range(len(self))) if rows is None else rows
+
+    def filter(self, filters: Dict[str, Any]) -> List[int]:
+        """Retorna as posições das linhas que atendem a todos os filtros."""
+        candidates: Optional[set] = None
+
+        for field, filter_value in filters.items():
+            self._check_field(field)
+            matched = self._lookup(field, filter_value, candidates)
+            candidates = matched if candidates is None else candidates & matched
+            if not candidates:
+                return []
+
+        return sorted(candidates) if candidates is not None else list(range(len(self)))
+
+    def _lookup(self, field: str, filter_value: Any, candidates: Optional[set]) -> set:
+        """Resolve um filtro usando índice quando possível ou varrendo a coluna."""
+        if isinstance(filter_value, list):
+            matched = candidates
+            for condition in filter_value:
+                rows = self._lookup(field, condition, matched)
+                matched = rows if matched is None else matched & rows
+            return matched if matched is not None else set(range(len(self)))
+
+        index = self.indexes.get(field)
+        if isinstance(filter_value, dict):
+            operator = filter_value.get("operator", "eq")
+            value = filter_value.get("value")
+        else:
+            operator, value = "eq", filter_value
+
+        if index is not None:
+            try:
+                if operator == "eq":
+                    return set(index.get(value, ()))
+                if operator == "in":
+                    return {row for item in value for row in index.get(item, ())}
+                if operator == "ne":
+                    return set(range(len(self))) - set(index.get(value, ()))
+            except TypeError:
+                # Valores não hasheáveis caem na varredura da coluna
+                pass
+
+        if operator in RANGE_OPERATORS and field in self._numeric_sorted:
+            return self._range_lookup(field, operator, parse_number(value))
+
+        column = self.columns[field]
+        rows = candidates if candidates is not None else range(len(self))
+        return {row for row in rows if match_filter(column[row], filter_value)}
+
+    def _range_lookup(self, field: str, operator: str, value: float) -> set:
+        """Resolve um filtro de intervalo por busca binária na coluna ordenada."""
+        if math.isnan(value):
+            return set()
+
+        values, rows = self._numeric_sorted[field]
+        if operator == "gt":
+            return set(rows[bisect_right(values, value) :])
+        if operator == "gte":
+            return set(rows[bisect_left(values, value) :])
+        if operator == "lt":
+            return set(rows[: bisect_left(values, value)])
+        return set(rows[: bisect_right(values, value)])
+
+    def sort(self, rows: Optional[List[int]], sort_by: str, sort_order: str = "asc") -> List[int]:
+        """Ordena as linhas usando a permutação memorizada das chaves.
+
+        sort_by aceita várias chaves separadas por vírgula; o prefixo "-"
+        inverte a ordem padrão daquela chave (ex: "gender,-mass").
+        """
+        keys = self._parse_sort_keys(sort_by, sort_order.lower() == "desc")
+        permutation = self._get_permutation(keys)
+
+        if rows is None or len(rows) == len(self):
+            return list(permutation)
+
+        selected = set(rows)
+        return [row for row in permutation if row in selected]
+
+    def _parse_sort_keys(self, sort_by: str, descending: bool) -> tuple:
+        """Converte a especificação de ordenação em chaves (campo, decrescente)."""
+        keys = []
+        for token in sort_by.split(","):
+            token = token.strip()
+            reverse = descending
+            if token.startswith("-"):
+                token, reverse = token[1:], not descending
+            self._check_field(token)
+            keys.append((token, reverse))
+        return tuple(keys)
+
+    def _get_permutation(self, keys: tuple) -> List[int]:
+        """Obtém (ou calcula) a permutação estável para as chaves de ordenação."""
+        permutation = self._sort_cache.get(keys)
+
+        if permutation is None:
+            ranks = [self._get_ranks(field) for field, _ in keys]
+            directions = [-1 if reverse else 1 for _, reverse in keys]
+            permutation = sorted(
+                range(len(self)),
+                key=lambda row: tuple(
+                    math.inf if rank[row] is None else rank[row] * direction
+                    for rank, direction in zip(ranks, directions)
+                ),
+            )
+            self._sort_cache[keys] = permutation
+
+        return permutation
+
+    def _get_ranks(self, field: str) -> List[Optional[int]]:
+        """Calcula o ranking denso crescente de um campo.
+
+        Campos numéricos usam a coluna tipada; valores desconhecidos recebem
+        None e ficam sempre no fim, qualquer que seja a direção.
+        """
+        ranks = self._rank_cache.get(field)
+
+        if ranks is None:
+            if field in self.numeric_columns:
+                values = [
+                    None if math.isnan(value) else value for value in self.numeric_columns[field]
+                ]
+            else:
+                values = [
+                    None if value in UNKNOWN_VALUES else value for value in self.columns[field]
+                ]
+
+            ordered = sorted(
+                (row for row, value in enumerate(values) if value is not None),
+                key=values.__getitem__,
+            )
+            ranks = [None] * len(values)
+            rank = -1
+            for position, row in enumerate(ordered):
+                if position == 0 or values[row] != values[ordered[position - 1]]:
+                    rank += 1
+                ranks[row] = rank
+            self._rank_cache[field] = ranks
+
+        return ranks
+
+    def search(self, query: str, fields: Sequence[str]) -> List[int]:
+        """Retorna as linhas cujo texto de algum campo contém a query."""
+        query_lower = query.lower()
+        columns = [self.columns[field] for field in fields if field in self.columns]
+        return [
+            row
+            for row in range(len(self))
+            if any(query_lower in (column[row] or "").lower() for column in columns)
+        ]
+
+    def select(self, rows: Iterable[int]) -> List[T]:
+        """Materializa as entidades das posições informadas."""
+        return [self.entities[row] for row in rows]
@@ -0,0 +1,49 @@
+import time
+from typing import Any, Dict, Generic, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class EntityCache(Generic[T]):
+    """Cache local do processo com entidades já validadas.
+
+    Guarda os próprios objetos de domínio, evitando desserializar e validar
+    novamente a cada leitura. O cache compartilhado (Redis/memória) continua
+    guardando dicionários; a conversão acontece só nessa fronteira.
+
+    Cada entidade guarda a versão do recurso com que foi obtida; uma leitura
+    com outra versão a descarta, então invalidações feitas por outros
+    processos também valem aqui.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[T, float, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, version: Any = None) -> Optional[T]:
+        """Obtém uma entidade se ela não expirou e é da versão informada."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        entity, deadline, entry_version = entry
+        if entry_version != version or time.monotonic() >= deadline:
+            self._entries.pop(key, None)
+            return None
+
+        return entity
+
+    def set(self, key: str, entity: T, version: Any = None) -> None:
+        """Armazena uma entidade até o fim do TTL."""
+        self._entries[key] = (entity, time.monotonic() + self.ttl, version)
+
+    def delete(self, key: str) -> None:
+        """Remove uma entidade."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove todas as entidades."""
+        self._entries.clear()
@@ -0,0 +1,125 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.config.exceptions import ResourceNotFoundError
+from src.infrastructure.database.dataset import Dataset
+
+logger = logging.getLogger(__name__)
+
+# (recurso de origem, campo com as URLs, recurso de destino)
+RELATIONS = (
+    ("films", "characters", "people"),
+    ("films", "planets", "planets"),
+    ("films", "starships", "starships"),
+    ("people", "films", "films"),
+    ("people", "starships", "starships"),
+    ("people", "homeworld", "planets"),
+    ("planets", "residents", "people"),
+    ("planets", "films", "films"),
+    ("starships", "pilots", "people"),
+    ("starships", "films", "films"),
+)
+
+RELATION_FIELDS = {(source, target): field for source, field, target in RELATIONS}
+
+
+def extract_id(url: str) -> str:
+    """Extrai o ID de uma URL da SWAPI."""
+    return url.rstrip("/").split("/")[-1]
+
+
+class RelationshipIndex:
+    """Grafo imutável de relacionamentos entre recursos com IDs inteiros.
+
+    Para cada par (origem, destino) guarda uma lista de adjacência
+    id -> ids relacionados, nas duas direções, de modo que cada consulta
+    custa O(grau) e não faz I/O.
+    """
+
+    def __init__(self, datasets: Dict[str, Dataset], version: Any = None):
+        self.version = version
+        adjacency: Dict[Tuple[str, str], Dict[int, List[int]]] = {}
+
+        for source, field, target in RELATIONS:
+            dataset = datasets.get(source)
+            if dataset is None or field not in dataset.columns:
+                continue
+
+            forward = adjacency.setdefault((source, target), {})
+            backward = adjacency.setdefault((target, source), {})
+
+            for url, related in zip(dataset.columns["url"], dataset.columns[field]):
+                if not url:
+                    continue
+                source_id = int(extract_id(url))
+                urls = [related] if isinstance(related, str) else related or []
+                neighbors = forward.setdefault(source_id, [])
+
+                for related_url in urls:
+                    target_id = int(extract_id(related_url))
+                    neighbors.append(target_id)
+                    backward.setdefault(target_id, []).append(source_id)
+
+        self.adjacency: Dict[Tuple[str, str], Dict[int, Tuple[int, ...]]] = {
+            pair: {node: tuple(dict.fromkeys(ids)) for node, ids in nodes.items()}
+            for pair, nodes in adjacency.items()
+        }
+
+    def neighbors(self, source_type: str, source_id: int, target_type: str) -> Tuple[int, ...]:
+        """Retorna os IDs do destino relacionados a um recurso de origem."""
+        return self.adjacency.get((source_type, target_type), {}).get(source_id, ())
+
+
+class RelationshipGraph:
+    """Mantém o índice de relacionamentos sincronizado com as coleções carregadas."""
+
+    def __init__(self, repositories: Sequence[Any]):
+        self.repositories = {repository.resource_type: repository for repository in repositories}
+        self._index: Optional[RelationshipIndex] = None
+
+    async def get_index(self) -> RelationshipIndex:
+        """Obtém o índice, reconstruindo-o quando alguma coleção mudou."""
+        resource_types = list(self.repositories)
+        datasets = await asyncio.gather(
+            *(self.repositories[resource_type].get_dataset() for resource_type in resource_types)
+        )
+        version = tuple(dataset.version for dataset in datasets)
+
+        index = self._index
+        if index is None or index.version != version:
+            index = RelationshipIndex(dict(zip(resource_types, datasets)), version=version)
+            self._index = index
+            logger.debug("Índice de relacionamentos reconstruído")
+
+        return index
+
+    def is_loaded(self) -> bool:
+        """Indica se todas as coleções já foram carregadas neste processo."""
+        return all(repository.has_dataset() for repository in self.repositories.values())
+
+    async def get_related_ids(
+        self, source_type: str, source_id: str, target_type: str
+    ) -> List[str]:
+        """Obtém os IDs do destino relacionados a um recurso de origem.
+
+        A origem é sempre lida do seu repositório, então uma origem
+        inexistente gera ResourceNotFoundError. O índice só é consultado
+        quando todas as coleções já estão carregadas; antes disso os IDs vêm
+        do campo da própria origem, sem carregar as quatro coleções.
+        """
+        if not source_id.isdigit():
+            raise ResourceNotFoundError(source_type, source_id)
+        parent = await self.repositories[source_type].get_by_id(source_id)
+
+        if self.is_loaded():
+            index = await self.get_index()
+            return [
+                str(target_id)
+                for target_id in index.neighbors(source_type, int(source_id), target_type)
+            ]
+
+        urls = getattr(parent, RELATION_FIELDS[(source_type, target_type)]) or []
+        if isinstance(urls, str):
+            urls = [urls]
+        return [extract_id(url) for url in urls]
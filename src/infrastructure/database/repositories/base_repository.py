@@ -1,19 +1,50 @@
+import asyncio
 import logging
-from typing import List, Optional, TypeVar, Generic, Dict, Any
+import math
+import time
+from typing import List, Optional, TypeVar, Generic, Dict, Any, Tuple
 from src.domain.interfaces.repository import IRepository
 from src.domain.interfaces.client import IHttpClient
 from src.domain.interfaces.cache import ICache
 from src.config.settings import settings
-from src.config.exceptions import ResourceNotFoundError, InvalidFilterError
+from src.config.exceptions import ExternalAPIError, ResourceNotFoundError, InvalidFilterError
+from src.infrastructure.cache.keys import CacheKeyspace
+from src.infrastructure.cache.refresh import RefreshPolicy
+from src.infrastructure.database.dataset import Dataset, match_filter
+from src.infrastructure.database.entity_cache import EntityCache
+from src.infrastructure.database.relationships import (
+    RELATION_FIELDS,
+    RelationshipGraph,
+    extract_id,
+)
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Valor gravado no cache para IDs que a SWAPI respondeu com 404
+NOT_FOUND_MARKER = "__not_found__"
+NOT_FOUND = {NOT_FOUND_MARKER: True}
+
+
+def is_not_found(cached: Any) -> bool:
+    """Indica se o valor do cache registra um ID inexistente."""
+    return isinstance(cached, dict) and NOT_FOUND_MARKER in cached
+
+
+def is_upstream_not_found(error: ResourceNotFoundError) -> bool:
+    """Indica se o erro veio de um 404 da SWAPI, e não de uma falha transitória."""
+    cause = error.__cause__
+    return isinstance(cause, ExternalAPIError) and cause.status_code == 404
+
 
 class BaseRepository(IRepository[T], Generic[T]):
     """Classe base para repositórios."""
 
+    search_fields: tuple[str, ...] = ("name",)
+    indexed_fields: tuple[str, ...] = ()
+    numeric_fields: tuple[str, ...] = ()
+
     def __init__(
         self,
         http_client: IHttpClient,
@@ -25,6 +56,13 @@ class BaseRepository(IRepository[T], Generic[T]):
         self.cache = cache
         self.resource_type = resource_type
         self.entity_class = entity_class
+        self.max_concurrency = settings.SWAPI_MAX_CONCURRENCY
+        self._dataset: Optional[Dataset[T]] = None
+        self.cache_ttl = settings.get_cache_ttl(resource_type)
+        self.refresh_policy = RefreshPolicy(settings.CACHE_STALE_TTL, settings.CACHE_XFETCH_BETA)
+        self._entities: EntityCache[T] = EntityCache(self.cache_ttl)
+        self.relationships: Optional[RelationshipGraph] = None
+        self.keyspace = CacheKeyspace(namespace=settings.CACHE_NAMESPACE)
 
     def _build_url(self, path: str = "") -> str:
         """Constrói a URL para o recurso."""
@@ -33,32 +71,305 @@ class BaseRepository(IRepository[T], Generic[T]):
             return f"{base_url}/{self.resource_type}/{path}/"
         return f"{base_url}/{self.resource_type}/"
 
-    def _get_cache_key(self, *args) -> str:
-        """Gera uma chave de cache."""
-        return f"{self.resource_type}:{'_'.join(str(arg) for arg in args)}"
+    def _get_cache_key(self, kind: str, *parts: Any, generation: int = 0) -> str:
+        """Gera uma chave de cache canônica para a geração informada."""
+        return self.keyspace.key(self.resource_type, kind, *parts, generation=generation)
+
+    def _entity_tag(self, resource_id: str) -> str:
+        """Tag que agrupa as chaves derivadas de uma entidade."""
+        return f"{self.resource_type}:{resource_id}"
+
+    async def _get_generation(self) -> int:
+        """Obtém a geração atual das chaves deste recurso."""
+        return await self.keyspace.get_generation(self.resource_type)
+
+    async def _get_version(self) -> Tuple[int, int]:
+        """Obtém a versão (geração e revisão) que valida as cópias locais.
+
+        O dataset e as entidades em memória guardam a versão com que foram
+        montados e só são servidos enquanto ela for a atual; assim, uma
+        invalidação feita em outro worker também vale neste. Custa uma
+        leitura do cache por requisição, normalmente atendida pelo L1.
+        """
+        if not settings.CACHE_ENABLED:
+            return 0, 0
+        return await self.keyspace.get_version(self.resource_type)
+
+    async def invalidate(self, resource_id: Optional[str] = None) -> None:
+        """Invalida o cache de uma entidade ou, sem ID, de todo o recurso.
+
+        Uma entidade é invalidada pela sua tag, que agrupa as chaves dela, e
+        pela remoção da coleção da geração atual; o recurso inteiro,
+        passando para a próxima geração. Nos dois casos a versão do recurso
+        muda, descartando as cópias locais de todos os workers.
+        """
+        if resource_id is None:
+            await self.keyspace.bump(self.resource_type)
+        else:
+            generation = await self._get_generation()
+            await self.keyspace.invalidate_tag(self._entity_tag(resource_id))
+            await self.cache.delete(self._get_cache_key("collection", generation=generation))
+            await self.keyspace.touch(self.resource_type)
+        self._entities.clear()
+        self._dataset = None
+
+    def _validate(self, data: Dict[str, Any]) -> T:
+        """Cria uma entidade validando dados vindos da SWAPI."""
+        return self.entity_class.model_validate(data)
+
+    def _restore(self, data: Dict[str, Any]) -> T:
+        """Recria uma entidade a partir de dados já validados, sem revalidar.
+
+        Só deve receber dicionários produzidos por _serialize.
+        """
+        return self.entity_class.model_construct(**data)
+
+    @staticmethod
+    def _serialize(entity: Any) -> Dict[str, Any]:
+        """Converte uma entidade no dicionário guardado no cache compartilhado."""
+        return entity.model_dump(by_alias=True)
+
+    def _loaded_dataset(self, version: Tuple[int, int]) -> Optional[Dataset[T]]:
+        """Obtém o dataset carregado, se ele for da versão atual e estiver no TTL.
+
+        Leituras por ID não passam por get_dataset, que confere a versão da
+        coleção; sem esta verificação, um processo que só lê por ID serviria
+        para sempre a primeira coleção carregada.
+        """
+        dataset = self._dataset
+        if dataset is None or dataset.version is None:
+            return None
+        dataset_version, loaded_at = dataset.version
+        if dataset_version != version or loaded_at is None:
+            return None
+        if time.time() - loaded_at >= self.cache_ttl:
+            return None
+        return dataset
+
+    def has_dataset(self) -> bool:
+        """Indica se a coleção já foi carregada neste processo."""
+        return self._dataset is not None
+
+    def _get_local(self, resource_id: str, version: Tuple[int, int]) -> Optional[T]:
+        """Obtém uma entidade já construída na versão informada, sem I/O."""
+        dataset = self._loaded_dataset(version)
+        if dataset is not None:
+            entity = dataset.get(resource_id)
+            if entity is not None:
+                return entity
+        return self._entities.get(resource_id, version)
+
+    def _is_known_missing(self, resource_id: str, version: Tuple[int, int]) -> bool:
+        """Indica, sem I/O, que o ID não existe na coleção já carregada.
+
+        O dataset conhece o conjunto exato de IDs do recurso; antes de ele
+        ser carregado, ou depois que vence, nenhum ID é rejeitado aqui.
+        """
+        dataset = self._loaded_dataset(version)
+        return dataset is not None and len(dataset.rows_by_id) > 0 and resource_id not in dataset
 
     async def get_by_id(self, resource_id: str) -> Optional[T]:
-        """Obtém um recurso pelo ID."""
-        cache_key = self._get_cache_key("by_id", resource_id)
+        """Obtém um recurso pelo ID.
+
+        IDs fora da coleção carregada são rejeitados sem I/O, e IDs que a
+        SWAPI respondeu com 404 ficam registrados no cache por
+        CACHE_NEGATIVE_TTL segundos.
+        """
+        version = await self._get_version()
+        entity = self._get_local(resource_id, version)
+        if entity is not None:
+            return entity
+        if self._is_known_missing(resource_id, version):
+            raise ResourceNotFoundError(self.resource_type, resource_id)
 
         if settings.CACHE_ENABLED:
+            cache_key = self._get_cache_key("by_id", resource_id, generation=version[0])
             cached = await self.cache.get(cache_key)
+            if is_not_found(cached):
+                logger.debug(f"Cache negativo para {cache_key}")
+                raise ResourceNotFoundError(self.resource_type, resource_id)
             if cached:
                 logger.debug(f"Cache hit para {cache_key}")
-                return self.entity_class(**cached)
+                data = self._unwrap(cache_key, cached, resource_id, version)
+                entity = self._restore(data)
+                self._entities.set(resource_id, entity, version)
+                return entity
+
+        return await self._fetch_by_id(resource_id, version)
+
+    def _unwrap(
+        self, cache_key: str, cached: Any, resource_id: str, version: Tuple[int, int]
+    ) -> Any:
+        """Extrai um valor do cache, agendando a renovação se estiver vencendo."""
+        data, needs_refresh = self.refresh_policy.unwrap(cached)
+        if needs_refresh:
+            self.refresh_policy.refresh(cache_key, lambda: self._fetch_by_id(resource_id, version))
+        return data
+
+    async def get_many(self, resource_ids: List[str]) -> List[T]:
+        """Obtém vários recursos pelos IDs, preservando a ordem.
+
+        Entidades já presentes no dataset carregado ou no cache local são
+        lidas em memória; o cache é consultado em lote e os IDs ausentes são buscados
+        concorrentemente, limitados por max_concurrency. IDs não
+        encontrados são ignorados.
+        """
+        unique_ids = list(dict.fromkeys(resource_ids))
+        entities: Dict[str, T] = {}
+        version = await self._get_version()
+        generation = version[0]
+
+        for resource_id in unique_ids:
+            entity = self._get_local(resource_id, version)
+            if entity is not None:
+                entities[resource_id] = entity
+
+        missing_ids = [
+            resource_id
+            for resource_id in unique_ids
+            if resource_id not in entities and not self._is_known_missing(resource_id, version)
+        ]
+        absent_ids = set()
+
+        if settings.CACHE_ENABLED and missing_ids:
+            cache_keys = [
+                self._get_cache_key("by_id", resource_id, generation=generation)
+                for resource_id in missing_ids
+            ]
+            cached_items = await self.cache.get_many(cache_keys)
+            for resource_id, cache_key, cached in zip(missing_ids, cache_keys, cached_items):
+                if is_not_found(cached):
+                    absent_ids.add(resource_id)
+                elif cached:
+                    data = self._unwrap(cache_key, cached, resource_id, version)
+                    entity = self._restore(data)
+                    self._entities.set(resource_id, entity, version)
+                    entities[resource_id] = entity
+
+        missing_ids = [
+            resource_id
+            for resource_id in missing_ids
+            if resource_id not in entities and resource_id not in absent_ids
+        ]
+        if missing_ids:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def fetch(resource_id: str) -> T:
+                async with semaphore:
+                    return await self._fetch_entity(resource_id, version)
+
+            started = time.monotonic()
+            results = await asyncio.gather(
+                *(fetch(resource_id) for resource_id in missing_ids),
+                return_exceptions=True,
+            )
+            delta = (time.monotonic() - started) / len(missing_ids)
+            fetched: Dict[str, Any] = {}
+            not_found: List[str] = []
+            tags: Dict[str, List[str]] = {}
+            for resource_id, result in zip(missing_ids, results):
+                if isinstance(result, ResourceNotFoundError):
+                    if is_upstream_not_found(result):
+                        not_found.append(resource_id)
+                    continue
+                if isinstance(result, BaseException):
+                    raise result
+                entities[resource_id] = result
+                cache_key = self._get_cache_key("by_id", resource_id, generation=generation)
+                fetched[cache_key] = self.refresh_policy.wrap(
+                    self._serialize(result), self.cache_ttl, delta
+                )
+                tags[self._entity_tag(resource_id)] = [cache_key]
 
+            if settings.CACHE_ENABLED and fetched:
+                await self.cache.set_many(fetched, self.refresh_policy.storage_ttl(self.cache_ttl))
+                await self.keyspace.tag(tags, self.cache_ttl)
+            if settings.CACHE_ENABLED and not_found:
+                await self._store_not_found(not_found, generation)
+
+        return [entities[resource_id] for resource_id in resource_ids if resource_id in entities]
+
+    async def get_related_ids(self, source_type: str, source_id: str) -> List[str]:
+        """Obtém os IDs deste recurso relacionados a um recurso de outro tipo.
+
+        Usa o grafo de relacionamentos quando disponível; sem ele, busca o
+        recurso de origem na SWAPI e lê as URLs do campo correspondente. Uma
+        origem inexistente gera ResourceNotFoundError.
+        """
+        if self.relationships is not None:
+            return await self.relationships.get_related_ids(
+                source_type, source_id, self.resource_type
+            )
+
+        field = RELATION_FIELDS[(source_type, self.resource_type)]
         try:
-            url = self._build_url(resource_id)
-            data = await self.http_client.get(url)
-            entity = self.entity_class(**data)
+            parent = await self.http_client.get(
+                f"{settings.SWAPI_BASE_URL}/{source_type}/{source_id}/"
+            )
+        except ExternalAPIError as e:
+            if e.status_code == 404:
+                raise ResourceNotFoundError(source_type, source_id) from e
+            raise
+        urls = parent.get(field) or []
+        if isinstance(urls, str):
+            urls = [urls]
+        return [extract_id(url) for url in urls]
+
+    async def _fetch_by_id(self, resource_id: str, version: Tuple[int, int] = (0, 0)) -> T:
+        """Busca um recurso na SWAPI e o armazena no cache."""
+        generation = version[0]
+        started = time.monotonic()
+        try:
+            entity = await self._fetch_entity(resource_id, version)
+        except ResourceNotFoundError as e:
+            if settings.CACHE_ENABLED and is_upstream_not_found(e):
+                await self._store_not_found([resource_id], generation)
+            raise
+        delta = time.monotonic() - started
 
-            if settings.CACHE_ENABLED:
-                await self.cache.set(cache_key, data, settings.CACHE_TTL)
+        if settings.CACHE_ENABLED:
+            cache_key = self._get_cache_key("by_id", resource_id, generation=generation)
+            try:
+                await self.cache.set(
+                    cache_key,
+                    self.refresh_policy.wrap(self._serialize(entity), self.cache_ttl, delta),
+                    self.refresh_policy.storage_ttl(self.cache_ttl),
+                )
+                await self.keyspace.tag(
+                    {self._entity_tag(resource_id): [cache_key]}, self.cache_ttl
+                )
+            except Exception as e:
+                logger.error(f"Erro ao armazenar {cache_key} no cache: {str(e)}")
 
-            return entity
+        return entity
+
+    async def _store_not_found(self, resource_ids: List[str], generation: int) -> None:
+        """Registra no cache, com TTL curto, IDs que a SWAPI respondeu com 404.
+
+        O registro não recebe tags: ele expira sozinho em CACHE_NEGATIVE_TTL
+        segundos ou com a próxima geração do recurso.
+        """
+        items = {
+            self._get_cache_key("by_id", resource_id, generation=generation): NOT_FOUND
+            for resource_id in resource_ids
+        }
+        try:
+            await self.cache.set_many(items, settings.CACHE_NEGATIVE_TTL)
+        except Exception as e:
+            logger.error(f"Erro ao registrar {len(items)} IDs inexistentes no cache: {str(e)}")
+
+    async def _fetch_entity(self, resource_id: str, version: Tuple[int, int] = (0, 0)) -> T:
+        """Busca e valida um recurso na SWAPI, guardando-o no cache local."""
+        try:
+            url = self._build_url(resource_id)
+            data = await self.http_client.get(url)
+            entity = self._validate(data)
         except Exception as e:
             logger.error(f"Erro ao obter {self.resource_type} com ID {resource_id}: {str(e)}")
-            raise ResourceNotFoundError(self.resource_type, resource_id)
+            raise ResourceNotFoundError(self.resource_type, resource_id) from e
+
+        self._entities.set(resource_id, entity, version)
+        return entity
 
     async def get_all(
         self,
@@ -68,77 +379,28 @@ class BaseRepository(IRepository[T], Generic[T]):
         sort_by: Optional[str] = None,
         sort_order: str = "asc",
     ) -> tuple[List[T], int]:
-        """Obtém todos os recursos com paginação, filtros e ordenação."""
-        cache_key = self._get_cache_key(
-            "all",
-            page,
-            page_size,
-            str(filters),
-            sort_by,
-            sort_order,
-        )
-
-        if settings.CACHE_ENABLED:
-            cached = await self.cache.get(cache_key)
-            if cached:
-                logger.debug(f"Cache hit para {cache_key}")
-                entities = [self.entity_class(**item) for item in cached["items"]]
-                return entities, cached["total"]
+        """Obtém todos os recursos com paginação, filtros e ordenação.
 
+        A coleção completa é carregada uma vez e filtrada, ordenada e
+        paginada sobre o dataset indexado em memória.
+        """
         try:
-            url = self._build_url()
-            params = {"page": page}
-
-            data = await self.http_client.get(url)
-            results = data.get("results", [])
-            total = data.get("count", 0)
-
-            entities = [self.entity_class(**item) for item in results]
-
-            if sort_by:
-                entities = self._sort_entities(entities, sort_by, sort_order)
-
-            if filters:
-                entities = self._filter_entities(entities, filters)
-
-            if settings.CACHE_ENABLED:
-                cache_data = {
-                    "items": [entity.dict() for entity in entities],
-                    "total": total,
-                }
-                await self.cache.set(cache_key, cache_data, settings.CACHE_TTL)
+            dataset = await self.get_dataset()
+            rows = dataset.query(filters, sort_by, sort_order)
 
-            return entities, total
+            start = (page - 1) * page_size
+            return dataset.select(rows[start : start + page_size]), len(rows)
+        except InvalidFilterError:
+            raise
         except Exception as e:
             logger.error(f"Erro ao obter todos os {self.resource_type}: {str(e)}")
             return [], 0
 
     async def search(self, query: str) -> List[T]:
         """Busca recursos por query."""
-        cache_key = self._get_cache_key("search", query)
-
-        if settings.CACHE_ENABLED:
-            cached = await self.cache.get(cache_key)
-            if cached:
-                logger.debug(f"Cache hit para {cache_key}")
-                return [self.entity_class(**item) for item in cached]
-
         try:
-            url = self._build_url()
-            params = {"search": query}
-
-            data = await self.http_client.get(url)
-            results = data.get("results", [])
-            entities = [self.entity_class(**item) for item in results]
-
-            if settings.CACHE_ENABLED:
-                await self.cache.set(
-                    cache_key,
-                    [entity.dict() for entity in entities],
-                    settings.CACHE_TTL,
-                )
-
-            return entities
+            dataset = await self.get_dataset()
+            return dataset.select(dataset.search(query, self.search_fields))
         except Exception as e:
             logger.error(f"Erro ao buscar {self.resource_type} com query '{query}': {str(e)}")
             return []
@@ -146,59 +408,136 @@ class BaseRepository(IRepository[T], Generic[T]):
     async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """Conta o número de recursos."""
         try:
-            url = self._build_url()
-            data = await self.http_client.get(url)
-            return data.get("count", 0)
+            if filters:
+                dataset = await self.get_dataset()
+                return len(dataset.filter(filters))
+
+            collection = await self._load_collection()
+            return collection["count"]
         except Exception as e:
             logger.error(f"Erro ao contar {self.resource_type}: {str(e)}")
             return 0
 
-    def _filter_entities(
-        self, entities: List[T], filters: Dict[str, Any]
-    ) -> List[T]:
-        """Filtra entidades baseado em critérios."""
-        filtered = entities
+    async def get_collection(self) -> List[T]:
+        """Obtém a coleção completa do recurso."""
+        dataset = await self.get_dataset()
+        return list(dataset.entities)
+
+    async def get_dataset(self) -> Dataset[T]:
+        """Obtém o dataset indexado da coleção, reconstruindo-o se ela mudou.
+
+        O novo dataset é montado por completo antes de substituir o anterior,
+        então leituras concorrentes nunca veem um índice parcial.
+        """
+        current = await self._get_version()
+        collection = await self._load_collection(current[0])
+        dataset = self._dataset
+        version = (current, collection.get("loaded_at"))
+
+        if dataset is None or dataset.version != version:
+            entities = [self._restore(item) for item in collection["items"]]
+            dataset = Dataset(
+                entities,
+                fields=self.entity_class.model_fields.keys(),
+                indexed_fields=self.indexed_fields,
+                numeric_fields=self.numeric_fields,
+                version=version,
+            )
+            self._dataset = dataset
+            logger.debug(f"Dataset de {self.resource_type} reconstruído: {len(dataset)} itens")
+
+        return dataset
+
+    async def _load_collection(self, generation: Optional[int] = None) -> Dict[str, Any]:
+        """Carrega a coleção completa do cache ou da SWAPI.
+
+        Uma coleção vencida (ou perto de vencer) continua sendo servida
+        enquanto outra é montada em segundo plano; só a ausência total da
+        chave faz a requisição esperar pela SWAPI.
+        """
+        if not settings.CACHE_ENABLED:
+            return await self._crawl_collection()
+
+        if generation is None:
+            generation = await self._get_generation()
+        cache_key = self._get_cache_key("collection", generation=generation)
+        cached = await self.cache.get(cache_key)
+        if cached:
+            logger.debug(f"Cache hit para {cache_key}")
+            collection, needs_refresh = self.refresh_policy.unwrap(cached)
+            if needs_refresh:
+                self.refresh_policy.refresh(cache_key, lambda: self._store_collection(cache_key))
+            return collection
+
+        return await self.refresh_policy.load(cache_key, lambda: self._store_collection(cache_key))
+
+    async def _store_collection(self, cache_key: str) -> Dict[str, Any]:
+        """Percorre a SWAPI e grava a coleção no cache.
+
+        A coleção não recebe tags: ela muda de chave com a geração do
+        recurso, e invalidate() a remove quando uma entidade é invalidada.
+        """
+        started = time.monotonic()
+        collection = await self._crawl_collection()
+        delta = time.monotonic() - started
+
+        await self.cache.set(
+            cache_key,
+            self.refresh_policy.wrap(collection, self.cache_ttl, delta),
+            self.refresh_policy.storage_ttl(self.cache_ttl),
+        )
+        return collection
 
-        for field, value in filters.items():
-            if not hasattr(filtered[0] if filtered else None, field):
-                raise InvalidFilterError(field, f"Campo '{field}' não existe")
+    async def _crawl_collection(self) -> Dict[str, Any]:
+        """Percorre todas as páginas da SWAPI para montar a coleção.
 
-            filtered = [
-                entity
-                for entity in filtered
-                if self._match_filter(getattr(entity, field), value)
-            ]
+        A primeira página informa o total de itens; as demais são buscadas
+        concorrentemente, limitadas por max_concurrency.
+        """
+        url = self._build_url()
+        first_page = await self.http_client.get(url)
+        items = list(first_page.get("results", []))
+        total = first_page.get("count", len(items))
+
+        if first_page.get("next") and items:
+            page_count = math.ceil(total / len(items))
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def fetch_page(page: int) -> List[Dict[str, Any]]:
+                async with semaphore:
+                    data = await self.http_client.get(f"{url}?page={page}")
+                    return data.get("results", [])
+
+            pages = await asyncio.gather(*(fetch_page(page) for page in range(2, page_count + 1)))
+            for results in pages:
+                items.extend(results)
 
-        return filtered
+        items = [self._serialize(self._validate(item)) for item in items]
+        logger.info(f"Coleção de {self.resource_type} carregada: {len(items)} itens")
+        return {"count": total, "items": items, "loaded_at": time.time()}
+
+    def _filter_entities(self, entities: List[T], filters: Dict[str, Any]) -> List[T]:
+        """Filtra entidades baseado em critérios."""
+        dataset = self._build_dataset(entities)
+        return dataset.select(dataset.filter(filters))
 
     def _match_filter(self, field_value: Any, filter_value: Any) -> bool:
         """Verifica se um valor corresponde ao filtro."""
-        if isinstance(filter_value, dict):
-            operator = filter_value.get("operator", "eq")
-            value = filter_value.get("value")
-
-            if operator == "eq":
-                return field_value == value
-            elif operator == "ne":
-                return field_value != value
-            elif operator == "contains":
-                return str(value).lower() in str(field_value).lower()
-            elif operator == "in":
-                return field_value in value
-            else:
-                return False
-
-        return field_value == filter_value
-
-    def _sort_entities(
-        self, entities: List[T], sort_by: str, sort_order: str = "asc"
-    ) -> List[T]:
+        return match_filter(field_value, filter_value)
+
+    def _sort_entities(self, entities: List[T], sort_by: str, sort_order: str = "asc") -> List[T]:
         """Ordena entidades."""
         if not entities:
             return entities
 
-        if not hasattr(entities[0], sort_by):
-            raise InvalidFilterError(sort_by, f"Campo '{sort_by}' não existe")
+        dataset = self._build_dataset(entities)
+        return dataset.select(dataset.sort(None, sort_by, sort_order))
 
-        reverse = sort_order.lower() == "desc"
-        return sorted(entities, key=lambda x: getattr(x, sort_by), reverse=reverse)
+    def _build_dataset(self, entities: List[T]) -> Dataset[T]:
+        """Cria um dataset avulso para uma lista de entidades."""
+        return Dataset(
+            entities,
+            fields=self.entity_class.model_fields.keys(),
+            indexed_fields=self.indexed_fields,
+            numeric_fields=self.numeric_fields,
+        )
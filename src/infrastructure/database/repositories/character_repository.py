@@ -7,6 +7,9 @@ from src.domain.interfaces.cache import ICache
 class CharacterRepository(BaseRepository[Character]):
     """Repositório para personagens."""
 
+    indexed_fields = ("gender", "eye_color", "hair_color", "skin_color", "homeworld")
+    numeric_fields = ("height", "mass")
+
     def __init__(self, http_client: IHttpClient, cache: ICache):
         super().__init__(
             http_client=http_client,
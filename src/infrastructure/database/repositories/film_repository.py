@@ -7,6 +7,10 @@ from src.domain.interfaces.cache import ICache
 class FilmRepository(BaseRepository[Film]):
     """Repositório para filmes."""
 
+    search_fields = ("title",)
+    indexed_fields = ("director", "producer")
+    numeric_fields = ("episode_id",)
+
     def __init__(self, http_client: IHttpClient, cache: ICache):
         super().__init__(
             http_client=http_client,
@@ -7,6 +7,15 @@ from src.domain.interfaces.cache import ICache
 class PlanetRepository(BaseRepository[Planet]):
     """Repositório para planetas."""
 
+    indexed_fields = ("climate", "terrain", "gravity")
+    numeric_fields = (
+        "rotation_period",
+        "orbital_period",
+        "diameter",
+        "surface_water",
+        "population",
+    )
+
     def __init__(self, http_client: IHttpClient, cache: ICache):
         super().__init__(
             http_client=http_client,
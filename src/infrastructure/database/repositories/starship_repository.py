@@ -7,6 +7,19 @@ from src.domain.interfaces.cache import ICache
 class StarshipRepository(BaseRepository[Starship]):
     """Repositório para naves estelares."""
 
+    search_fields = ("name", "model")
+    indexed_fields = ("starship_class", "manufacturer")
+    numeric_fields = (
+        "cost_in_credits",
+        "length",
+        "max_atmosphering_speed",
+        "crew",
+        "passengers",
+        "cargo_capacity",
+        "hyperdrive_rating",
+        "mglt",
+    )
+
     def __init__(self, http_client: IHttpClient, cache: ICache):
         super().__init__(
             http_client=http_client,
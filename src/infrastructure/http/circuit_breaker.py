@@ -0,0 +1,96 @@
+import logging
+import time
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Disjuntor que interrompe chamadas a um serviço que está falhando.
+
+    Fechado, deixa tudo passar e conta falhas consecutivas; ao atingir
+    failure_threshold, abre e passa a recusar chamadas imediatamente. Depois
+    de recovery_timeout segundos fica semiaberto e libera até
+    half_open_max_calls chamadas de teste: um sucesso fecha o circuito, uma
+    falha o reabre.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.trial_calls = 0
+        self.opens = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        """Estado atual, passando de aberto a semiaberto quando o prazo vence."""
+        if self._state == OPEN and time.monotonic() - self.opened_at >= self.recovery_timeout:
+            self._state = HALF_OPEN
+            self.trial_calls = 0
+            logger.info(f"Circuito {self.name} semiaberto")
+        return self._state
+
+    def allow(self) -> bool:
+        """Indica se uma chamada pode ser feita agora."""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and self.trial_calls < self.half_open_max_calls:
+            self.trial_calls += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def cancel(self) -> None:
+        """Devolve a permissão de uma chamada liberada que não chegou a ser feita."""
+        if self._state == HALF_OPEN and self.trial_calls > 0:
+            self.trial_calls -= 1
+
+    def record_success(self) -> None:
+        """Registra uma chamada bem-sucedida."""
+        if self._state != CLOSED:
+            logger.info(f"Circuito {self.name} fechado")
+        self._state = CLOSED
+        self.consecutive_failures = 0
+        self.trial_calls = 0
+
+    def record_failure(self) -> None:
+        """Registra uma falha, abrindo o circuito se necessário."""
+        self.consecutive_failures += 1
+        if self._state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self._open()
+
+    def _open(self) -> None:
+        if self._state != OPEN:
+            self.opens += 1
+            logger.warning(
+                f"Circuito {self.name} aberto após {self.consecutive_failures} falhas consecutivas"
+            )
+        self._state = OPEN
+        self.opened_at = time.monotonic()
+        self.trial_calls = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna o estado e os contadores do disjuntor."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "opens": self.opens,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,163 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ConcurrencyLimitExceeded(Exception):
+    """A requisição foi descartada: fila cheia ou espera longa demais."""
+
+
+class AIMDLimiter:
+    """Limite adaptativo de requisições simultâneas (AIMD).
+
+    Cada sucesso com o limite em uso aumenta o limite em 1/limite (cerca de
+    +1 por janela completa); cada queda o multiplica por backoff_ratio. Uma
+    queda é um erro de sobrecarga informado pelo chamador (timeout, 429,
+    503...) ou uma alta sustentada de latência: a média móvel curta (cerca
+    das últimas 10 respostas) acima de latency_tolerance vezes a média
+    móvel longa (cerca das últimas 100). Comparar médias, e não a menor
+    latência já vista, evita tratar a variação normal do servidor como
+    congestionamento; depois de uma queda por latência, a próxima só conta
+    após uma janela completa de respostas.
+
+    Acima do limite as requisições esperam numa fila FIFO; com max_queue
+    requisições esperando, ou após queue_timeout segundos na fila, a
+    requisição é descartada com ConcurrencyLimitExceeded.
+    """
+
+    SHORT_WEIGHT = 0.2
+    LONG_WEIGHT = 0.02
+    MIN_SAMPLES = 20
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        backoff_ratio: float = 0.9,
+        latency_tolerance: float = 3.0,
+        max_queue: int = 200,
+        queue_timeout: float = 5.0,
+    ):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.baseline: Optional[float] = None
+        self.recent: Optional[float] = None
+        self.samples = 0
+        self._cooldown = 0
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self.queued = 0
+        self.shed = 0
+        self.drops = 0
+
+    async def acquire(self) -> None:
+        """Ocupa uma vaga, esperando na fila se o limite foi atingido."""
+        if self.try_acquire():
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            self.shed += 1
+            raise ConcurrencyLimitExceeded(f"Fila de {self.max_queue} requisições cheia")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.queued += 1
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._abandon(waiter)
+            self.shed += 1
+            raise ConcurrencyLimitExceeded(f"Sem vaga após {self.queue_timeout}s na fila")
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+
+    def has_room(self) -> bool:
+        """Indica se há vaga livre sem precisar entrar na fila."""
+        return self.in_flight < int(self.limit) and not self._waiters
+
+    def try_acquire(self) -> bool:
+        """Ocupa uma vaga livre sem entrar na fila; indica se conseguiu."""
+        if self.has_room():
+            self.in_flight += 1
+            return True
+        return False
+
+    def _abandon(self, waiter: asyncio.Future) -> None:
+        """Tira da fila quem desistiu, devolvendo a vaga se ela já tinha sido cedida."""
+        if waiter.done() and not waiter.cancelled():
+            self._release_slot()
+        else:
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                pass
+
+    def release(self, latency: float, dropped: bool = False) -> None:
+        """Libera a vaga e ajusta o limite com o resultado da requisição."""
+        if not dropped:
+            dropped = self._observe(latency)
+
+        if dropped:
+            self.drops += 1
+            self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+        elif self.in_flight >= self.limit / 2:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+        self._release_slot()
+
+    def cancel(self) -> None:
+        """Libera a vaga de uma requisição cancelada, sem ajustar o limite."""
+        self._release_slot()
+
+    def _observe(self, latency: float) -> bool:
+        """Atualiza as médias de latência e indica se houve alta sustentada."""
+        self.samples += 1
+        # Nas primeiras amostras as médias são simples, sem peso da primeira
+        long_weight = max(self.LONG_WEIGHT, 1 / self.samples)
+        short_weight = max(self.SHORT_WEIGHT, 1 / self.samples)
+        if self.baseline is None or self.recent is None:
+            self.baseline = self.recent = latency
+        else:
+            self.baseline += (latency - self.baseline) * long_weight
+            self.recent += (latency - self.recent) * short_weight
+
+        if self._cooldown > 0:
+            self._cooldown -= 1
+            return False
+        if self.samples < self.MIN_SAMPLES:
+            return False
+        if self.recent <= self.baseline * self.latency_tolerance:
+            return False
+        self._cooldown = int(self.limit)
+        return True
+
+    def _release_slot(self) -> None:
+        self.in_flight -= 1
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                self.in_flight += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna o limite atual, a ocupação e os contadores."""
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "baseline_latency": self.baseline,
+            "recent_latency": self.recent,
+            "queued": self.queued,
+            "shed": self.shed,
+            "drops": self.drops,
+        }
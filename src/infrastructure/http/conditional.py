@@ -0,0 +1,98 @@
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class StoredResponse(NamedTuple):
+    """Corpo já decodificado de uma resposta e os validadores que vieram com ele."""
+
+    data: Any
+    digest: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+class ConditionalCache:
+    """Guarda validadores de respostas para revalidação condicional.
+
+    Para cada URL recente mantém o ETag, o Last-Modified, um hash do corpo e
+    o JSON já decodificado. A requisição seguinte à mesma URL envia
+    If-None-Match/If-Modified-Since; um 304 devolve o corpo guardado sem
+    baixá-lo nem decodificá-lo de novo. Sem validadores do servidor, o hash
+    ainda evita decodificar um corpo idêntico ao anterior.
+
+    Limitado a max_entries URLs, descartando as usadas há mais tempo. Os
+    dados devolvidos são compartilhados e não devem ser modificados.
+    """
+
+    def __init__(self, max_entries: int = 2000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, StoredResponse]" = OrderedDict()
+        self.revalidations = 0
+        self.not_modified = 0
+        self.unchanged_bodies = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: str) -> Optional[StoredResponse]:
+        """Obtém a última resposta guardada para a chave."""
+        return self._entries.get(key)
+
+    def conditional_headers(
+        self, entry: Optional[StoredResponse], headers: Optional[Dict[str, str]]
+    ) -> Optional[Dict[str, str]]:
+        """Acrescenta os cabeçalhos condicionais da resposta guardada."""
+        if entry is None or (entry.etag is None and entry.last_modified is None):
+            return headers
+
+        conditional = dict(headers or {})
+        if entry.etag is not None:
+            conditional["If-None-Match"] = entry.etag
+        if entry.last_modified is not None:
+            conditional["If-Modified-Since"] = entry.last_modified
+        self.revalidations += 1
+        return conditional
+
+    def not_modified_data(self, key: str, entry: StoredResponse) -> Any:
+        """Corpo guardado a devolver para uma resposta 304."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        self.not_modified += 1
+        return entry.data
+
+    def load(self, key: str, response: httpx.Response) -> Any:
+        """Decodifica uma resposta 200 e guarda seus validadores."""
+        content = response.content
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        entry = self._entries.get(key)
+        if entry is not None and entry.digest == digest:
+            self.unchanged_bodies += 1
+            data = entry.data
+        else:
+            data = response.json()
+
+        self._entries[key] = StoredResponse(
+            data,
+            digest,
+            response.headers.get("etag"),
+            response.headers.get("last-modified"),
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return data
+
+    def get_stats(self) -> Dict[str, int]:
+        """Retorna os contadores de revalidação."""
+        return {
+            "entries": len(self._entries),
+            "revalidations": self.revalidations,
+            "not_modified": self.not_modified,
+            "unchanged_bodies": self.unchanged_bodies,
+        }
@@ -0,0 +1,149 @@
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyTracker:
+    """Janela deslizante das latências mais recentes.
+
+    O quantil é recalculado a cada recompute_every observações, e não a
+    cada consulta, para não ordenar a janela em toda requisição.
+    """
+
+    def __init__(self, window: int = 512, min_samples: int = 20, recompute_every: int = 32):
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.min_samples = min_samples
+        self.recompute_every = recompute_every
+        self._since_recompute = 0
+        self._quantiles: Dict[float, float] = {}
+
+    def observe(self, seconds: float) -> None:
+        """Registra a latência de uma requisição bem-sucedida."""
+        self.samples.append(seconds)
+        self._since_recompute += 1
+        if self._since_recompute >= self.recompute_every:
+            self._quantiles.clear()
+            self._since_recompute = 0
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Quantil q das latências da janela, ou None com poucas amostras."""
+        if len(self.samples) < self.min_samples:
+            return None
+        value = self._quantiles.get(q)
+        if value is None:
+            ordered = sorted(self.samples)
+            value = ordered[min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1)]
+            self._quantiles[q] = value
+        return value
+
+
+class HedgePolicy:
+    """Requisições "hedged": uma segunda cópia se a primeira demorar.
+
+    Se a primeira tentativa não responder dentro do quantil de latência
+    aprendido (p95 por padrão), uma cópia idêntica é disparada; vale a
+    primeira resposta bem-sucedida e a outra é cancelada. Só faz sentido
+    para requisições idempotentes.
+
+    O orçamento limita as cópias a uma fração (budget) das chamadas: cada
+    chamada acumula budget fichas, até max_tokens, e cada cópia gasta uma.
+    Assim, quando o servidor inteiro fica lento, as cópias param em vez de
+    dobrar a carga sobre ele. Com admit, a cópia também só sai se admit()
+    permitir (por exemplo, se houver vaga no limitador de concorrência).
+    """
+
+    def __init__(
+        self,
+        quantile: float = 0.95,
+        budget: float = 0.1,
+        min_delay: float = 0.05,
+        max_tokens: float = 10.0,
+        tracker: Optional[LatencyTracker] = None,
+    ):
+        self.quantile = quantile
+        self.budget = budget
+        self.min_delay = min_delay
+        self.max_tokens = max_tokens
+        self.tracker = tracker or LatencyTracker()
+        self.tokens = 0.0
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.over_budget = 0
+        self.denied = 0
+
+    def delay(self) -> Optional[float]:
+        """Quanto esperar pela primeira tentativa antes de disparar a cópia."""
+        value = self.tracker.quantile(self.quantile)
+        return None if value is None else max(value, self.min_delay)
+
+    def _acquire(self, admit: Optional[Callable[[], bool]]) -> bool:
+        if self.tokens < 1:
+            self.over_budget += 1
+            return False
+        if admit is not None and not admit():
+            self.denied += 1
+            return False
+        self.tokens -= 1
+        return True
+
+    async def run(
+        self,
+        func: Callable[[], Awaitable[Any]],
+        copy: Optional[Callable[[], Awaitable[Any]]] = None,
+        admit: Optional[Callable[[], bool]] = None,
+    ) -> Any:
+        """Executa func, disparando uma cópia (copy, ou func) se a primeira demorar."""
+        self.calls += 1
+        self.tokens = min(self.max_tokens, self.tokens + self.budget)
+        delay = self.delay()
+
+        started = time.monotonic()
+        primary = asyncio.ensure_future(func())
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done or not self._acquire(admit):
+                result = await primary
+                self.tracker.observe(time.monotonic() - started)
+                return result
+
+            self.hedged += 1
+            hedge_started = time.monotonic()
+            hedge = asyncio.ensure_future((copy or func)())
+            pending.add(hedge)
+            logger.debug(f"Requisição lenta (> {delay:.3f}s); disparando cópia")
+
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.hedge_wins += 1
+                            self.tracker.observe(time.monotonic() - hedge_started)
+                        else:
+                            self.tracker.observe(time.monotonic() - started)
+                        return task.result()
+                    # Se as duas falharem, vale o erro da primeira tentativa
+                    error = task.exception() if task is primary else error or task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna os contadores de cópias e o atraso atual."""
+        return {
+            "calls": self.calls,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "over_budget": self.over_budget,
+            "denied": self.denied,
+            "delay": self.delay(),
+        }
@@ -0,0 +1,41 @@
+import random
+from typing import Optional
+
+import httpx
+
+# Respostas que indicam sobrecarga ou falha transitória do servidor
+RETRYABLE_STATUS = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+class RetryPolicy:
+    """Política de novas tentativas com backoff exponencial e jitter.
+
+    Só falhas transitórias (timeouts, erros de conexão e os status de
+    RETRYABLE_STATUS) são repetidas. A espera antes da n-ésima repetição é
+    sorteada entre 0 e min(max_delay, base_delay * 2**(n-1)) ("full jitter"),
+    espalhando as tentativas de clientes que falharam juntos. Todas as
+    tentativas de uma requisição precisam caber em deadline segundos.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.2,
+        max_delay: float = 2.0,
+        deadline: Optional[float] = 20.0,
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+
+    @staticmethod
+    def is_retryable(error: Exception) -> bool:
+        """Indica se a falha é transitória e a requisição pode ser repetida."""
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in RETRYABLE_STATUS
+        return isinstance(error, (httpx.TimeoutException, httpx.TransportError))
+
+    def backoff(self, retry: int) -> float:
+        """Espera, em segundos, antes da repetição de número retry (a partir de 1)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (retry - 1)))
@@ -0,0 +1,59 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """Agrupa chamadas concorrentes com a mesma chave em uma única execução.
+
+    Enquanto a primeira chamada de uma chave está em andamento, as demais
+    aguardam o mesmo resultado em vez de disparar novas requisições. O
+    resultado é compartilhado entre todos os chamadores e não deve ser
+    modificado.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.requests = 0
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Executa a função ou aguarda a execução em andamento para a chave."""
+        self.requests += 1
+        task = self._inflight.get(key)
+
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._release(key, done))
+        else:
+            self.coalesced += 1
+            logger.debug(f"Requisição agrupada: {key}")
+
+        # shield evita que o cancelamento de um chamador cancele os demais
+        return await asyncio.shield(task)
+
+    def in_flight(self, key: str) -> bool:
+        """Indica se há uma execução em andamento para a chave."""
+        return key in self._inflight
+
+    def _release(self, key: str, task: asyncio.Task) -> None:
+        """Remove a execução concluída do registro de chamadas em andamento."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Marca a exceção como recuperada caso todos os chamadores tenham desistido
+            task.exception()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Retorna os contadores de agrupamento."""
+        return {
+            "requests": self.requests,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight),
+        }
@@ -1,20 +1,121 @@
+import asyncio
 import httpx
 import logging
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
 from src.domain.interfaces.client import IHttpClient
+from src.infrastructure.http.circuit_breaker import CircuitBreaker
+from src.infrastructure.http.concurrency_limiter import AIMDLimiter, ConcurrencyLimitExceeded
+from src.infrastructure.http.conditional import ConditionalCache
+from src.infrastructure.http.hedging import HedgePolicy
+from src.infrastructure.http.retry import RETRYABLE_STATUS, RetryPolicy
+from src.infrastructure.http.single_flight import SingleFlight
 from src.config.settings import settings
 from src.config.exceptions import ExternalAPIError
 
+try:
+    import h2  # noqa: F401
+except ImportError:  # pragma: no cover - depende do ambiente
+    h2 = None
+
 logger = logging.getLogger(__name__)
 
 
+def create_limits() -> httpx.Limits:
+    """Limites do pool de conexões definidos nas configurações."""
+    return httpx.Limits(
+        max_connections=settings.SWAPI_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.SWAPI_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.SWAPI_KEEPALIVE_EXPIRY,
+    )
+
+
+def create_timeouts(timeout: float) -> httpx.Timeout:
+    """Timeouts por fase (conexão, leitura, espera no pool) das configurações."""
+    return httpx.Timeout(
+        timeout,
+        connect=settings.SWAPI_CONNECT_TIMEOUT,
+        read=settings.SWAPI_READ_TIMEOUT,
+        pool=settings.SWAPI_POOL_TIMEOUT,
+    )
+
+
 class SwapiClient(IHttpClient):
-    """Cliente HTTP para a API SWAPI."""
+    """Cliente HTTP para a API SWAPI.
+
+    Falhas transitórias são repetidas conforme a retry_policy, e cada host
+    tem um disjuntor que recusa chamadas enquanto ele estiver falhando;
+    nesse intervalo o repositório continua servindo os dados vencidos que
+    tiver em cache.
 
-    def __init__(self, base_url: str = settings.SWAPI_BASE_URL, timeout: int = settings.SWAPI_TIMEOUT):
+    Respostas recentes têm seus validadores (ETag/Last-Modified) guardados;
+    buscar a mesma URL de novo vira um GET condicional, e um 304 reaproveita
+    o corpo já decodificado.
+
+    Com hedge_policy (ou SWAPI_HEDGE_ENABLED), uma tentativa que demore mais
+    que o quantil de latência recente ganha uma cópia concorrente.
+
+    O número de tentativas simultâneas é limitado por um AIMDLimiter, que
+    ajusta o limite pela latência e pelos erros de sobrecarga observados e
+    enfileira ou descarta o excesso. Cópias de hedging também ocupam uma
+    vaga; sem vaga livre a cópia não é disparada.
+    """
+
+    def __init__(
+        self,
+        base_url: str = settings.SWAPI_BASE_URL,
+        timeout: int = settings.SWAPI_TIMEOUT,
+        retry_policy: Optional[RetryPolicy] = None,
+        failure_threshold: int = settings.SWAPI_BREAKER_FAILURE_THRESHOLD,
+        recovery_timeout: float = settings.SWAPI_BREAKER_RECOVERY_TIMEOUT,
+        conditional_cache_size: int = settings.SWAPI_CONDITIONAL_CACHE_SIZE,
+        hedge_policy: Optional[HedgePolicy] = None,
+        limiter: Optional[AIMDLimiter] = None,
+        limits: Optional[httpx.Limits] = None,
+        timeouts: Optional[httpx.Timeout] = None,
+        http2: bool = settings.SWAPI_HTTP2,
+    ):
         self.base_url = base_url
         self.timeout = timeout
-        self.client = httpx.AsyncClient(timeout=timeout)
+        self.limits = limits or create_limits()
+        self.timeouts = timeouts or create_timeouts(timeout)
+        if http2 and h2 is None:
+            logger.warning("HTTP/2 requer o pacote h2 (httpx[http2]); usando HTTP/1.1")
+            http2 = False
+        self.http2 = http2
+        self.client = httpx.AsyncClient(timeout=self.timeouts, limits=self.limits, http2=http2)
+        self.single_flight = SingleFlight()
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_attempts=settings.SWAPI_RETRY_ATTEMPTS,
+            base_delay=settings.SWAPI_RETRY_BASE_DELAY,
+            max_delay=settings.SWAPI_RETRY_MAX_DELAY,
+            deadline=settings.SWAPI_REQUEST_DEADLINE,
+        )
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.conditional = ConditionalCache(conditional_cache_size)
+        if hedge_policy is None and settings.SWAPI_HEDGE_ENABLED:
+            hedge_policy = HedgePolicy(
+                quantile=settings.SWAPI_HEDGE_QUANTILE,
+                budget=settings.SWAPI_HEDGE_BUDGET,
+                min_delay=settings.SWAPI_HEDGE_MIN_DELAY,
+            )
+        self.hedge_policy = hedge_policy
+        if limiter is None and settings.SWAPI_ADAPTIVE_CONCURRENCY:
+            limiter = AIMDLimiter(
+                initial_limit=settings.SWAPI_CONCURRENCY_INITIAL_LIMIT,
+                min_limit=settings.SWAPI_CONCURRENCY_MIN_LIMIT,
+                max_limit=settings.SWAPI_CONCURRENCY_MAX_LIMIT,
+                max_queue=settings.SWAPI_CONCURRENCY_MAX_QUEUE,
+                queue_timeout=settings.SWAPI_CONCURRENCY_QUEUE_TIMEOUT,
+            )
+        self.limiter = limiter
+        self.attempts = 0
+        self.retries = 0
+        self.retries_exhausted = 0
+        self.deadline_exceeded = 0
+        self.short_circuited = 0
 
     async def get(
         self,
@@ -22,27 +123,214 @@ class SwapiClient(IHttpClient):
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[int] = None,
     ) -> Dict[str, Any]:
-        """Faz uma requisição GET para SWAPI."""
+        """Faz uma requisição GET para SWAPI.
+
+        Requisições concorrentes idênticas compartilham uma única chamada.
+        """
+        key = self._get_flight_key(url, headers)
+        return await self.single_flight.do(key, lambda: self._fetch(url, headers, timeout))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna métricas do cliente."""
+        return {
+            "single_flight": self.single_flight.get_stats(),
+            "conditional": self.conditional.get_stats(),
+            "hedging": self.hedge_policy.get_stats() if self.hedge_policy else None,
+            "concurrency": self.limiter.get_stats() if self.limiter else None,
+            "retry": {
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "exhausted": self.retries_exhausted,
+                "deadline_exceeded": self.deadline_exceeded,
+            },
+            "circuit_breakers": {
+                host: breaker.get_stats() for host, breaker in self.breakers.items()
+            },
+            "short_circuited": self.short_circuited,
+        }
+
+    @staticmethod
+    def _get_flight_key(url: str, headers: Optional[Dict[str, str]]) -> str:
+        """Gera a chave de agrupamento de uma requisição."""
+        if not headers:
+            return url
+        return f"{url}|{sorted(headers.items())}"
+
+    async def _fetch(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Executa a requisição GET, repetindo falhas transitórias.
+
+        O disjuntor do host é consultado antes de cada tentativa; aberto, a
+        requisição falha na hora com 503. Novas tentativas só acontecem
+        enquanto couberem no prazo total da requisição.
+        """
+        timeout = timeout or self.timeout
+        key = self._get_flight_key(url, headers)
+        breaker = self._get_breaker(url)
+        deadline = (
+            time.monotonic() + self.retry_policy.deadline
+            if self.retry_policy.deadline is not None
+            else None
+        )
+        attempt = 0
+
+        while True:
+            if not breaker.allow():
+                self.short_circuited += 1
+                logger.warning(f"Circuito aberto para {breaker.name}; requisição a {url} recusada")
+                raise ExternalAPIError("SWAPI indisponível (circuito aberto)", status_code=503)
+
+            attempt_timeout = timeout
+            if deadline is not None:
+                attempt_timeout = max(0.0, min(timeout, deadline - time.monotonic()))
+
+            try:
+                data = await self._attempt(url, key, headers, attempt_timeout)
+            except ConcurrencyLimitExceeded as e:
+                # Nada chegou à SWAPI: o disjuntor não deve contar a tentativa
+                breaker.cancel()
+                logger.warning(f"Requisição a {url} descartada pelo limitador: {str(e)}")
+                raise ExternalAPIError(
+                    "Limite de requisições simultâneas à SWAPI excedido", status_code=503
+                )
+            except asyncio.CancelledError:
+                # Cancelada sem resultado: devolve a vaga de teste do disjuntor
+                breaker.cancel()
+                raise
+            except Exception as e:
+                if not self.retry_policy.is_retryable(e):
+                    # O servidor respondeu (404, JSON inválido...): ele está saudável
+                    breaker.record_success()
+                    raise self._to_api_error(url, e)
+
+                breaker.record_failure()
+                attempt += 1
+                delay = self.retry_policy.backoff(attempt)
+                if attempt >= self.retry_policy.max_attempts:
+                    self.retries_exhausted += 1
+                    raise self._to_api_error(url, e)
+                if deadline is not None and time.monotonic() + delay >= deadline:
+                    self.deadline_exceeded += 1
+                    raise self._to_api_error(url, e)
+
+                self.retries += 1
+                logger.warning(
+                    f"Falha transitória ao acessar {url} (tentativa {attempt}); "
+                    f"nova tentativa em {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            breaker.record_success()
+            return data
+
+    async def _attempt(
+        self, url: str, key: str, headers: Optional[Dict[str, str]], timeout: float
+    ) -> Any:
+        """Faz uma tentativa ocupando uma vaga do limitador de concorrência.
+
+        A vaga é liberada antes de qualquer espera de backoff, e a latência
+        e o tipo de falha alimentam o ajuste do limite.
+        """
+        if self.limiter is not None:
+            await self.limiter.acquire()
+        started = time.monotonic()
+        dropped = False
         try:
-            timeout = timeout or self.timeout
-            response = await self.client.get(url, headers=headers, timeout=timeout)
+            self.attempts += 1
+            stored = self.conditional.lookup(key)
+            response = await self._send(
+                url, self.conditional.conditional_headers(stored, headers), timeout
+            )
+            if response.status_code == 304 and stored is not None:
+                return self.conditional.not_modified_data(key, stored)
             response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            logger.error(f"Erro HTTP ao acessar {url}: {e.response.status_code}")
-            raise ExternalAPIError(
-                f"Erro ao acessar SWAPI: {e.response.status_code}",
-                status_code=e.response.status_code,
+            return self.conditional.load(key, response)
+        except Exception as e:
+            dropped = self.retry_policy.is_retryable(e)
+            raise
+        finally:
+            if self.limiter is not None:
+                self.limiter.release(time.monotonic() - started, dropped)
+
+    def _timeout_for(self, seconds: float) -> httpx.Timeout:
+        """Limita cada fase da tentativa ao tempo que resta para ela."""
+        phases = self.timeouts
+        return httpx.Timeout(
+            connect=min(phases.connect, seconds) if phases.connect is not None else seconds,
+            read=min(phases.read, seconds) if phases.read is not None else seconds,
+            write=min(phases.write, seconds) if phases.write is not None else seconds,
+            pool=min(phases.pool, seconds) if phases.pool is not None else seconds,
+        )
+
+    async def _send(
+        self, url: str, headers: Optional[Dict[str, str]], timeout: float
+    ) -> httpx.Response:
+        """Envia o GET, com uma cópia concorrente se o hedging estiver ativo."""
+        timeout = self._timeout_for(timeout)
+
+        def send() -> Awaitable[httpx.Response]:
+            return self.client.get(url, headers=headers, timeout=timeout)
+
+        if self.hedge_policy is None:
+            return await send()
+        if self.limiter is None:
+            return await self.hedge_policy.run(send)
+        return await self.hedge_policy.run(
+            send, copy=lambda: self._send_copy(send), admit=self.limiter.has_room
+        )
+
+    async def _send_copy(self, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """Envia a cópia de hedging ocupando uma vaga do limitador."""
+        if not self.limiter.try_acquire():
+            raise ConcurrencyLimitExceeded("Sem vaga para a cópia de hedging")
+        started = time.monotonic()
+        try:
+            response = await send()
+        except asyncio.CancelledError:
+            self.limiter.cancel()
+            raise
+        except Exception as e:
+            self.limiter.release(time.monotonic() - started, self.retry_policy.is_retryable(e))
+            raise
+        dropped = response.status_code in RETRYABLE_STATUS
+        self.limiter.release(time.monotonic() - started, dropped)
+        return response
+
+    @staticmethod
+    def _to_api_error(url: str, error: Exception) -> ExternalAPIError:
+        """Converte uma falha da requisição em ExternalAPIError."""
+        if isinstance(error, httpx.HTTPStatusError):
+            logger.error(f"Erro HTTP ao acessar {url}: {error.response.status_code}")
+            return ExternalAPIError(
+                f"Erro ao acessar SWAPI: {error.response.status_code}",
+                status_code=error.response.status_code,
             )
-        except httpx.TimeoutException:
+        if isinstance(error, httpx.TimeoutException):
             logger.error(f"Timeout ao acessar {url}")
-            raise ExternalAPIError("Timeout ao acessar SWAPI", status_code=504)
-        except httpx.RequestError as e:
-            logger.error(f"Erro de requisição ao acessar {url}: {str(e)}")
-            raise ExternalAPIError(f"Erro ao acessar SWAPI: {str(e)}", status_code=502)
-        except Exception as e:
-            logger.error(f"Erro inesperado ao acessar {url}: {str(e)}")
-            raise ExternalAPIError(f"Erro inesperado ao acessar SWAPI: {str(e)}")
+            return ExternalAPIError("Timeout ao acessar SWAPI", status_code=504)
+        if isinstance(error, httpx.RequestError):
+            logger.error(f"Erro de requisição ao acessar {url}: {str(error)}")
+            return ExternalAPIError(f"Erro ao acessar SWAPI: {str(error)}", status_code=502)
+        logger.error(f"Erro inesperado ao acessar {url}: {str(error)}")
+        return ExternalAPIError(f"Erro inesperado ao acessar SWAPI: {str(error)}")
+
+    def _get_breaker(self, url: str) -> CircuitBreaker:
+        """Obtém o disjuntor do host da URL."""
+        host = httpx.URL(url).host
+        breaker = self.breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                host,
+                failure_threshold=self.failure_threshold,
+                recovery_timeout=self.recovery_timeout,
+            )
+            self.breakers[host] = breaker
+        return breaker
 
     async def post(
         self,
@@ -0,0 +1,32 @@
+from fastapi import Depends, Request
+
+from src.application.services.character_service import CharacterService
+from src.application.services.film_service import FilmService
+from src.application.services.planet_service import PlanetService
+from src.application.services.starship_service import StarshipService
+from src.presentation.container import Container
+
+
+def get_container(request: Request) -> Container:
+    """Obtém o contêiner de dependências da aplicação."""
+    return request.app.state.container
+
+
+def get_character_service(container: Container = Depends(get_container)) -> CharacterService:
+    """Obtém o serviço de personagens compartilhado."""
+    return container.character_service
+
+
+def get_film_service(container: Container = Depends(get_container)) -> FilmService:
+    """Obtém o serviço de filmes compartilhado."""
+    return container.film_service
+
+
+def get_planet_service(container: Container = Depends(get_container)) -> PlanetService:
+    """Obtém o serviço de planetas compartilhado."""
+    return container.planet_service
+
+
+def get_starship_service(container: Container = Depends(get_container)) -> StarshipService:
+    """Obtém o serviço de naves compartilhado."""
+    return container.starship_service
@@ -6,31 +6,18 @@ from src.application.services.character_service import CharacterService
 from src.application.services.film_service import FilmService
 from src.application.services.planet_service import PlanetService
 from src.application.services.starship_service import StarshipService
-from src.infrastructure.database.repositories.character_repository import CharacterRepository
-from src.infrastructure.database.repositories.film_repository import FilmRepository
-from src.infrastructure.database.repositories.planet_repository import PlanetRepository
-from src.infrastructure.database.repositories.starship_repository import StarshipRepository
-from src.infrastructure.http.swapi_client import SwapiClient
-from src.infrastructure.cache.cache_factory import CacheFactory
 from src.application.security.auth import get_optional_user
+from src.presentation.api.dependencies import (
+    get_character_service,
+    get_film_service,
+    get_planet_service,
+    get_starship_service,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/search", tags=["Advanced Search"])
 
-http_client = SwapiClient()
-cache = CacheFactory.create_cache()
-
-character_repo = CharacterRepository(http_client, cache)
-film_repo = FilmRepository(http_client, cache)
-planet_repo = PlanetRepository(http_client, cache)
-starship_repo = StarshipRepository(http_client, cache)
-
-character_service = CharacterService(character_repo)
-film_service = FilmService(film_repo)
-planet_service = PlanetService(planet_repo)
-starship_service = StarshipService(starship_repo)
-
 search_service = AdvancedSearchService()
 
 
@@ -45,6 +32,10 @@ async def advanced_search(
     min_score: float = Query(0.3, ge=0, le=1, description="Score mínimo de relevância"),
     limit: int = Query(10, ge=1, le=100, description="Número máximo de resultados"),
     current_user: Optional[str] = Depends(get_optional_user),
+    character_service: CharacterService = Depends(get_character_service),
+    film_service: FilmService = Depends(get_film_service),
+    planet_service: PlanetService = Depends(get_planet_service),
+    starship_service: StarshipService = Depends(get_starship_service),
 ):
     """Realiza busca avançada com scoring de relevância."""
     try:
@@ -121,6 +112,8 @@ async def autocomplete(
     resource_type: str = Query("all", description="Tipo de recurso"),
     limit: int = Query(5, ge=1, le=20, description="Número máximo de sugestões"),
     current_user: Optional[str] = Depends(get_optional_user),
+    character_service: CharacterService = Depends(get_character_service),
+    film_service: FilmService = Depends(get_film_service),
 ):
     """Retorna sugestões de autocompletar."""
     try:
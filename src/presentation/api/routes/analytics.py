@@ -3,6 +3,8 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from typing import Optional
 from src.application.services.analytics_service import AnalyticsService
 from src.application.security.auth import get_optional_user
+from src.presentation.api.dependencies import get_container
+from src.presentation.container import Container
 
 logger = logging.getLogger(__name__)
 
@@ -91,3 +93,39 @@ async def get_hourly_stats(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Erro ao obter estatísticas",
         )
+
+
+@router.get(
+    "/upstream",
+    summary="Métricas da SWAPI",
+    description="Obtém métricas das chamadas feitas à SWAPI",
+)
+async def get_upstream_stats(
+    current_user: Optional[str] = Depends(get_optional_user),
+    container: Container = Depends(get_container),
+):
+    """Retorna métricas do cliente HTTP da SWAPI."""
+    try:
+        return container.http_client.get_stats()
+    except Exception as e:
+        logger.error(f"Erro ao obter métricas da SWAPI: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Erro ao obter métricas da SWAPI",
+        )
+
+
+@router.get(
+    "/cache",
+    summary="Métricas do Cache",
+    description="Obtém uso de memória, acertos e despejos do cache",
+)
+async def get_cache_stats(
+    current_user: Optional[str] = Depends(get_optional_user),
+    container: Container = Depends(get_container),
+):
+    """Retorna métricas do cache da aplicação."""
+    get_stats = getattr(container.cache, "get_stats", None)
+    if get_stats is None:
+        return {"backend": type(container.cache).__name__}
+    return {"backend": type(container.cache).__name__, **get_stats()}
@@ -3,24 +3,15 @@ from typing import Optional, List
 from fastapi import APIRouter, Depends, Query, HTTPException, status
 from src.domain.entities.character import Character
 from src.application.services.character_service import CharacterService
-from src.infrastructure.database.repositories.character_repository import (
-    CharacterRepository,
-)
-from src.infrastructure.http.swapi_client import SwapiClient
-from src.infrastructure.cache.cache_factory import CacheFactory
-from src.application.dto.filters import PaginatedResponse, ErrorResponse
+from src.application.dto.filters import PaginatedResponse, parse_filter_expressions, ErrorResponse
 from src.application.security.auth import get_optional_user
+from src.presentation.api.dependencies import get_character_service
 from src.config.exceptions import StarWarsAPIException
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/characters", tags=["Characters"])
 
-http_client = SwapiClient()
-cache = CacheFactory.create_cache()
-repository = CharacterRepository(http_client, cache)
-service = CharacterService(repository)
-
 
 @router.get(
     "",
@@ -31,10 +22,18 @@ service = CharacterService(repository)
 async def list_characters(
     page: int = Query(1, ge=1, description="Número da página"),
     page_size: int = Query(10, ge=1, le=100, description="Tamanho da página"),
-    sort_by: Optional[str] = Query(None, description="Campo para ordenar"),
+    sort_by: Optional[str] = Query(
+        None, description="Campos para ordenar, separados por vírgula (prefixo - inverte)"
+    ),
     sort_order: str = Query("asc", regex="^(asc|desc)$", description="Ordem de ordenação"),
     search: Optional[str] = Query(None, description="Termo de busca"),
+    filter_expressions: Optional[List[str]] = Query(
+        None,
+        alias="filter",
+        description="Filtros no formato campo<operador>valor (ex: height>=180, gender=male)",
+    ),
     current_user: Optional[str] = Depends(get_optional_user),
+    service: CharacterService = Depends(get_character_service),
 ):
     """
     Lista todos os personagens de Star Wars.
@@ -42,8 +41,9 @@ async def list_characters(
     **Parâmetros de Query:**
     - `page`: Número da página (padrão: 1)
     - `page_size`: Itens por página (padrão: 10, máximo: 100)
-    - `sort_by`: Campo para ordenar (ex: name, height, mass)
+    - `sort_by`: Campos para ordenar (ex: name, height, gender,-mass)
     - `sort_order`: Ordem de ordenação (asc ou desc)
+    - `filter`: Filtros repetíveis (=, !=, >, >=, <, <=, ~ para contém)
     - `search`: Termo de busca por nome
 
     **Exemplo:**
@@ -59,6 +59,7 @@ async def list_characters(
             characters, total = await service.list_characters(
                 page=page,
                 page_size=page_size,
+                filters=parse_filter_expressions(filter_expressions),
                 sort_by=sort_by,
                 sort_order=sort_order,
             )
@@ -92,6 +93,7 @@ async def list_characters(
 async def get_character(
     character_id: str,
     current_user: Optional[str] = Depends(get_optional_user),
+    service: CharacterService = Depends(get_character_service),
 ):
     """
     Obtém detalhes de um personagem específico.
@@ -127,6 +129,7 @@ async def get_character(
 async def search_characters(
     query: str,
     current_user: Optional[str] = Depends(get_optional_user),
+    service: CharacterService = Depends(get_character_service),
 ):
     """
     Busca personagens por nome.
@@ -167,6 +170,7 @@ async def search_characters(
 async def get_characters_by_film(
     film_id: str,
     current_user: Optional[str] = Depends(get_optional_user),
+    service: CharacterService = Depends(get_character_service),
 ):
     """
     Obtém todos os personagens que aparecem em um filme específico.
@@ -202,6 +206,7 @@ async def get_characters_by_film(
 async def get_characters_from_planet(
     planet_id: str,
     current_user: Optional[str] = Depends(get_optional_user),
+    service: CharacterService = Depends(get_character_service),
 ):
     """
     Obtém todos os personagens nativos de um planeta específico.
@@ -3,22 +3,15 @@ from typing import Optional, List
 from fastapi import APIRouter, Depends, Query, HTTPException, status
 from src.domain.entities.film import Film
 from src.application.services.film_service import FilmService
-from src.infrastructure.database.repositories.film_repository import FilmRepository
-from src.infrastructure.http.swapi_client import SwapiClient
-from src.infrastructure.cache.cache_factory import CacheFactory
-from src.application.dto.filters import PaginatedResponse
+from src.application.dto.filters import PaginatedResponse, parse_filter_expressions
 from src.application.security.auth import get_optional_user
+from src.presentation.api.dependencies import get_film_service
 from src.config.exceptions import StarWarsAPIException
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/films", tags=["Films"])
 
-http_client = SwapiClient()
-cache = CacheFactory.create_cache()
-repository = FilmRepository(http_client, cache)
-service = FilmService(repository)
-
 
 @router.get(
     "",
@@ -29,10 +22,18 @@ service = FilmService(repository)
 async def list_films(
     page: int = Query(1, ge=1, description="Número da página"),
     page_size: int = Query(10, ge=1, le=100, description="Tamanho da página"),
-    sort_by: Optional[str] = Query(None, description="Campo para ordenar"),
+    sort_by: Optional[str] = Query(
+        None, description="Campos para ordenar, separados por vírgula (prefixo - inverte)"
+    ),
     sort_order: str = Query("asc", regex="^(asc|desc)$", description="Ordem de ordenação"),
     search: Optional[str] = Query(None, description="Termo de busca"),
+    filter_expressions: Optional[List[str]] = Query(
+        None,
+        alias="filter",
+        description="Filtros no formato campo<operador>valor (ex: episode_id>=4, director~Lucas)",
+    ),
     current_user: Optional[str] = Depends(get_optional_user),
+    service: FilmService = Depends(get_film_service),
 ):
     """
     Lista todos os filmes de Star Wars.
@@ -40,8 +41,9 @@ async def list_films(
     **Parâmetros de Query:**
     - `page`: Número da página (padrão: 1)
     - `page_size`: Itens por página (padrão: 10, máximo: 100)
-    - `sort_by`: Campo para ordenar (ex: title, episode_id, release_date)
+    - `sort_by`: Campos para ordenar (ex: title, episode_id, director,-release_date)
     - `sort_order`: Ordem de ordenação (asc ou desc)
+    - `filter`: Filtros repetíveis (=, !=, >, >=, <, <=, ~ para contém)
     - `search`: Termo de busca por título
 
     **Exemplo:**
@@ -57,6 +59,7 @@ async def list_films(
             films, total = await service.list_films(
                 page=page,
                 page_size=page_size,
+                filters=parse_filter_expressions(filter_expressions),
                 sort_by=sort_by,
                 sort_order=sort_order,
             )
@@ -90,6 +93,7 @@ async def list_films(
 async def get_film(
     film_id: str,
     current_user: Optional[str] = Depends(get_optional_user),
+    service: FilmService = Depends(get_film_service),
 ):
     """
     Obtém detalhes de um filme específico.
@@ -125,6 +129,7 @@ async def get_film(
 async def search_films(
     query: str,
     current_user: Optional[str] = Depends(get_optional_user),
+    service: FilmService = Depends(get_film_service),
 ):
     """
     Busca filmes por título.
@@ -165,6 +170,7 @@ async def search_films(
 async def get_films_by_director(
     director: str,
     current_user: Optional[str] = Depends(get_optional_user),
+    service: FilmService = Depends(get_film_service),
 ):
     """
     Obtém filmes de um diretor específico.
@@ -200,6 +206,7 @@ async def get_films_by_director(
 async def get_films_by_character(
     character_id: str,
     current_user: Optional[str] = Depends(get_optional_user),
+    service: FilmService = Depends(get_film_service),
 ):
     """
     Obtém todos os filmes nos quais um personagem aparece.
@@ -235,6 +242,7 @@ async def get_films_by_character(
 async def get_films_by_planet(
     planet_id: str,
     current_user: Optional[str] = Depends(get_optional_user),
+    service: FilmService = Depends(get_film_service),
 ):
     """
     Obtém todos os filmes nos quais um planeta aparece.
@@ -270,6 +278,7 @@ async def get_films_by_planet(
 async def get_films_by_starship(
     starship_id: str,
     current_user: Optional[str] = Depends(get_optional_user),
+    service: FilmService = Depends(get_film_service),
 ):
     """
     Obtém todos os filmes nos quais uma nave aparece.
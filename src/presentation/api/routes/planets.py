@@ -3,24 +3,15 @@ from typing import Optional, List
 from fastapi import APIRouter, Depends, Query, HTTPException, status
 from src.domain.entities.planet import Planet
 from src.application.services.planet_service import PlanetService
-from src.infrastructure.database.repositories.planet_repository import (
-    PlanetRepository,
-)
-from src.infrastructure.http.swapi_client import SwapiClient
-from src.infrastructure.cache.cache_factory import CacheFactory
-from src.application.dto.filters import PaginatedResponse
+from src.application.dto.filters import PaginatedResponse, parse_filter_expressions
 from src.application.security.auth import get_optional_user
+from src.presentation.api.dependencies import get_planet_service
 from src.config.exceptions import StarWarsAPIException
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/planets", tags=["Planets"])
 
-http_client = SwapiClient()
-cache = CacheFactory.create_cache()
-repository = PlanetRepository(http_client, cache)
-service = PlanetService(repository)
-
 
 @router.get(
     "",
@@ -31,10 +22,18 @@ service = PlanetService(repository)
 async def list_planets(
     page: int = Query(1, ge=1, description="Número da página"),
     page_size: int = Query(10, ge=1, le=100, description="Tamanho da página"),
-    sort_by: Optional[str] = Query(None, description="Campo para ordenar"),
+    sort_by: Optional[str] = Query(
+        None, description="Campos para ordenar, separados por vírgula (prefixo - inverte)"
+    ),
     sort_order: str = Query("asc", regex="^(asc|desc)$", description="Ordem de ordenação"),
     search: Optional[str] = Query(None, description="Termo de busca"),
+    filter_expressions: Optional[List[str]] = Query(
+        None,
+        alias="filter",
+        description="Filtros no formato campo<operador>valor (ex: population<1e6, climate~arid)",
+    ),
     current_user: Optional[str] = Depends(get_optional_user),
+    service: PlanetService = Depends(get_planet_service),
 ):
     """
     Lista todos os planetas de Star Wars.
@@ -42,8 +41,9 @@ async def list_planets(
     **Parâmetros de Query:**
     - `page`: Número da página (padrão: 1)
     - `page_size`: Itens por página (padrão: 10, máximo: 100)
-    - `sort_by`: Campo para ordenar (ex: name, diameter, population)
+    - `sort_by`: Campos para ordenar (ex: name, diameter, climate,-population)
     - `sort_order`: Ordem de ordenação (asc ou desc)
+    - `filter`: Filtros repetíveis (=, !=, >, >=, <, <=, ~ para contém)
     - `search`: Termo de busca por nome
 
     **Exemplo:**
@@ -59,6 +59,7 @@ async def list_planets(
             planets, total = await service.list_planets(
                 page=page,
                 page_size=page_size,
+                filters=parse_filter_expressions(filter_expressions),
                 sort_by=sort_by,
                 sort_order=sort_order,
             )
@@ -92,6 +93,7 @@ async def list_planets(
 async def get_planet(
     planet_id: str,
     current_user: Optional[str] = Depends(get_optional_user),
+    service: PlanetService = Depends(get_planet_service),
 ):
     """
     Obtém detalhes de um planeta específico.
@@ -127,6 +129,7 @@ async def get_planet(
 async def search_planets(
     query: str,
     current_user: Optional[str] = Depends(get_optional_user),
+    service: PlanetService = Depends(get_planet_service),
 ):
     """
     Busca planetas por nome.
@@ -167,6 +170,7 @@ async def search_planets(
 async def get_planets_by_film(
     film_id: str,
     current_user: Optional[str] = Depends(get_optional_user),
+    service: PlanetService = Depends(get_planet_service),
 ):
     """
     Obtém todos os planetas que aparecem em um filme específico.
@@ -202,6 +206,7 @@ async def get_planets_by_film(
 async def get_planets_by_climate(
     climate: str,
     current_user: Optional[str] = Depends(get_optional_user),
+    service: PlanetService = Depends(get_planet_service),
 ):
     """
     Obtém planetas com um clima específico.
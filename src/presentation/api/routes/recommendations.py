@@ -6,31 +6,18 @@ from src.application.services.character_service import CharacterService
 from src.application.services.film_service import FilmService
 from src.application.services.planet_service import PlanetService
 from src.application.services.starship_service import StarshipService
-from src.infrastructure.database.repositories.character_repository import CharacterRepository
-from src.infrastructure.database.repositories.film_repository import FilmRepository
-from src.infrastructure.database.repositories.planet_repository import PlanetRepository
-from src.infrastructure.database.repositories.starship_repository import StarshipRepository
-from src.infrastructure.http.swapi_client import SwapiClient
-from src.infrastructure.cache.cache_factory import CacheFactory
 from src.application.security.auth import get_optional_user
+from src.presentation.api.dependencies import (
+    get_character_service,
+    get_film_service,
+    get_planet_service,
+    get_starship_service,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/recommendations", tags=["Recommendations"])
 
-http_client = SwapiClient()
-cache = CacheFactory.create_cache()
-
-character_repo = CharacterRepository(http_client, cache)
-film_repo = FilmRepository(http_client, cache)
-planet_repo = PlanetRepository(http_client, cache)
-starship_repo = StarshipRepository(http_client, cache)
-
-character_service = CharacterService(character_repo)
-film_service = FilmService(film_repo)
-planet_service = PlanetService(planet_repo)
-starship_service = StarshipService(starship_repo)
-
 recommendation_service = RecommendationService()
 
 
@@ -42,6 +29,9 @@ recommendation_service = RecommendationService()
 async def get_character_recommendations(
     character_id: str,
     current_user: Optional[str] = Depends(get_optional_user),
+    character_service: CharacterService = Depends(get_character_service),
+    film_service: FilmService = Depends(get_film_service),
+    starship_service: StarshipService = Depends(get_starship_service),
 ):
     """Retorna recomendações relacionadas a um personagem."""
     try:
@@ -71,6 +61,9 @@ async def get_character_recommendations(
 async def get_film_recommendations(
     film_id: str,
     current_user: Optional[str] = Depends(get_optional_user),
+    film_service: FilmService = Depends(get_film_service),
+    character_service: CharacterService = Depends(get_character_service),
+    planet_service: PlanetService = Depends(get_planet_service),
 ):
     """Retorna recomendações relacionadas a um filme."""
     try:
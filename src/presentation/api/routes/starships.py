@@ -3,24 +3,15 @@ from typing import Optional, List
 from fastapi import APIRouter, Depends, Query, HTTPException, status
 from src.domain.entities.starship import Starship
 from src.application.services.starship_service import StarshipService
-from src.infrastructure.database.repositories.starship_repository import (
-    StarshipRepository,
-)
-from src.infrastructure.http.swapi_client import SwapiClient
-from src.infrastructure.cache.cache_factory import CacheFactory
-from src.application.dto.filters import PaginatedResponse
+from src.application.dto.filters import PaginatedResponse, parse_filter_expressions
 from src.application.security.auth import get_optional_user
+from src.presentation.api.dependencies import get_starship_service
 from src.config.exceptions import StarWarsAPIException
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/starships", tags=["Starships"])
 
-http_client = SwapiClient()
-cache = CacheFactory.create_cache()
-repository = StarshipRepository(http_client, cache)
-service = StarshipService(repository)
-
 
 @router.get(
     "",
@@ -31,10 +22,20 @@ service = StarshipService(repository)
 async def list_starships(
     page: int = Query(1, ge=1, description="Número da página"),
     page_size: int = Query(10, ge=1, le=100, description="Tamanho da página"),
-    sort_by: Optional[str] = Query(None, description="Campo para ordenar"),
+    sort_by: Optional[str] = Query(
+        None, description="Campos para ordenar, separados por vírgula (prefixo - inverte)"
+    ),
     sort_order: str = Query("asc", regex="^(asc|desc)$", description="Ordem de ordenação"),
     search: Optional[str] = Query(None, description="Termo de busca"),
+    filter_expressions: Optional[List[str]] = Query(
+        None,
+        alias="filter",
+        description=(
+            "Filtros no formato campo<operador>valor (ex: crew>100, starship_class~fighter)"
+        ),
+    ),
     current_user: Optional[str] = Depends(get_optional_user),
+    service: StarshipService = Depends(get_starship_service),
 ):
     """
     Lista todas as naves estelares de Star Wars.
@@ -42,8 +43,9 @@ async def list_starships(
     **Parâmetros de Query:**
     - `page`: Número da página (padrão: 1)
     - `page_size`: Itens por página (padrão: 10, máximo: 100)
-    - `sort_by`: Campo para ordenar (ex: name, length, cost_in_credits)
+    - `sort_by`: Campos para ordenar (ex: name, length, starship_class,-cost_in_credits)
     - `sort_order`: Ordem de ordenação (asc ou desc)
+    - `filter`: Filtros repetíveis (=, !=, >, >=, <, <=, ~ para contém)
     - `search`: Termo de busca por nome
 
     **Exemplo:**
@@ -59,6 +61,7 @@ async def list_starships(
             starships, total = await service.list_starships(
                 page=page,
                 page_size=page_size,
+                filters=parse_filter_expressions(filter_expressions),
                 sort_by=sort_by,
                 sort_order=sort_order,
             )
@@ -92,6 +95,7 @@ async def list_starships(
 async def get_starship(
     starship_id: str,
     current_user: Optional[str] = Depends(get_optional_user),
+    service: StarshipService = Depends(get_starship_service),
 ):
     """
     Obtém detalhes de uma nave específica.
@@ -127,6 +131,7 @@ async def get_starship(
 async def search_starships(
     query: str,
     current_user: Optional[str] = Depends(get_optional_user),
+    service: StarshipService = Depends(get_starship_service),
 ):
     """
     Busca naves por nome.
@@ -167,6 +172,7 @@ async def search_starships(
 async def get_starships_by_film(
     film_id: str,
     current_user: Optional[str] = Depends(get_optional_user),
+    service: StarshipService = Depends(get_starship_service),
 ):
     """
     Obtém todas as naves que aparecem em um filme específico.
@@ -202,6 +208,7 @@ async def get_starships_by_film(
 async def get_starships_by_class(
     starship_class: str,
     current_user: Optional[str] = Depends(get_optional_user),
+    service: StarshipService = Depends(get_starship_service),
 ):
     """
     Obtém naves de uma classe específica.
@@ -237,6 +244,7 @@ async def get_starships_by_class(
 async def get_starships_by_pilot(
     pilot_id: str,
     current_user: Optional[str] = Depends(get_optional_user),
+    service: StarshipService = Depends(get_starship_service),
 ):
     """
     Obtém todas as naves pilotadas por um personagem específico.
@@ -0,0 +1,71 @@
+import logging
+from typing import Optional
+
+from src.application.services.character_service import CharacterService
+from src.application.services.film_service import FilmService
+from src.application.services.planet_service import PlanetService
+from src.application.services.starship_service import StarshipService
+from src.domain.interfaces.cache import ICache
+from src.domain.interfaces.client import IHttpClient
+from src.config.settings import settings
+from src.infrastructure.cache.cache_factory import CacheFactory
+from src.infrastructure.cache.keys import CacheKeyspace
+from src.infrastructure.database.repositories.character_repository import (
+    CharacterRepository,
+)
+from src.infrastructure.database.repositories.film_repository import FilmRepository
+from src.infrastructure.database.repositories.planet_repository import (
+    PlanetRepository,
+)
+from src.infrastructure.database.repositories.starship_repository import (
+    StarshipRepository,
+)
+from src.infrastructure.database.relationships import RelationshipGraph
+from src.infrastructure.http.swapi_client import SwapiClient
+
+logger = logging.getLogger(__name__)
+
+
+class Container:
+    """Contêiner com as dependências compartilhadas por todas as rotas."""
+
+    def __init__(
+        self,
+        http_client: Optional[IHttpClient] = None,
+        cache: Optional[ICache] = None,
+    ):
+        self.http_client = http_client or SwapiClient()
+        self.cache = cache or CacheFactory.create_cache()
+
+        self.character_repository = CharacterRepository(self.http_client, self.cache)
+        self.film_repository = FilmRepository(self.http_client, self.cache)
+        self.planet_repository = PlanetRepository(self.http_client, self.cache)
+        self.starship_repository = StarshipRepository(self.http_client, self.cache)
+
+        repositories = [
+            self.character_repository,
+            self.film_repository,
+            self.planet_repository,
+            self.starship_repository,
+        ]
+        self.relationships = RelationshipGraph(repositories)
+        self.keyspace = CacheKeyspace(self.cache, namespace=settings.CACHE_NAMESPACE)
+        for repository in repositories:
+            repository.relationships = self.relationships
+            repository.keyspace = self.keyspace
+
+        self.character_service = CharacterService(self.character_repository)
+        self.film_service = FilmService(self.film_repository)
+        self.planet_service = PlanetService(self.planet_repository)
+        self.starship_service = StarshipService(self.starship_repository)
+
+    async def startup(self) -> None:
+        """Inicializa os recursos do contêiner."""
+        await self.cache.start()
+        logger.info("Contêiner de dependências inicializado")
+
+    async def shutdown(self) -> None:
+        """Libera os recursos do contêiner."""
+        await self.cache.stop()
+        await self.http_client.close()
+        logger.info("Contêiner de dependências encerrado")
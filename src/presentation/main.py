@@ -1,4 +1,5 @@
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -17,11 +18,29 @@ from src.presentation.api.routes import (
     recommendations,
     starships,
 )
+from src.presentation.container import Container
 
 logging.basicConfig(level=settings.LOG_LEVEL)
 logger = logging.getLogger(__name__)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Gerencia o ciclo de vida dos recursos compartilhados da aplicação."""
+    logger.info(f"Iniciando {settings.APP_NAME} v{settings.APP_VERSION}")
+    logger.info(f"Ambiente: {settings.ENVIRONMENT}")
+
+    container = Container()
+    await container.startup()
+    app.state.container = container
+
+    try:
+        yield
+    finally:
+        logger.info(f"Encerrando {settings.APP_NAME}")
+        await container.shutdown()
+
+
 def create_app() -> FastAPI:
     """Factory function para criar a aplicação FastAPI."""
     app = FastAPI(
@@ -32,21 +51,13 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        lifespan=lifespan,
     )
 
     add_middleware(app)
     add_routes(app)
     add_exception_handlers(app)
 
-    @app.on_event("startup")
-    async def startup_event():
-        logger.info(f"Iniciando {settings.APP_NAME} v{settings.APP_VERSION}")
-        logger.info(f"Ambiente: {settings.ENVIRONMENT}")
-
-    @app.on_event("shutdown")
-    async def shutdown_event():
-        logger.info(f"Encerrando {settings.APP_NAME}")
-
     @app.get("/health", tags=["Health"])
     async def health_check():
         """Verifica a saúde da aplicação."""
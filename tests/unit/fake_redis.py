@@ -0,0 +1,150 @@
+"""Redis falso em memória usado pelos testes de cache."""
+import asyncio
+import fnmatch
+import time
+
+
+class FakeRedisServer:
+    """Servidor Redis em memória compartilhado pelos clientes falsos."""
+
+    def __init__(self):
+        self.data = {}
+        self.deadlines = {}
+        self.subscribers = {}
+        self.down = False
+
+    def disconnect(self):
+        """Derruba o servidor, encerrando as assinaturas abertas."""
+        self.down = True
+        for queues in self.subscribers.values():
+            for queue in queues:
+                queue.put_nowait(ConnectionError("Connection closed by server"))
+
+
+class FakePubSub:
+    """Assinatura falsa de canais pub/sub."""
+
+    def __init__(self, server):
+        self.server = server
+        self.queue = asyncio.Queue()
+        self.channels = []
+
+    async def subscribe(self, channel):
+        if self.server.down:
+            raise ConnectionError("Connection refused")
+        self.channels.append(channel)
+        self.server.subscribers.setdefault(channel, []).append(self.queue)
+
+    async def unsubscribe(self, channel):
+        self.server.subscribers[channel].remove(self.queue)
+
+    async def listen(self):
+        while True:
+            message = await self.queue.get()
+            if isinstance(message, Exception):
+                raise message
+            yield message
+
+
+class FakePipeline:
+    """Pipeline falso que acumula comandos até execute()."""
+
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def __getattr__(self, name):
+        command = getattr(self.client, name)
+        return lambda *args: self.commands.append((command, args))
+
+    async def execute(self):
+        self.client.pipelines += 1
+        return [await command(*args) for command, args in self.commands]
+
+
+class FakeRedis:
+    """Cliente Redis falso com os comandos usados pelo cache."""
+
+    def __init__(self, server):
+        self.server = server
+        self.mgets = 0
+        self.pipelines = 0
+
+    def _check(self):
+        if self.server.down:
+            raise ConnectionError("Connection refused")
+
+    async def ping(self):
+        self._check()
+        return True
+
+    def _lookup(self, key):
+        deadline = self.server.deadlines.get(key)
+        if deadline is not None and deadline <= time.monotonic():
+            self.server.data.pop(key, None)
+            self.server.deadlines.pop(key, None)
+        return self.server.data.get(key)
+
+    async def get(self, key):
+        self._check()
+        return self._lookup(key)
+
+    async def mget(self, keys):
+        self._check()
+        self.mgets += 1
+        return [self._lookup(key) for key in keys]
+
+    async def pttl(self, key):
+        self._check()
+        if self._lookup(key) is None:
+            return -2
+        deadline = self.server.deadlines.get(key)
+        return -1 if deadline is None else int((deadline - time.monotonic()) * 1000)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def setex(self, key, ttl, value):
+        self._check()
+        self.server.data[key] = value
+        self.server.deadlines[key] = time.monotonic() + ttl
+
+    async def delete(self, *keys):
+        self._check()
+        for key in keys:
+            self.server.data.pop(key, None)
+
+    async def exists(self, key):
+        return int(key in self.server.data)
+
+    async def flushdb(self):
+        self.server.data.clear()
+
+    async def scan_iter(self, match="*", count=None):
+        self._check()
+        for key in list(self.server.data):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    async def unlink(self, *keys):
+        self._check()
+        deleted = [key for key in keys if self.server.data.pop(key, None) is not None]
+        return len(deleted)
+
+    async def publish(self, channel, message):
+        queues = self.server.subscribers.get(channel, [])
+        for queue in queues:
+            queue.put_nowait({"type": "message", "data": message})
+        return len(queues)
+
+    def pubsub(self):
+        return FakePubSub(self.server)
+
+    async def close(self):
+        pass
@@ -1,9 +1,19 @@
+import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from src.config.exceptions import InvalidFilterError, InvalidSortError
+from src.config.exceptions import (
+    ExternalAPIError,
+    InvalidFilterError,
+    InvalidSortError,
+    ResourceNotFoundError,
+)
+from src.config.settings import Settings, settings
 from src.domain.entities.character import Character
+from src.infrastructure.cache.keys import CacheKeyspace
+from src.infrastructure.cache.memory_cache import MemoryCache
 from src.infrastructure.database.repositories.base_repository import BaseRepository
 
 
@@ -64,17 +74,34 @@ async def test_get_by_id_not_found(repository, mock_http_client, mock_cache):
         await repository.get_by_id("999")
 
 
+def paged_responses(character, total, page_size=10):
+    """Simula a paginação da SWAPI para uma coleção de personagens."""
+
+    async def fetch(url):
+        page = int(url.split("page=")[1]) if "page=" in url else 1
+        first = (page - 1) * page_size
+        last = min(first + page_size, total)
+        return {
+            "count": total,
+            "next": f"https://swapi.dev/api/people/?page={page + 1}" if last < total else None,
+            "results": [{**character, "name": f"Character {i}"} for i in range(first, last)],
+        }
+
+    return fetch
+
+
 @pytest.mark.asyncio
 async def test_get_all_success(repository, mock_http_client, mock_cache, mock_swapi_character):
     """Testa obtenção de todos os recursos."""
     mock_cache.get.return_value = None
-    mock_http_client.get.return_value = {"count": 82, "results": [mock_swapi_character]}
+    mock_http_client.get.side_effect = paged_responses(mock_swapi_character, 82)
 
     results, total = await repository.get_all(page=1, page_size=10)
 
-    assert len(results) == 1
+    assert len(results) == 10
     assert total == 82
-    assert results[0].name == "Luke Skywalker"
+    assert results[0].name == "Character 0"
+    assert mock_http_client.get.call_count == 9
 
 
 @pytest.mark.asyncio
@@ -83,12 +110,43 @@ async def test_get_all_with_pagination(
 ):
     """Testa obtenção com paginação."""
     mock_cache.get.return_value = None
-    mock_http_client.get.return_value = {"count": 82, "results": [mock_swapi_character]}
+    mock_http_client.get.side_effect = paged_responses(mock_swapi_character, 82)
 
-    results, total = await repository.get_all(page=2, page_size=10)
+    results, total = await repository.get_all(page=9, page_size=10)
 
-    assert len(results) >= 0
+    assert len(results) == 2
     assert total == 82
+    assert results[0].name == "Character 80"
+
+
+@pytest.mark.asyncio
+async def test_get_all_large_page_size(
+    repository, mock_http_client, mock_cache, mock_swapi_character
+):
+    """Testa que page_size maior que a página da SWAPI retorna a coleção toda."""
+    mock_cache.get.return_value = None
+    mock_http_client.get.side_effect = paged_responses(mock_swapi_character, 82)
+
+    results, total = await repository.get_all(page_size=1000)
+
+    assert len(results) == 82
+    assert total == 82
+
+
+@pytest.mark.asyncio
+async def test_get_all_caches_collection(
+    repository, mock_http_client, mock_cache, mock_swapi_character
+):
+    """Testa que a coleção completa é armazenada sob uma única chave."""
+    mock_cache.get.return_value = None
+    mock_http_client.get.side_effect = paged_responses(mock_swapi_character, 15)
+
+    await repository.get_all()
+
+    mock_cache.set.assert_called_once()
+    key, value, _ = mock_cache.set.call_args.args
+    assert key == repository._get_cache_key("collection")
+    assert len(value["value"]["items"]) == 15
 
 
 @pytest.mark.asyncio
@@ -126,8 +184,9 @@ async def test_search_empty_result(repository, mock_http_client, mock_cache):
 
 
 @pytest.mark.asyncio
-async def test_count_success(repository, mock_http_client):
+async def test_count_success(repository, mock_http_client, mock_cache):
     """Testa contagem de recursos."""
+    mock_cache.get.return_value = None
     mock_http_client.get.return_value = {"count": 82}
 
     count = await repository.count()
@@ -136,8 +195,9 @@ async def test_count_success(repository, mock_http_client):
 
 
 @pytest.mark.asyncio
-async def test_count_error(repository, mock_http_client):
+async def test_count_error(repository, mock_http_client, mock_cache):
     """Testa contagem com erro."""
+    mock_cache.get.return_value = None
     mock_http_client.get.side_effect = Exception("API Error")
 
     count = await repository.count()
@@ -272,3 +332,409 @@ def test_match_filter_simple_value(repository):
 
     result = repository._match_filter("male", "female")
     assert result is False
+
+
+@pytest.mark.asyncio
+async def test_get_many_preserves_order(
+    repository, mock_http_client, mock_cache, mock_swapi_character
+):
+    """Testa que get_many combina cache e HTTP preservando a ordem."""
+    cached = {**mock_swapi_character, "name": "Cached"}
+    mock_cache.get_many.side_effect = lambda keys: [
+        cached if key == repository._get_cache_key("by_id", "2") else None for key in keys
+    ]
+
+    async def fetch(url):
+        resource_id = url.rstrip("/").split("/")[-1]
+        return {**mock_swapi_character, "name": f"Http {resource_id}"}
+
+    mock_http_client.get.side_effect = fetch
+
+    results = await repository.get_many(["3", "2", "1"])
+
+    assert [result.name for result in results] == ["Http 3", "Cached", "Http 1"]
+    assert mock_http_client.get.call_count == 2
+    keys = [repository._get_cache_key("by_id", resource_id) for resource_id in ["3", "2", "1"]]
+    mock_cache.get_many.assert_awaited_once_with(keys)
+    stored = mock_cache.set_many.call_args[0][0]
+    assert set(stored) == {keys[0], keys[2]}
+    mock_cache.set.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_many_skips_missing(
+    repository, mock_http_client, mock_cache, mock_swapi_character
+):
+    """Testa que get_many ignora IDs não encontrados."""
+    mock_cache.get.return_value = None
+
+    async def fetch(url):
+        if "999" in url:
+            raise Exception("404 Not Found")
+        return mock_swapi_character
+
+    mock_http_client.get.side_effect = fetch
+
+    results = await repository.get_many(["1", "999"])
+
+    assert len(results) == 1
+    assert results[0].name == "Luke Skywalker"
+
+
+@pytest.mark.asyncio
+async def test_get_many_bounded_concurrency(
+    repository, mock_http_client, mock_cache, mock_swapi_character
+):
+    """Testa que get_many respeita o limite de concorrência."""
+    mock_cache.get.return_value = None
+    repository.max_concurrency = 2
+    active = 0
+    peak = 0
+
+    async def fetch(url):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return mock_swapi_character
+
+    mock_http_client.get.side_effect = fetch
+
+    results = await repository.get_many([str(i) for i in range(6)])
+
+    assert len(results) == 6
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_dataset_rebuilt_when_collection_changes(
+    repository, mock_cache, mock_swapi_character
+):
+    """Testa que o dataset só é reconstruído quando a coleção muda."""
+    collection = {"count": 1, "items": [mock_swapi_character], "loaded_at": 1.0}
+    mock_cache.get.return_value = collection
+
+    first = await repository.get_dataset()
+    assert await repository.get_dataset() is first
+
+    mock_cache.get.return_value = {**collection, "loaded_at": 2.0}
+    second = await repository.get_dataset()
+
+    assert second is not first
+    assert second.version == ((0, 0), 2.0)
+
+
+@pytest.mark.asyncio
+async def test_get_related_ids_uses_relationship_graph(repository, mock_http_client):
+    """Testa que IDs relacionados vêm do grafo sem chamadas HTTP."""
+    repository.relationships = AsyncMock()
+    repository.relationships.get_related_ids.return_value = ["1", "5"]
+
+    result = await repository.get_related_ids("films", "1")
+
+    assert result == ["1", "5"]
+    repository.relationships.get_related_ids.assert_called_once_with("films", "1", "people")
+    mock_http_client.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_related_ids_fallback(repository, mock_http_client):
+    """Testa busca dos IDs relacionados na SWAPI sem grafo."""
+    mock_http_client.get.return_value = {"residents": ["https://swapi.dev/api/people/1/"]}
+
+    result = await repository.get_related_ids("planets", "1")
+
+    assert result == ["1"]
+
+
+@pytest.mark.asyncio
+async def test_get_related_ids_fallback_unknown_source(repository, mock_http_client):
+    """Testa que, sem grafo, uma origem inexistente gera ResourceNotFoundError."""
+    mock_http_client.get.side_effect = ExternalAPIError("Recurso não encontrado", status_code=404)
+
+    with pytest.raises(ResourceNotFoundError):
+        await repository.get_related_ids("planets", "9999")
+
+
+@pytest.mark.asyncio
+async def test_get_many_reads_loaded_dataset(
+    repository, mock_http_client, mock_cache, mock_swapi_character
+):
+    """Testa que get_many lê entidades do dataset carregado sem I/O."""
+    mock_cache.get.return_value = {
+        "count": 1,
+        "items": [mock_swapi_character],
+        "loaded_at": time.time(),
+    }
+    await repository.get_dataset()
+    mock_cache.get.reset_mock()
+
+    results = await repository.get_many(["1"])
+
+    assert results[0].name == "Luke Skywalker"
+    mock_cache.get.assert_not_called()
+    mock_cache.get_many.assert_not_called()
+    mock_http_client.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_expired_dataset_is_not_used_by_id(
+    repository, mock_http_client, mock_cache, mock_swapi_character
+):
+    """Testa que leituras por ID ignoram um dataset mais velho que o TTL."""
+    loaded_at = time.time() - repository.cache_ttl - 1
+    mock_cache.get.return_value = {
+        "count": 1,
+        "items": [{**mock_swapi_character, "name": "Antigo"}],
+        "loaded_at": loaded_at,
+    }
+    await repository.get_dataset()
+    mock_cache.get.return_value = mock_swapi_character
+
+    result = await repository.get_by_id("1")
+
+    assert result.name == "Luke Skywalker"
+    assert not repository._is_known_missing("9999", (0, 0))
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_uses_local_entity_cache(
+    repository, mock_http_client, mock_cache, mock_swapi_character
+):
+    """Testa que a segunda leitura usa a entidade já construída."""
+    mock_cache.get.return_value = None
+    mock_http_client.get.return_value = mock_swapi_character
+
+    first = await repository.get_by_id("1")
+    second = await repository.get_by_id("1")
+
+    assert second is first
+    mock_http_client.get.assert_called_once()
+    mock_cache.get.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_does_not_revalidate(
+    repository, mock_cache, mock_swapi_character, monkeypatch
+):
+    """Testa que dados do cache compartilhado são restaurados sem validação."""
+    mock_cache.get.return_value = mock_swapi_character
+    monkeypatch.setattr(Character, "model_validate", MagicMock(side_effect=AssertionError))
+
+    result = await repository.get_by_id("1")
+
+    assert isinstance(result, Character)
+    assert result.name == "Luke Skywalker"
+
+
+@pytest.mark.asyncio
+async def test_fetch_stores_serialized_entity(
+    repository, mock_http_client, mock_cache, mock_swapi_character
+):
+    """Testa que o cache compartilhado recebe a entidade serializada."""
+    mock_cache.get.return_value = None
+    mock_http_client.get.return_value = {**mock_swapi_character, "extra": "ignorado"}
+
+    await repository.get_by_id("1")
+
+    stored = mock_cache.set.call_args[0][1]["value"]
+    assert "extra" not in stored
+    assert Character.model_construct(**stored) == Character(**mock_swapi_character)
+
+
+@pytest.mark.asyncio
+async def test_generation_bump_invalidates_resource(mock_http_client, mock_swapi_character):
+    """Testa que a nova geração faz o recurso ser buscado de novo."""
+    cache = MemoryCache()
+    repository = BaseRepository(mock_http_client, cache, "people", Character)
+    repository.keyspace = CacheKeyspace(cache)
+    mock_http_client.get.return_value = mock_swapi_character
+
+    await repository.get_by_id("1")
+    repository._entities.clear()
+    await repository.get_by_id("1")
+    assert mock_http_client.get.call_count == 1
+
+    await repository.invalidate()
+    await repository.get_by_id("1")
+    assert mock_http_client.get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_entity_removes_derived_keys(mock_http_client, mock_swapi_character):
+    """Testa que invalidar uma entidade remove a chave dela e a da coleção."""
+    cache = MemoryCache()
+    repository = BaseRepository(mock_http_client, cache, "people", Character)
+    repository.keyspace = CacheKeyspace(cache)
+    mock_http_client.get.side_effect = paged_responses(mock_swapi_character, 1)
+    await repository.get_dataset()
+    mock_http_client.get.side_effect = None
+    mock_http_client.get.return_value = mock_swapi_character
+    await repository._fetch_by_id("1", await repository._get_version())
+
+    generation = await repository._get_generation()
+    collection_key = repository._get_cache_key("collection", generation=generation)
+    entity_key = repository._get_cache_key("by_id", "1", generation=generation)
+    await repository.invalidate("1")
+
+    assert await cache.get(collection_key) is None
+    assert await cache.get(entity_key) is None
+    assert repository._dataset is None
+
+
+def make_worker(http_client, cache):
+    """Cria o repositório de um worker com estado local próprio e cache compartilhado."""
+    repository = BaseRepository(http_client, cache, "people", Character)
+    repository.keyspace = CacheKeyspace(cache)
+    return repository
+
+
+@pytest.mark.asyncio
+async def test_invalidation_reaches_local_state_of_other_workers(
+    mock_http_client, mock_swapi_character
+):
+    """Testa que uma invalidação feita em um worker descarta as cópias locais dos outros."""
+    cache = MemoryCache()
+    first = make_worker(mock_http_client, cache)
+    second = make_worker(mock_http_client, cache)
+    mock_http_client.get.return_value = mock_swapi_character
+    await second.get_by_id("1")
+
+    mock_http_client.get.return_value = {**mock_swapi_character, "name": "Renomeado"}
+    await first.invalidate("1")
+    assert (await second.get_by_id("1")).name == "Renomeado"
+
+    mock_http_client.get.return_value = {**mock_swapi_character, "name": "Outro"}
+    await first.invalidate()
+    assert (await second.get_by_id("1")).name == "Outro"
+
+
+@pytest.mark.asyncio
+async def test_invalidation_reaches_dataset_of_other_workers(
+    mock_http_client, mock_swapi_character
+):
+    """Testa que leituras por ID de outro worker não usam o dataset invalidado."""
+    cache = MemoryCache()
+    first = make_worker(mock_http_client, cache)
+    second = make_worker(mock_http_client, cache)
+    mock_http_client.get.side_effect = paged_responses(mock_swapi_character, 1)
+    await second.get_dataset()
+    assert second._is_known_missing("9999", await second._get_version())
+
+    await first.invalidate("1")
+    mock_http_client.get.side_effect = None
+    mock_http_client.get.return_value = {**mock_swapi_character, "name": "Renomeado"}
+
+    assert (await second.get_by_id("1")).name == "Renomeado"
+    assert not second._is_known_missing("9999", await second._get_version())
+
+
+@pytest.mark.asyncio
+async def test_collection_load_does_not_tag_every_entity(mock_http_client, mock_swapi_character):
+    """Testa que carregar a coleção não grava uma tag por entidade."""
+    cache = MemoryCache()
+    repository = BaseRepository(mock_http_client, cache, "people", Character)
+    repository.keyspace = CacheKeyspace(cache)
+    mock_http_client.get.side_effect = paged_responses(mock_swapi_character, 30)
+
+    await repository.get_dataset()
+
+    assert not [key for key in cache.cache if ":tag:" in key]
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_and_refreshed(mock_http_client, mock_swapi_character):
+    """Testa que um valor vencido é servido enquanto é renovado em segundo plano."""
+    cache = MemoryCache()
+    repository = BaseRepository(mock_http_client, cache, "people", Character)
+    key = repository._get_cache_key("by_id", "1")
+    stale = repository.refresh_policy.wrap({**mock_swapi_character, "name": "Antigo"}, -1, 0.1)
+    await cache.set(key, stale, 600)
+    mock_http_client.get.return_value = mock_swapi_character
+
+    result = await repository.get_by_id("1")
+    assert result.name == "Antigo"
+
+    await repository.refresh_policy.join()
+    refreshed = await cache.get(key)
+    assert refreshed["value"]["name"] == "Luke Skywalker"
+    assert repository.refresh_policy.get_stats()["stale_hits"] == 1
+    mock_http_client.get.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_stale_collection_refreshes_once(mock_http_client, mock_swapi_character):
+    """Testa que leituras concorrentes de uma coleção vencida geram uma única renovação."""
+    cache = MemoryCache()
+    repository = BaseRepository(mock_http_client, cache, "people", Character)
+    key = repository._get_cache_key("collection")
+    collection = {"items": [mock_swapi_character]}
+    await cache.set(key, repository.refresh_policy.wrap(collection, -1, 0.1), 600)
+    mock_http_client.get.side_effect = paged_responses(mock_swapi_character, 3)
+
+    for _ in range(5):
+        repository._dataset = None
+        assert await repository._load_collection() == collection
+
+    await repository.refresh_policy.join()
+    assert mock_http_client.get.call_count == 1
+    assert len((await cache.get(key))["value"]["items"]) == 3
+
+
+def test_cache_ttl_per_resource(mock_http_client, mock_cache, monkeypatch):
+    """Testa que cada recurso usa o próprio TTL, com o padrão como fallback."""
+    monkeypatch.setattr(Settings, "CACHE_TTL_BY_RESOURCE", {"films": 86400})
+
+    films = BaseRepository(mock_http_client, mock_cache, "films", Character)
+    people = BaseRepository(mock_http_client, mock_cache, "people", Character)
+
+    assert films.cache_ttl == 86400
+    assert people.cache_ttl == settings.CACHE_TTL
+
+
+@pytest.mark.asyncio
+async def test_upstream_404_is_cached_negatively(mock_http_client, mock_swapi_character):
+    """Testa que um 404 da SWAPI não é repetido enquanto o registro negativo vale."""
+    repository = BaseRepository(mock_http_client, MemoryCache(), "people", Character)
+    mock_http_client.get.side_effect = ExternalAPIError("404", status_code=404)
+
+    for _ in range(3):
+        with pytest.raises(ResourceNotFoundError):
+            await repository.get_by_id("9999")
+    assert await repository.get_many(["9999"]) == []
+
+    mock_http_client.get.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_transient_error_is_not_cached_negatively(mock_http_client):
+    """Testa que falhas transitórias da SWAPI não viram registro negativo."""
+    repository = BaseRepository(mock_http_client, MemoryCache(), "people", Character)
+    mock_http_client.get.side_effect = ExternalAPIError("timeout", status_code=504)
+
+    for _ in range(2):
+        with pytest.raises(ResourceNotFoundError):
+            await repository.get_by_id("1")
+
+    assert mock_http_client.get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_loaded_collection_rejects_unknown_ids(
+    repository, mock_http_client, mock_cache, mock_swapi_character
+):
+    """Testa que, com a coleção carregada, IDs inexistentes são rejeitados sem I/O."""
+    mock_cache.get.return_value = None
+    mock_http_client.get.side_effect = paged_responses(mock_swapi_character, 1)
+    await repository.get_dataset()
+    mock_http_client.get.reset_mock()
+    mock_cache.reset_mock()
+
+    with pytest.raises(ResourceNotFoundError):
+        await repository.get_by_id("9999")
+    assert await repository.get_many(["9999"]) == []
+
+    mock_http_client.get.assert_not_called()
+    mock_cache.get.assert_not_called()
+    mock_cache.get_many.assert_not_called()
@@ -70,3 +70,157 @@ async def test_ttl_expiration(memory_cache):
     await asyncio.sleep(1.1)
 
     assert await memory_cache.get("key1") is None
+
+
+@pytest.mark.asyncio
+async def test_max_entries_evicts_least_recently_used():
+    """Testa o despejo LRU ao atingir o limite de entradas."""
+    cache = MemoryCache(max_entries=2)
+    await cache.set("a", 1, 3600)
+    await cache.set("b", 2, 3600)
+    await cache.get("a")
+    await cache.set("c", 3, 3600)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == 1
+    assert await cache.get("c") == 3
+    assert cache.get_stats()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_max_bytes_limits_memory():
+    """Testa que o total estimado de bytes respeita o limite."""
+    cache = MemoryCache(max_bytes=2000)
+    for index in range(50):
+        await cache.set(f"key{index}", "x" * 100, 3600)
+
+    stats = cache.get_stats()
+    assert stats["bytes"] <= 2000
+    assert stats["evictions"] > 0
+    assert await cache.get("key49") is not None
+
+
+@pytest.mark.asyncio
+async def test_value_larger_than_max_bytes_is_rejected():
+    """Testa que um valor maior que o orçamento inteiro não é armazenado."""
+    cache = MemoryCache(max_bytes=100)
+    await cache.set("big", "x" * 1000, 3600)
+
+    assert await cache.get("big") is None
+    assert cache.get_stats()["rejections"] == 1
+
+
+@pytest.mark.asyncio
+async def test_lfu_policy_keeps_frequent_keys():
+    """Testa que a política LFU despeja a chave menos acessada."""
+    cache = MemoryCache(max_entries=2, policy="lfu")
+    await cache.set("a", 1, 3600)
+    await cache.set("b", 2, 3600)
+    await cache.get("a")
+    await cache.get("a")
+    await cache.get("b")
+    await cache.set("c", 3, 3600)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == 1
+
+
+@pytest.mark.asyncio
+async def test_tinylfu_rejects_one_hit_scan():
+    """Testa que chaves vistas uma vez não expulsam chaves populares."""
+    cache = MemoryCache(max_entries=2, policy="tinylfu")
+    await cache.set("a", 1, 3600)
+    await cache.set("b", 2, 3600)
+    for _ in range(5):
+        await cache.get("a")
+        await cache.get("b")
+
+    for index in range(10):
+        await cache.set(f"scan{index}", index, 3600)
+
+    assert await cache.get("a") == 1
+    assert await cache.get("b") == 2
+    assert cache.get_stats()["rejections"] == 10
+
+
+@pytest.mark.asyncio
+async def test_clear_resets_memory_usage():
+    """Testa que clear zera o uso de memória."""
+    cache = MemoryCache(max_entries=10)
+    await cache.set("a", {"data": "value"}, 3600)
+    await cache.clear()
+
+    assert cache.get_stats()["bytes"] == 0
+    assert cache.get_stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_expiration_uses_monotonic_clock(monkeypatch):
+    """Testa que os prazos seguem time.monotonic, e não o relógio do sistema."""
+    now = [1000.0]
+    monkeypatch.setattr("src.infrastructure.cache.memory_cache.time.monotonic", lambda: now[0])
+    cache = MemoryCache()
+    await cache.set("key1", "value", 10)
+
+    now[0] += 9
+    assert await cache.exists("key1") is True
+
+    now[0] += 1
+    assert await cache.get("key1") is None
+    assert cache.get_stats()["expirations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_expire_removes_only_expired_keys(monkeypatch):
+    """Testa a expiração ativa de chaves que nunca mais são lidas."""
+    now = [1000.0]
+    monkeypatch.setattr("src.infrastructure.cache.memory_cache.time.monotonic", lambda: now[0])
+    cache = MemoryCache()
+    await cache.set("short", "value", 5)
+    await cache.set("long", "value", 60)
+    await cache.set("rewritten", "value", 5)
+    await cache.set("rewritten", "value", 60)
+
+    now[0] += 10
+    assert cache.expire() == 1
+
+    stats = cache.get_stats()
+    assert stats["entries"] == 2
+    assert stats["expirations"] == 1
+    assert await cache.get("rewritten") == "value"
+
+
+@pytest.mark.asyncio
+async def test_deadline_heap_is_compacted():
+    """Testa que regravações não fazem o heap de prazos crescer sem limite."""
+    cache = MemoryCache()
+    for index in range(1000):
+        await cache.set("key", index, 60)
+
+    assert len(cache.deadlines) <= 2 * len(cache.cache) + 64
+
+
+@pytest.mark.asyncio
+async def test_sweeper_starts_and_stops():
+    """Testa que a tarefa de fundo remove chaves expiradas."""
+    import asyncio
+
+    cache = MemoryCache(sweep_interval=0.01)
+    await cache.set("key1", "value", 0)
+    await cache.start()
+    await asyncio.sleep(0.05)
+    await cache.stop()
+
+    assert cache.get_stats()["entries"] == 0
+    assert cache._sweeper is None
+
+
+@pytest.mark.asyncio
+async def test_batch_operations(memory_cache):
+    """Testa get_many, set_many e delete_many."""
+    await memory_cache.set_many({"a": 1, "b": 2}, 3600)
+
+    assert await memory_cache.get_many(["a", "missing", "b"]) == [1, None, 2]
+
+    await memory_cache.delete_many(["a", "missing"])
+    assert await memory_cache.get_many(["a", "b"]) == [None, 2]
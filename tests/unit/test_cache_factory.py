@@ -5,6 +5,7 @@ import pytest
 from src.infrastructure.cache.cache_factory import CacheFactory
 from src.infrastructure.cache.memory_cache import MemoryCache
 from src.infrastructure.cache.redis_cache import RedisCache
+from src.infrastructure.cache.tiered_cache import TieredCache
 
 
 class TestCacheFactory:
@@ -14,6 +15,7 @@ class TestCacheFactory:
         """Testa criação de cache em memória por padrão."""
         with patch("src.infrastructure.cache.cache_factory.settings") as mock_settings:
             mock_settings.REDIS_URL = None
+            mock_settings.CACHE_DISK_PATH = ""
 
             cache = CacheFactory.create_cache()
 
@@ -26,12 +28,30 @@ class TestCacheFactory:
 
             cache = CacheFactory.create_cache()
 
-            assert isinstance(cache, RedisCache)
+            assert isinstance(cache, TieredCache)
+            assert isinstance(cache.l1, MemoryCache)
+            assert isinstance(cache.l2, RedisCache)
+
+    def test_create_cache_disk_when_configured(self, tmp_path):
+        """Testa que, sem Redis, CACHE_DISK_PATH coloca o disco sob a memória."""
+        from src.infrastructure.cache.disk_cache import DiskCache
+
+        with patch("src.infrastructure.cache.cache_factory.settings") as mock_settings:
+            mock_settings.REDIS_URL = None
+            mock_settings.CACHE_DISK_PATH = str(tmp_path / "cache.db")
+
+            cache = CacheFactory.create_cache()
+
+            assert isinstance(cache, TieredCache)
+            assert isinstance(cache.l1, MemoryCache)
+            assert isinstance(cache.l2, DiskCache)
+            assert cache.l2.path == str(tmp_path / "cache.db")
 
     def test_create_cache_memory_when_redis_url_empty(self):
         """Testa criação de cache em memória quando REDIS_URL está vazio."""
         with patch("src.infrastructure.cache.cache_factory.settings") as mock_settings:
             mock_settings.REDIS_URL = ""
+            mock_settings.CACHE_DISK_PATH = ""
 
             cache = CacheFactory.create_cache()
 
@@ -51,8 +71,9 @@ class TestCacheFactory:
 
                 cache = CacheFactory.create_cache()
 
-                assert isinstance(cache, RedisCache)
-                assert cache.redis_url == url
+                assert isinstance(cache, TieredCache)
+                assert isinstance(cache.l2, RedisCache)
+                assert cache.l2.redis_url == url
 
     def test_create_cache_returns_iface_implementation(self):
         """Testa que factory retorna implementação de ICache."""
@@ -60,6 +81,7 @@ class TestCacheFactory:
 
         with patch("src.infrastructure.cache.cache_factory.settings") as mock_settings:
             mock_settings.REDIS_URL = None
+            mock_settings.CACHE_DISK_PATH = ""
 
             cache = CacheFactory.create_cache()
 
@@ -74,6 +96,7 @@ class TestCacheFactory:
         """Testa que múltiplas chamadas criam instâncias independentes."""
         with patch("src.infrastructure.cache.cache_factory.settings") as mock_settings:
             mock_settings.REDIS_URL = None
+            mock_settings.CACHE_DISK_PATH = ""
 
             cache1 = CacheFactory.create_cache()
             cache2 = CacheFactory.create_cache()
@@ -87,6 +110,7 @@ class TestCacheFactory:
         """Testa que MemoryCache tem todos os métodos necessários."""
         with patch("src.infrastructure.cache.cache_factory.settings") as mock_settings:
             mock_settings.REDIS_URL = None
+            mock_settings.CACHE_DISK_PATH = ""
 
             cache = CacheFactory.create_cache()
 
@@ -108,8 +132,8 @@ class TestCacheFactory:
             assert callable(cache.delete)
             assert callable(cache.clear)
             assert callable(cache.exists)
-            assert callable(cache.connect)
-            assert callable(cache.disconnect)
+            assert callable(cache.l2.connect)
+            assert callable(cache.l2.disconnect)
 
     def test_factory_is_static_method(self):
         """Testa que create_cache é um método estático."""
@@ -119,6 +143,7 @@ class TestCacheFactory:
         """Testa criação com REDIS_URL = None."""
         with patch("src.infrastructure.cache.cache_factory.settings") as mock_settings:
             mock_settings.REDIS_URL = None
+            mock_settings.CACHE_DISK_PATH = ""
 
             cache = CacheFactory.create_cache()
 
@@ -128,6 +153,7 @@ class TestCacheFactory:
         """Testa criação com REDIS_URL = False."""
         with patch("src.infrastructure.cache.cache_factory.settings") as mock_settings:
             mock_settings.REDIS_URL = False
+            mock_settings.CACHE_DISK_PATH = ""
 
             cache = CacheFactory.create_cache()
 
@@ -138,6 +164,7 @@ class TestCacheFactory:
         with patch("src.infrastructure.cache.cache_factory.settings") as mock_settings:
             with patch("src.infrastructure.cache.cache_factory.logger") as mock_logger:
                 mock_settings.REDIS_URL = None
+                mock_settings.CACHE_DISK_PATH = ""
 
                 cache = CacheFactory.create_cache()
 
@@ -152,4 +179,4 @@ class TestCacheFactory:
 
                 cache = CacheFactory.create_cache()
 
-                assert isinstance(cache, RedisCache)
+                assert isinstance(cache.l2, RedisCache)
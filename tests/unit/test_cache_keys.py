@@ -0,0 +1,75 @@
+import pytest
+
+from src.infrastructure.cache.keys import CacheKeyspace, canonical_part
+from src.infrastructure.cache.memory_cache import MemoryCache
+
+
+def test_canonical_part_ignores_dict_order():
+    """Testa que filtros equivalentes geram a mesma chave."""
+    first = {"gender": "male", "height": {"operator": "gt", "value": 100}}
+    second = {"height": {"value": 100, "operator": "gt"}, "gender": "male"}
+
+    assert canonical_part(first) == canonical_part(second)
+    assert len(canonical_part(first)) == 32
+
+
+def test_simple_parts_stay_readable():
+    """Testa que IDs simples não são resumidos por hash."""
+    keyspace = CacheKeyspace(namespace="app", schema_version=2)
+
+    assert keyspace.key("people", "by_id", "1", generation=7) == "app:v2:people:g7:by_id:1"
+    assert keyspace.key("people", "collection") == "app:v2:people:g0:collection"
+    assert canonical_part("luke skywalker") != "luke skywalker"
+
+
+@pytest.mark.asyncio
+async def test_generation_is_created_and_bumped():
+    """Testa a criação e o incremento da geração de um recurso."""
+    keyspace = CacheKeyspace(MemoryCache(), clock=lambda: 1700000000.0)
+
+    generation = await keyspace.get_generation("films")
+    assert generation == 1700000000000
+    assert await keyspace.get_generation("films") == generation
+
+    assert await keyspace.bump("films") == generation + 1
+    assert await keyspace.get_generation("films") == generation + 1
+    assert await keyspace.get_generation("people") == generation
+
+
+@pytest.mark.asyncio
+async def test_touch_changes_version_but_not_generation():
+    """Testa que a revisão avança sem mudar a geração das chaves."""
+    keyspace = CacheKeyspace(MemoryCache(), clock=lambda: 1700000000.0)
+    generation, revision = await keyspace.get_version("people")
+    assert revision == 0
+
+    first = await keyspace.touch("people")
+    second = await keyspace.touch("people")
+
+    assert second == first + 1
+    assert await keyspace.get_version("people") == (generation, second)
+    assert await keyspace.get_generation("people") == generation
+
+
+@pytest.mark.asyncio
+async def test_tag_invalidation_removes_all_tagged_keys():
+    """Testa que invalidar uma tag remove todas as chaves associadas."""
+    cache = MemoryCache()
+    keyspace = CacheKeyspace(cache)
+    await cache.set_many({"a": 1, "b": 2, "c": 3}, 60)
+    await keyspace.tag({"people:1": ["a"]}, 60)
+    await keyspace.tag({"people:1": ["b"], "people:2": ["c"]}, 60)
+
+    assert await keyspace.invalidate_tag("people:1") == 2
+
+    assert await cache.get_many(["a", "b", "c"]) == [None, None, 3]
+
+
+@pytest.mark.asyncio
+async def test_keyspace_without_cache_is_inert():
+    """Testa que, sem cache, a geração é 0 e as tags são ignoradas."""
+    keyspace = CacheKeyspace()
+
+    assert await keyspace.get_generation("people") == 0
+    assert await keyspace.bump("people") == 0
+    assert await keyspace.invalidate_tag("people:1") == 0
@@ -144,3 +144,21 @@ async def test_get_characters_from_planet_success(
     result = await character_service.get_characters_from_planet("1")
 
     assert len(result) >= 0
+
+
+def test_characters_route_returns_404_for_unknown_film():
+    """Testa que a rota de personagens de um filme inexistente responde 404."""
+    from fastapi.testclient import TestClient
+
+    from src.presentation.api.dependencies import get_character_service
+    from src.presentation.main import create_app
+
+    repository = AsyncMock()
+    repository.get_related_ids.side_effect = ResourceNotFoundError("films", "9999")
+    app = create_app()
+    app.dependency_overrides[get_character_service] = lambda: CharacterService(repository)
+
+    response = TestClient(app).get("/api/characters/film/9999/characters")
+
+    assert response.status_code == 404
+    repository.get_many.assert_not_called()
@@ -0,0 +1,65 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.infrastructure.http.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+@pytest.fixture
+def breaker():
+    """Fixture para disjuntor que abre após três falhas."""
+    return CircuitBreaker("swapi.dev", failure_threshold=3, recovery_timeout=30)
+
+
+def test_opens_after_consecutive_failures(breaker):
+    """Testa que o circuito abre ao atingir o limite de falhas."""
+    for _ in range(3):
+        assert breaker.allow()
+        breaker.record_failure()
+
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    assert breaker.get_stats()["rejected"] == 1
+
+
+def test_success_resets_failures(breaker):
+    """Testa que um sucesso zera a contagem de falhas consecutivas."""
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CLOSED
+
+
+def test_half_open_allows_single_trial(breaker):
+    """Testa que, após o prazo, apenas uma chamada de teste é liberada."""
+    for _ in range(3):
+        breaker.record_failure()
+
+    with patch(
+        "src.infrastructure.http.circuit_breaker.time.monotonic",
+        return_value=breaker.opened_at + 31,
+    ):
+        assert breaker.state == HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()
+
+        breaker.record_success()
+        assert breaker.state == CLOSED
+
+
+def test_half_open_failure_reopens(breaker):
+    """Testa que uma falha na chamada de teste reabre o circuito."""
+    for _ in range(3):
+        breaker.record_failure()
+
+    with patch(
+        "src.infrastructure.http.circuit_breaker.time.monotonic",
+        return_value=breaker.opened_at + 31,
+    ):
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == OPEN
+
+    assert breaker.get_stats()["opens"] == 2
@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from src.config.exceptions import CacheError
+from src.infrastructure.cache.codec import (
+    FORMAT_VERSION,
+    NO_COMPRESSION,
+    ZLIB_COMPRESSION,
+    CacheCodec,
+    available_serializers,
+)
+
+VALUE = {
+    "count": 2,
+    "items": [
+        {"name": f"Character {i}", "films": ["https://swapi.dev/api/films/1/"] * 5}
+        for i in range(50)
+    ],
+}
+
+
+@pytest.mark.parametrize("serializer", list(available_serializers()))
+def test_round_trip(serializer):
+    """Testa codificação e decodificação com cada serializador disponível."""
+    codec = CacheCodec(serializer=serializer, compression="zlib", compress_threshold=128)
+
+    assert codec.decode(codec.encode(VALUE)) == VALUE
+
+
+def test_header_and_compression_threshold():
+    """Testa que só payloads acima do limite são comprimidos."""
+    codec = CacheCodec(serializer="json", compression="zlib", compress_threshold=1024)
+
+    small = codec.encode({"name": "Luke"})
+    large = codec.encode(VALUE)
+
+    assert small[0] == FORMAT_VERSION and small[2] == NO_COMPRESSION
+    assert large[0] == FORMAT_VERSION and large[2] == ZLIB_COMPRESSION
+    assert len(large) < len(json.dumps(VALUE))
+
+
+def test_decodes_legacy_json_entries():
+    """Testa que valores antigos, gravados como JSON puro, continuam legíveis."""
+    codec = CacheCodec()
+
+    assert codec.decode(json.dumps(VALUE).encode()) == VALUE
+    assert codec.decode(json.dumps(VALUE)) == VALUE
+
+
+def test_reads_entries_written_by_other_codec():
+    """Testa que um codec lê entradas gravadas com outra configuração."""
+    writer = CacheCodec(serializer="json", compression="zlib", compress_threshold=0)
+    reader = CacheCodec(serializer="auto", compression="none")
+
+    assert reader.decode(writer.encode(VALUE)) == VALUE
+
+
+def test_unsupported_format_raises():
+    """Testa erro ao ler formato desconhecido."""
+    codec = CacheCodec()
+
+    with pytest.raises(CacheError):
+        codec.decode(bytes((FORMAT_VERSION, 99, NO_COMPRESSION)) + b"{}")
+
+
+def test_unavailable_options_fall_back():
+    """Testa que opções indisponíveis usam os padrões."""
+    codec = CacheCodec(serializer="unknown", compression="unknown")
+
+    assert codec.serializer.name == "json"
+    assert codec.compressor.name == "zlib"
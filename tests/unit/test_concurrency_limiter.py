@@ -0,0 +1,182 @@
+import asyncio
+import random
+
+import httpx
+import pytest
+
+from src.config.exceptions import ExternalAPIError
+from src.infrastructure.http.concurrency_limiter import AIMDLimiter, ConcurrencyLimitExceeded
+from src.infrastructure.http.retry import RetryPolicy
+from src.infrastructure.http.swapi_client import SwapiClient
+
+
+@pytest.mark.asyncio
+async def test_limit_grows_with_successes_under_load():
+    """Testa o aumento aditivo quando o limite está em uso."""
+    limiter = AIMDLimiter(initial_limit=4, max_limit=10)
+    for _ in range(4):
+        await limiter.acquire()
+
+    for _ in range(4):
+        limiter.release(0.01)
+
+    assert limiter.limit > 4
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_limit_does_not_grow_when_idle():
+    """Testa que sucessos com o limite ocioso não aumentam o limite."""
+    limiter = AIMDLimiter(initial_limit=10)
+    for _ in range(5):
+        await limiter.acquire()
+        limiter.release(0.01)
+
+    assert limiter.limit == 10
+
+
+@pytest.mark.asyncio
+async def test_drop_decreases_limit():
+    """Testa a redução multiplicativa em erros de sobrecarga."""
+    limiter = AIMDLimiter(initial_limit=10, backoff_ratio=0.5, min_limit=2)
+
+    for _ in range(3):
+        await limiter.acquire()
+        limiter.release(0.01, dropped=True)
+
+    assert limiter.limit == 2
+    assert limiter.get_stats()["drops"] == 3
+
+
+@pytest.mark.asyncio
+async def test_latency_spike_counts_as_drop():
+    """Testa que uma alta sustentada de latência reduz o limite uma vez por janela."""
+    limiter = AIMDLimiter(initial_limit=10, latency_tolerance=3.0)
+    for _ in range(limiter.MIN_SAMPLES):
+        await limiter.acquire()
+        limiter.release(0.01)
+
+    for _ in range(5):
+        await limiter.acquire()
+        limiter.release(0.5)
+
+    assert limiter.limit < 10
+    assert limiter.get_stats()["drops"] == 1
+
+
+@pytest.mark.asyncio
+async def test_jittered_latency_without_load_keeps_limit():
+    """Testa que a variação normal de latência, sem carga, não reduz o limite."""
+    rng = random.Random(42)
+    for sigma in (0.5, 0.7):
+        limiter = AIMDLimiter(initial_limit=20)
+        for _ in range(5000):
+            await limiter.acquire()
+            limiter.release(0.05 * rng.lognormvariate(0, sigma))
+
+        assert limiter.limit == 20
+        assert limiter.get_stats()["drops"] == 0
+
+
+@pytest.mark.asyncio
+async def test_excess_waits_in_fifo_queue():
+    """Testa que, acima do limite, as requisições esperam na ordem de chegada."""
+    limiter = AIMDLimiter(initial_limit=1)
+    await limiter.acquire()
+    order = []
+
+    async def worker(name):
+        await limiter.acquire()
+        order.append(name)
+        limiter.release(0.01)
+
+    tasks = [asyncio.create_task(worker(name)) for name in "abc"]
+    await asyncio.sleep(0)
+    assert limiter.get_stats()["waiting"] == 3
+
+    limiter.release(0.01)
+    await asyncio.gather(*tasks)
+
+    assert order == ["a", "b", "c"]
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_full_queue_sheds_requests():
+    """Testa o descarte quando a fila está cheia."""
+    limiter = AIMDLimiter(initial_limit=1, max_queue=1)
+    await limiter.acquire()
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    with pytest.raises(ConcurrencyLimitExceeded):
+        await limiter.acquire()
+
+    limiter.release(0.01)
+    await waiting
+    assert limiter.get_stats()["shed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_queue_timeout_sheds_requests():
+    """Testa o descarte de quem espera demais na fila."""
+    limiter = AIMDLimiter(initial_limit=1, queue_timeout=0.01)
+    await limiter.acquire()
+
+    with pytest.raises(ConcurrencyLimitExceeded):
+        await limiter.acquire()
+
+    assert limiter.get_stats()["waiting"] == 0
+    limiter.release(0.01)
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_swapi_client_limits_concurrent_requests():
+    """Testa que o cliente não passa do limite de requisições simultâneas."""
+    active = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return httpx.Response(200, json={"url": str(request.url)})
+
+    client = SwapiClient(
+        retry_policy=RetryPolicy(max_attempts=1),
+        limiter=AIMDLimiter(initial_limit=3, max_limit=3),
+    )
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    await asyncio.gather(*(client.get(f"https://swapi.dev/api/people/{i}/") for i in range(12)))
+
+    assert peak == 3
+    assert client.get_stats()["concurrency"]["queued"] > 0
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_swapi_client_sheds_with_503_and_backs_off_on_overload():
+    """Testa que 503 reduz o limite e o descarte vira ExternalAPIError 503."""
+    client = SwapiClient(
+        retry_policy=RetryPolicy(max_attempts=1),
+        limiter=AIMDLimiter(initial_limit=4, max_queue=0),
+    )
+    client.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(503))
+    )
+
+    with pytest.raises(ExternalAPIError):
+        await client.get("https://swapi.dev/api/people/1/")
+    assert client.limiter.limit < 4
+
+    client.limiter.in_flight = int(client.limiter.limit)
+    with pytest.raises(ExternalAPIError) as exc_info:
+        await client.get("https://swapi.dev/api/people/2/")
+
+    assert exc_info.value.status_code == 503
+    assert client.get_stats()["concurrency"]["shed"] == 1
+    await client.close()
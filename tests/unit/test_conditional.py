@@ -0,0 +1,125 @@
+import hashlib
+import json
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request, Response
+
+from src.infrastructure.http.conditional import ConditionalCache
+from src.infrastructure.http.retry import RetryPolicy
+from src.infrastructure.http.swapi_client import SwapiClient
+
+LAST_MODIFIED = "Tue, 09 Dec 2014 13:50:51 GMT"
+
+
+def create_stub(people, validators=("etag", "last-modified")):
+    """Cria um servidor ASGI que imita a SWAPI emitindo validadores."""
+    app = FastAPI()
+    app.state.requests = []
+
+    @app.get("/api/people/{person_id}/")
+    async def get_person(person_id: str, request: Request):
+        app.state.requests.append(dict(request.headers))
+        body = json.dumps(people[person_id]).encode()
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        headers = {}
+        if "etag" in validators:
+            headers["ETag"] = etag
+        if "last-modified" in validators:
+            headers["Last-Modified"] = LAST_MODIFIED
+
+        if "etag" in validators and request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        if (
+            "etag" not in validators
+            and "last-modified" in validators
+            and request.headers.get("if-modified-since") == LAST_MODIFIED
+        ):
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type="application/json", headers=headers)
+
+    return app
+
+
+def make_client(app):
+    """Cria um cliente SWAPI apontado para o servidor stub."""
+    client = SwapiClient(retry_policy=RetryPolicy(max_attempts=1))
+    client.client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+    return client
+
+
+URL = "http://swapi.test/api/people/1/"
+
+
+@pytest.mark.asyncio
+async def test_revalidates_with_etag():
+    """Testa que a segunda busca é condicional e o 304 reaproveita o corpo."""
+    people = {"1": {"name": "Luke Skywalker"}}
+    app = create_stub(people)
+    client = make_client(app)
+
+    first = await client.get(URL)
+    second = await client.get(URL)
+
+    assert second == first == {"name": "Luke Skywalker"}
+    assert second is first
+    assert "if-none-match" not in app.state.requests[0]
+    assert app.state.requests[1]["if-none-match"] == client.conditional.lookup(URL).etag
+    assert client.get_stats()["conditional"]["not_modified"] == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_changed_resource_is_downloaded_again():
+    """Testa que um recurso alterado volta com 200 e novos validadores."""
+    people = {"1": {"name": "Luke Skywalker"}}
+    app = create_stub(people)
+    client = make_client(app)
+
+    await client.get(URL)
+    people["1"] = {"name": "Luke Skywalker", "height": "172"}
+
+    assert await client.get(URL) == {"name": "Luke Skywalker", "height": "172"}
+    assert client.get_stats()["conditional"]["not_modified"] == 0
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_revalidates_with_last_modified():
+    """Testa a revalidação quando o servidor só envia Last-Modified."""
+    app = create_stub({"1": {"name": "Luke Skywalker"}}, validators=("last-modified",))
+    client = make_client(app)
+
+    await client.get(URL)
+    await client.get(URL)
+
+    assert app.state.requests[1]["if-modified-since"] == LAST_MODIFIED
+    assert client.get_stats()["conditional"]["not_modified"] == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_unchanged_body_without_validators_is_not_parsed_again():
+    """Testa que, sem validadores, o hash evita decodificar o mesmo corpo."""
+    app = create_stub({"1": {"name": "Luke Skywalker"}}, validators=())
+    client = make_client(app)
+
+    first = await client.get(URL)
+    second = await client.get(URL)
+
+    assert second is first
+    assert "if-none-match" not in app.state.requests[1]
+    assert client.get_stats()["conditional"]["unchanged_bodies"] == 1
+    await client.close()
+
+
+def test_conditional_cache_is_bounded():
+    """Testa que só as URLs mais recentes ficam guardadas."""
+    cache = ConditionalCache(max_entries=2)
+    for i in range(3):
+        response = httpx.Response(200, json={"id": i}, headers={"ETag": f'"{i}"'})
+        cache.load(f"url{i}", response)
+
+    assert len(cache) == 2
+    assert cache.lookup("url0") is None
+    assert cache.lookup("url2").etag == '"2"'
@@ -0,0 +1,52 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.infrastructure.cache.memory_cache import MemoryCache
+from src.presentation.container import Container
+
+
+@pytest.fixture
+def container():
+    """Fixture para contêiner com cliente HTTP mockado."""
+    return Container(http_client=AsyncMock(), cache=MemoryCache())
+
+
+def test_repositories_share_client_and_cache(container):
+    """Testa que todos os repositórios compartilham cliente e cache."""
+    repositories = [
+        container.character_repository,
+        container.film_repository,
+        container.planet_repository,
+        container.starship_repository,
+    ]
+
+    for repository in repositories:
+        assert repository.http_client is container.http_client
+        assert repository.cache is container.cache
+
+
+def test_services_use_container_repositories(container):
+    """Testa que os serviços usam os repositórios do contêiner."""
+    assert container.character_service.repository is container.character_repository
+    assert container.film_service.repository is container.film_repository
+    assert container.planet_service.repository is container.planet_repository
+    assert container.starship_service.repository is container.starship_repository
+
+
+@pytest.mark.asyncio
+async def test_shutdown_closes_http_client(container):
+    """Testa que o encerramento fecha o cliente HTTP."""
+    await container.shutdown()
+
+    container.http_client.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_lifecycle_starts_and_stops_cache(container):
+    """Testa que o contêiner inicia e encerra as tarefas do cache."""
+    await container.startup()
+    assert container.cache._sweeper is not None
+
+    await container.shutdown()
+    assert container.cache._sweeper is None
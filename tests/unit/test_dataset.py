@@ -0,0 +1,203 @@
+import pytest
+
+from src.config.exceptions import InvalidFilterError
+from src.domain.entities.character import Character
+from src.infrastructure.database.dataset import Dataset
+
+
+@pytest.fixture
+def characters(mock_swapi_character):
+    """Fixture com uma pequena coleção de personagens."""
+    data = [
+        ("Luke Skywalker", "male", "blue"),
+        ("Leia Organa", "female", "brown"),
+        ("Darth Vader", "male", "yellow"),
+        ("Padmé Amidala", "female", "brown"),
+        ("R2-D2", "n/a", "red"),
+    ]
+    return [
+        Character(**{**mock_swapi_character, "name": name, "gender": gender, "eye_color": eyes})
+        for name, gender, eyes in data
+    ]
+
+
+@pytest.fixture
+def dataset(characters):
+    """Fixture para dataset indexado de personagens."""
+    return Dataset(
+        characters,
+        fields=Character.model_fields.keys(),
+        indexed_fields=("gender", "eye_color"),
+    )
+
+
+def test_columns_and_indexes(dataset):
+    """Testa construção das colunas e dos índices."""
+    assert dataset.columns["name"][0] == "Luke Skywalker"
+    assert dataset.indexes["gender"]["female"] == [1, 3]
+    assert "name" not in dataset.indexes
+
+
+def test_filter_eq_uses_index(dataset):
+    """Testa filtro de igualdade em campo indexado."""
+    rows = dataset.filter({"gender": "male"})
+
+    assert [c.name for c in dataset.select(rows)] == ["Luke Skywalker", "Darth Vader"]
+
+
+def test_filter_combined(dataset):
+    """Testa combinação de filtros indexados e por varredura."""
+    rows = dataset.filter(
+        {
+            "gender": {"operator": "in", "value": ["female", "n/a"]},
+            "name": {"operator": "contains", "value": "a"},
+            "eye_color": {"operator": "ne", "value": "red"},
+        }
+    )
+
+    assert [c.name for c in dataset.select(rows)] == ["Leia Organa", "Padmé Amidala"]
+
+
+def test_filter_invalid_field(dataset):
+    """Testa filtro com campo inexistente."""
+    with pytest.raises(InvalidFilterError):
+        dataset.filter({"invalid_field": "value"})
+
+
+def test_sort_permutation_is_memoized(dataset):
+    """Testa que a permutação de ordenação é calculada uma única vez."""
+    first = dataset.sort(None, "name", "asc")
+    permutation = dataset._sort_cache[(("name", False),)]
+    second = dataset.sort(None, "name", "asc")
+
+    assert first == second
+    assert dataset._sort_cache[(("name", False),)] is permutation
+    assert dataset.select(first)[0].name == "Darth Vader"
+
+
+def test_query_filters_and_sorts(dataset):
+    """Testa consulta com filtro e ordenação descendente."""
+    rows = dataset.query({"gender": "female"}, sort_by="name", sort_order="desc")
+
+    assert [c.name for c in dataset.select(rows)] == ["Padmé Amidala", "Leia Organa"]
+
+
+def test_search(dataset):
+    """Testa busca textual por coluna."""
+    rows = dataset.search("sky", ["name"])
+
+    assert [c.name for c in dataset.select(rows)] == ["Luke Skywalker"]
+
+
+@pytest.fixture
+def numeric_dataset(mock_swapi_character):
+    """Fixture para dataset com colunas numéricas."""
+    data = [("Luke", "172"), ("Chewbacca", "228"), ("Yoda", "66"), ("Unknown", "unknown")]
+    characters = [
+        Character(**{**mock_swapi_character, "name": name, "height": height, "mass": "1,358"})
+        for name, height in data
+    ]
+    return Dataset(
+        characters,
+        fields=Character.model_fields.keys(),
+        numeric_fields=("height", "mass"),
+    )
+
+
+def test_parse_number():
+    """Testa conversão de valores numéricos da SWAPI."""
+    import math
+
+    from src.infrastructure.database.dataset import parse_number
+
+    assert parse_number("172") == 172.0
+    assert parse_number("1,000,000") == 1000000.0
+    assert parse_number("1e6") == 1000000.0
+    assert math.isnan(parse_number("unknown"))
+    assert math.isnan(parse_number("30-165"))
+    assert math.isnan(parse_number(None))
+
+
+def test_numeric_columns(numeric_dataset):
+    """Testa que as colunas numéricas são tipadas uma única vez."""
+    assert numeric_dataset.numeric_columns["mass"][0] == 1358.0
+    values, rows = numeric_dataset._numeric_sorted["height"]
+    assert values == [66.0, 172.0, 228.0]
+    assert rows == [2, 0, 1]
+
+
+@pytest.mark.parametrize(
+    "operator,value,expected",
+    [
+        ("gt", "172", ["Chewbacca"]),
+        ("gte", "172", ["Luke", "Chewbacca"]),
+        ("lt", "172", ["Yoda"]),
+        ("lte", "172", ["Luke", "Yoda"]),
+        ("gte", "unknown", []),
+    ],
+)
+def test_range_filters(numeric_dataset, operator, value, expected):
+    """Testa filtros de intervalo por busca binária."""
+    rows = numeric_dataset.filter({"height": {"operator": operator, "value": value}})
+
+    assert [c.name for c in numeric_dataset.select(rows)] == expected
+
+
+def test_range_filter_combined_conditions(numeric_dataset):
+    """Testa múltiplas condições de intervalo no mesmo campo."""
+    rows = numeric_dataset.filter(
+        {"height": [{"operator": "gt", "value": "100"}, {"operator": "lt", "value": "200"}]}
+    )
+
+    assert [c.name for c in numeric_dataset.select(rows)] == ["Luke"]
+
+
+def test_range_filter_on_non_numeric_column(numeric_dataset):
+    """Testa filtro de intervalo em coluna sem índice numérico."""
+    rows = numeric_dataset.filter({"birth_year": {"operator": "gt", "value": "0"}})
+
+    assert rows == []
+
+
+def test_numeric_sort_unknowns_last(numeric_dataset):
+    """Testa ordenação numérica com desconhecidos no fim em ambas as direções."""
+    asc = numeric_dataset.select(numeric_dataset.sort(None, "height", "asc"))
+    desc = numeric_dataset.select(numeric_dataset.sort(None, "height", "desc"))
+
+    assert [c.name for c in asc] == ["Yoda", "Luke", "Chewbacca", "Unknown"]
+    assert [c.name for c in desc] == ["Chewbacca", "Luke", "Yoda", "Unknown"]
+
+
+def test_multi_key_sort(mock_swapi_character):
+    """Testa ordenação por múltiplas chaves com direção por chave."""
+    data = [
+        ("A", "male", "80"),
+        ("B", "female", "50"),
+        ("C", "male", "120"),
+        ("D", "female", "unknown"),
+    ]
+    characters = [
+        Character(**{**mock_swapi_character, "name": name, "gender": gender, "mass": mass})
+        for name, gender, mass in data
+    ]
+    dataset = Dataset(characters, fields=Character.model_fields.keys(), numeric_fields=("mass",))
+
+    rows = dataset.sort(None, "gender,-mass")
+
+    assert [c.name for c in dataset.select(rows)] == ["B", "D", "C", "A"]
+    assert ((("gender", False), ("mass", True))) in dataset._sort_cache
+
+
+def test_sort_filtered_rows(numeric_dataset):
+    """Testa ordenação de um subconjunto de linhas."""
+    rows = numeric_dataset.query(
+        {"height": {"operator": "gt", "value": "100"}}, sort_by="height", sort_order="desc"
+    )
+
+    assert [c.name for c in numeric_dataset.select(rows)] == ["Chewbacca", "Luke"]
+
+
+def test_sort_invalid_key(dataset):
+    """Testa ordenação com chave inexistente entre várias."""
+    with pytest.raises(InvalidFilterError):
+        dataset.sort(None, "name,-invalid")
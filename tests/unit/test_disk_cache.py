@@ -0,0 +1,137 @@
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.infrastructure.cache.disk_cache import DiskCache
+from src.infrastructure.cache.memory_cache import MemoryCache
+from src.infrastructure.cache.tiered_cache import TieredCache
+
+
+@pytest.fixture
+async def disk_cache(tmp_path):
+    """Fixture com um cache em disco num diretório temporário."""
+    cache = DiskCache(str(tmp_path / "cache.db"), compact_interval=0)
+    await cache.start()
+    yield cache
+    await cache.stop()
+
+
+@pytest.mark.asyncio
+async def test_set_and_get(disk_cache):
+    """Testa gravação e leitura de valores."""
+    await disk_cache.set("key", {"name": "Luke", "films": [1, 2]}, 60)
+
+    assert await disk_cache.get("key") == {"name": "Luke", "films": [1, 2]}
+    assert await disk_cache.get("missing") is None
+    assert await disk_cache.exists("key")
+
+
+@pytest.mark.asyncio
+async def test_batch_operations(disk_cache):
+    """Testa as operações em lote."""
+    await disk_cache.set_many({"a": 1, "b": 2, "c": 3}, 60)
+
+    assert await disk_cache.get_many(["a", "missing", "c"]) == [1, None, 3]
+
+    await disk_cache.delete_many(["a", "c"])
+    assert await disk_cache.get_many(["a", "b", "c"]) == [None, 2, None]
+
+
+@pytest.mark.asyncio
+async def test_get_many_with_ttl_reports_remaining_lifetime(disk_cache):
+    """Testa que a leitura informa quanto resta do TTL de cada chave."""
+    await disk_cache.set_many({"a": 1}, 60)
+
+    (value, remaining), missing = await disk_cache.get_many_with_ttl(["a", "missing"])
+
+    assert value == 1
+    assert 55 < remaining <= 60
+    assert missing == (None, None)
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_not_returned(disk_cache):
+    """Testa que entradas vencidas não são lidas."""
+    await disk_cache.set("key", "value", 60)
+
+    with patch("src.infrastructure.cache.disk_cache.time.time", return_value=time.time() + 61):
+        assert await disk_cache.get("key") is None
+        assert not await disk_cache.exists("key")
+
+
+@pytest.mark.asyncio
+async def test_entries_survive_restart(tmp_path):
+    """Testa que uma nova instância reaproveita os dados da anterior."""
+    path = str(tmp_path / "cache.db")
+    first = DiskCache(path, compact_interval=0)
+    await first.set("key", {"warm": True}, 3600)
+    await first.stop()
+
+    second = DiskCache(path, compact_interval=0)
+    await second.start()
+    assert await second.get("key") == {"warm": True}
+    assert second.total_bytes > 0
+    await second.stop()
+
+
+@pytest.mark.asyncio
+async def test_size_is_bounded(tmp_path):
+    """Testa que, ao estourar max_bytes, as entradas menos acessadas saem."""
+    cache = DiskCache(str(tmp_path / "cache.db"), max_bytes=1000, compact_interval=0)
+    value = "x" * 200
+    now = time.time()
+
+    for i in range(10):
+        with patch("src.infrastructure.cache.disk_cache.time.time", return_value=now - 10 + i):
+            await cache.set(f"key{i}", value, 3600)
+
+    assert cache.total_bytes <= 1000
+    assert cache.evictions > 0
+    assert await cache.get("key0") is None
+    assert await cache.get("key9") == value
+    await cache.stop()
+
+
+@pytest.mark.asyncio
+async def test_compact_removes_expired(disk_cache):
+    """Testa que a compactação apaga entradas vencidas e libera bytes."""
+    await disk_cache.set("old", "x" * 100, 1)
+    await disk_cache.set("new", "y" * 100, 3600)
+    before = disk_cache.total_bytes
+
+    with patch("src.infrastructure.cache.disk_cache.time.time", return_value=time.time() + 2):
+        await disk_cache.compact()
+
+    assert disk_cache.total_bytes < before
+    assert disk_cache.get_stats()["expirations"] == 1
+    assert await disk_cache.get("new") == "y" * 100
+
+
+@pytest.mark.asyncio
+async def test_clear(disk_cache):
+    """Testa limpeza do cache."""
+    await disk_cache.set_many({"a": 1, "b": 2}, 60)
+    await disk_cache.clear()
+
+    assert await disk_cache.get_many(["a", "b"]) == [None, None]
+    assert disk_cache.total_bytes == 0
+
+
+@pytest.mark.asyncio
+async def test_disk_as_l2_under_memory(tmp_path):
+    """Testa o disco como segundo nível, reaquecendo a memória após reinício."""
+    path = str(tmp_path / "cache.db")
+    cache = TieredCache(l1=MemoryCache(), l2=DiskCache(path, compact_interval=0))
+    await cache.start()
+    await cache.set("key", "value", 3600)
+    await cache.stop()
+
+    restarted = TieredCache(l1=MemoryCache(), l2=DiskCache(path, compact_interval=0))
+    await restarted.start()
+    assert await restarted.get("key") == "value"
+    assert await restarted.get("key") == "value"
+    stats = restarted.get_stats()
+    assert stats["l2_hits"] == 1
+    assert stats["l1_hits"] == 1
+    await restarted.stop()
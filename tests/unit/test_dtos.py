@@ -8,7 +8,9 @@ from src.application.dto.filters import (
     PaginationParams,
     QueryParams,
     SortCriteria,
+    parse_filter_expressions,
 )
+from src.config.exceptions import InvalidFilterError
 
 
 class TestFilterCriteria:
@@ -287,3 +289,38 @@ class TestDTOValidation:
         assert params.filters is not None
         assert params.sort is not None
         assert params.pagination is not None
+
+
+class TestParseFilterExpressions:
+    """Testes para conversão de expressões de filtro."""
+
+    def test_parse_operators(self):
+        """Testa conversão de todos os operadores."""
+        filters = parse_filter_expressions(["height>=180", "gender=male", "name~sky", "mass!=77"])
+
+        assert filters == {
+            "height": {"operator": "gte", "value": "180"},
+            "gender": {"operator": "eq", "value": "male"},
+            "name": {"operator": "contains", "value": "sky"},
+            "mass": {"operator": "ne", "value": "77"},
+        }
+
+    def test_parse_repeated_field(self):
+        """Testa combinação de expressões no mesmo campo."""
+        filters = parse_filter_expressions(["height>100", "height<200"])
+
+        assert filters == {
+            "height": [
+                {"operator": "gt", "value": "100"},
+                {"operator": "lt", "value": "200"},
+            ]
+        }
+
+    def test_parse_empty(self):
+        """Testa ausência de expressões."""
+        assert parse_filter_expressions(None) is None
+
+    def test_parse_invalid(self):
+        """Testa expressão inválida."""
+        with pytest.raises(InvalidFilterError):
+            parse_filter_expressions(["height"])
@@ -0,0 +1,52 @@
+from src.infrastructure.cache.eviction import (
+    FrequencySketch,
+    LFUPolicy,
+    LRUPolicy,
+    TinyLFUPolicy,
+    create_eviction_policy,
+)
+
+
+def test_lru_victim_is_least_recent():
+    """Testa que a vítima LRU é a chave usada há mais tempo."""
+    policy = LRUPolicy()
+    policy.on_insert("a")
+    policy.on_insert("b")
+    policy.on_get("a", True)
+
+    assert policy.victim() == "b"
+
+
+def test_lfu_victim_after_remove():
+    """Testa que a frequência mínima é recalculada após remoções."""
+    policy = LFUPolicy()
+    policy.on_insert("a")
+    policy.on_insert("b")
+    policy.on_get("a", True)
+    policy.on_get("b", True)
+    policy.on_get("b", True)
+    policy.on_insert("c")
+    policy.on_remove("c")
+
+    assert policy.victim() == "a"
+
+
+def test_frequency_sketch_estimates_and_ages():
+    """Testa a estimativa e o envelhecimento do sketch."""
+    sketch = FrequencySketch(16)
+    for _ in range(6):
+        sketch.increment("hot")
+
+    assert sketch.estimate("hot") >= 6
+    assert sketch.estimate("cold") <= sketch.estimate("hot")
+
+    sketch._reset()
+    assert sketch.estimate("hot") >= 3
+
+
+def test_create_eviction_policy():
+    """Testa a criação de políticas pelo nome."""
+    assert isinstance(create_eviction_policy("LRU"), LRUPolicy)
+    assert isinstance(create_eviction_policy("lfu"), LFUPolicy)
+    assert isinstance(create_eviction_policy("tinylfu"), TinyLFUPolicy)
+    assert type(create_eviction_policy("unknown")) is LRUPolicy
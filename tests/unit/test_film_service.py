@@ -148,3 +148,17 @@ async def test_get_films_by_starship_success(film_service, mock_repository, mock
     result = await film_service.get_films_by_starship("12")
 
     assert len(result) >= 0
+
+
+@pytest.mark.asyncio
+async def test_get_films_by_character_uses_get_many(film_service, mock_repository, mock_swapi_film):
+    """Testa que os filmes de um personagem são obtidos em lote."""
+    film = Film(**mock_swapi_film)
+    mock_repository.get_many.return_value = [film]
+    mock_repository.get_related_ids.return_value = ["1", "2"]
+
+    result = await film_service.get_films_by_character("1")
+
+    assert result == [film]
+    mock_repository.get_related_ids.assert_called_once_with("people", "1")
+    mock_repository.get_many.assert_called_once_with(["1", "2"])
@@ -0,0 +1,163 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.infrastructure.http.concurrency_limiter import AIMDLimiter
+from src.infrastructure.http.hedging import HedgePolicy, LatencyTracker
+from src.infrastructure.http.retry import RetryPolicy
+from src.infrastructure.http.swapi_client import SwapiClient
+
+
+def trained_policy(latency=0.01, samples=50, **kwargs):
+    """Cria uma política que já observou latências típicas."""
+    tracker = LatencyTracker(min_samples=20)
+    for _ in range(samples):
+        tracker.observe(latency)
+    return HedgePolicy(tracker=tracker, min_delay=0.0, **kwargs)
+
+
+def test_quantile_needs_min_samples():
+    """Testa que não há atraso de hedge sem amostras suficientes."""
+    tracker = LatencyTracker(min_samples=5)
+    for value in (0.1, 0.2, 0.3, 0.4):
+        tracker.observe(value)
+    assert tracker.quantile(0.5) is None
+
+    tracker.observe(0.5)
+    assert tracker.quantile(0.5) == 0.3
+    assert tracker.quantile(1.0) == 0.5
+
+
+@pytest.mark.asyncio
+async def test_fast_call_is_not_hedged():
+    """Testa que uma resposta dentro do quantil não gera cópia."""
+    policy = trained_policy(latency=0.05, budget=1.0)
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        return "ok"
+
+    assert await policy.run(fetch) == "ok"
+    assert calls == 1
+    assert policy.get_stats()["hedged"] == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_call_is_hedged_and_loser_cancelled():
+    """Testa que a cópia responde primeiro e a tentativa lenta é cancelada."""
+    policy = trained_policy(latency=0.01, budget=1.0)
+    cancelled = asyncio.Event()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "slow"
+        return "fast"
+
+    assert await policy.run(fetch) == "fast"
+    await asyncio.sleep(0)
+
+    assert cancelled.is_set()
+    stats = policy.get_stats()
+    assert stats["hedged"] == 1
+    assert stats["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_copy_waits_for_other_attempt():
+    """Testa que uma falha de uma das cópias não descarta a outra."""
+    policy = trained_policy(latency=0.01, budget=1.0)
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(0.05)
+            return "primary"
+        raise RuntimeError("falhou")
+
+    assert await policy.run(fetch) == "primary"
+
+
+@pytest.mark.asyncio
+async def test_budget_caps_hedges():
+    """Testa que as cópias ficam limitadas à fração configurada das chamadas."""
+    policy = trained_policy(latency=0.001, budget=0.2)
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    for _ in range(20):
+        await policy.run(fetch)
+
+    stats = policy.get_stats()
+    assert 1 <= stats["hedged"] <= 4
+    assert stats["over_budget"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_swapi_client_hedges_slow_requests():
+    """Testa o hedging integrado ao cliente SWAPI."""
+    calls = 0
+
+    async def handler(request):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(1)
+        return httpx.Response(200, json={"name": "Luke Skywalker"})
+
+    client = SwapiClient(
+        retry_policy=RetryPolicy(max_attempts=1),
+        hedge_policy=trained_policy(latency=0.01, budget=1.0),
+    )
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    result = await asyncio.wait_for(client.get("https://swapi.dev/api/people/1/"), 0.5)
+
+    assert result["name"] == "Luke Skywalker"
+    assert client.get_stats()["hedging"]["hedge_wins"] == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_hedged_copy_takes_limiter_slot():
+    """Testa que a cópia ocupa uma vaga do limitador e só sai se houver vaga."""
+    calls = 0
+
+    async def handler(request):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(0.1)
+        return httpx.Response(200, json={"name": "Luke Skywalker"})
+
+    for limit, copies in ((2, 1), (1, 0)):
+        calls = 0
+        limiter = AIMDLimiter(initial_limit=limit, max_limit=limit)
+        client = SwapiClient(
+            retry_policy=RetryPolicy(max_attempts=1),
+            hedge_policy=trained_policy(latency=0.01, budget=1.0),
+            limiter=limiter,
+        )
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        await client.get("https://swapi.dev/api/people/1/")
+
+        stats = client.get_stats()["hedging"]
+        assert stats["hedged"] == copies
+        assert stats["denied"] == 1 - copies
+        assert limiter.in_flight == 0
+        await client.close()
@@ -0,0 +1,146 @@
+import pytest
+
+from src.config.exceptions import CacheError
+from src.infrastructure.cache.keys import CacheKeyspace
+from src.infrastructure.cache.memory_cache import MemoryCache
+from src.infrastructure.cache.redis_cache import RedisCache
+from tests.unit.fake_redis import FakeRedis, FakeRedisServer
+
+
+@pytest.fixture
+def server():
+    """Fixture para servidor Redis falso."""
+    return FakeRedisServer()
+
+
+@pytest.fixture
+def cache(server):
+    """Fixture para RedisCache conectado ao servidor falso."""
+    redis_cache = RedisCache("redis://fake", health_check_interval=0, fallback=MemoryCache())
+    redis_cache.client = FakeRedis(server)
+    return redis_cache
+
+
+@pytest.mark.asyncio
+async def test_operations_use_redis_when_available(cache, server):
+    """Testa que, com Redis saudável, os dados vão para o Redis."""
+    await cache.set("key", {"value": 1}, 60)
+
+    assert "key" in server.data
+    assert await cache.get("key") == {"value": 1}
+    assert cache.get_stats()["fallback_operations"] == 0
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_memory_when_redis_fails(cache, server):
+    """Testa que uma falha de conexão desvia as operações para a memória."""
+    server.down = True
+
+    await cache.set("key", "value", 60)
+
+    assert "key" not in server.data
+    assert await cache.get("key") == "value"
+    stats = cache.get_stats()
+    assert stats["available"] is False
+    assert stats["connection_failures"] >= 1
+    assert stats["fallback_operations"] == 2
+
+
+@pytest.mark.asyncio
+async def test_recovers_and_replays_deletes(cache, server):
+    """Testa a volta ao Redis e a reaplicação das remoções feitas na queda."""
+    await cache.set("stale", "old", 60)
+    server.down = True
+    await cache.delete("stale")
+
+    server.down = False
+    assert await cache._probe() is True
+
+    assert "stale" not in server.data
+    stats = cache.get_stats()
+    assert stats["available"] is True
+    assert stats["recoveries"] == 1
+    assert stats["pending_deletes"] == 0
+
+
+@pytest.mark.asyncio
+async def test_recovery_keeps_invalidations_made_while_down(cache, server):
+    """Testa que gerações e tags gravadas na queda voltam ao Redis."""
+    keyspace = CacheKeyspace(cache)
+    generation = await keyspace.get_generation("people")
+    await cache.set("data", "value", 60)
+    await keyspace.tag({"people:1": ["data"]}, 60)
+
+    server.down = True
+    bumped = await keyspace.bump("people")
+    await keyspace.tag({"people:1": ["other"]}, 60)
+    await cache.set("ignored", "value", 60)
+
+    server.down = False
+    assert await cache._probe() is True
+
+    assert bumped > generation
+    assert await keyspace.get_generation("people") == bumped
+    assert set(await cache.get(keyspace._tag_key("people:1"))) == {"data", "other"}
+    assert "ignored" not in server.data
+    assert cache.get_stats()["pending_writes"] == 0
+
+
+@pytest.mark.asyncio
+async def test_retries_are_throttled_while_down(server):
+    """Testa que, na queda, novas tentativas respeitam o intervalo de verificação."""
+    cache = RedisCache("redis://fake", health_check_interval=60, fallback=MemoryCache())
+    cache.client = FakeRedis(server)
+    server.down = True
+    await cache.get("key")
+    failures = cache.connection_failures
+
+    server.down = False
+    await cache.get("key")
+
+    assert cache.connection_failures == failures
+    assert cache.available is False
+
+
+@pytest.mark.asyncio
+async def test_start_survives_unreachable_redis(server):
+    """Testa que a aplicação sobe mesmo com Redis fora do ar."""
+    cache = RedisCache("redis://fake", health_check_interval=0, fallback=MemoryCache())
+    cache.client = FakeRedis(server)
+    server.down = True
+
+    await cache.start()
+    await cache.set("key", "value", 60)
+
+    assert await cache.get("key") == "value"
+    await cache.stop()
+
+
+@pytest.mark.asyncio
+async def test_connect_raises_when_unreachable(cache, server):
+    """Testa que connect() explícito continua sinalizando a falha."""
+    server.down = True
+
+    with pytest.raises(CacheError):
+        await cache.connect()
+
+
+def test_client_uses_sized_pool():
+    """Testa que o cliente é criado sobre um pool dimensionado."""
+    cache = RedisCache("redis://localhost:6379/0", max_connections=7)
+
+    client = cache._create_client()
+
+    assert client.connection_pool is cache.pool
+    assert cache.pool.max_connections == 7
+
+
+@pytest.mark.asyncio
+async def test_clear_only_removes_namespace_keys(cache, server):
+    """Testa que clear remove só as chaves da aplicação, sem FLUSHDB."""
+    server.data["other-app:key"] = b"keep"
+    await cache.set_many({"starwars-api:v1:people:g1:by_id:1": 1, "starwars-api:x": 2}, 60)
+
+    await cache.clear()
+
+    assert server.data == {"other-app:key": b"keep"}
@@ -0,0 +1,83 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.infrastructure.cache.refresh import RefreshPolicy
+
+
+def test_unwrap_fresh_value():
+    """Testa que um valor longe de expirar não é renovado."""
+    policy = RefreshPolicy()
+    value, needs_refresh = policy.unwrap(policy.wrap({"a": 1}, 3600, 0.01))
+
+    assert value == {"a": 1}
+    assert needs_refresh is False
+
+
+def test_unwrap_plain_value_is_fresh():
+    """Testa que valores gravados sem envelope continuam sendo lidos."""
+    policy = RefreshPolicy()
+
+    assert policy.unwrap({"name": "Luke"}) == ({"name": "Luke"}, False)
+
+
+def test_unwrap_expired_value_is_stale():
+    """Testa que um valor vencido é devolvido e marcado para renovação."""
+    policy = RefreshPolicy()
+    value, needs_refresh = policy.unwrap(policy.wrap("old", -1, 0.01))
+
+    assert value == "old"
+    assert needs_refresh is True
+    assert policy.get_stats()["stale_hits"] == 1
+
+
+def test_xfetch_refreshes_early_near_expiry():
+    """Testa que o XFetch antecipa a renovação quando o tempo restante é pequeno."""
+    policy = RefreshPolicy(beta=1.0)
+    envelope = policy.wrap("value", 1, 2.0)
+
+    # -ln(1 - 0.9) * 2.0 ≈ 4.6s, maior que o 1s restante
+    with patch("src.infrastructure.cache.refresh.random.random", return_value=0.9):
+        _, needs_refresh = policy.unwrap(envelope)
+
+    assert needs_refresh is True
+    assert policy.get_stats()["early_refreshes"] == 1
+
+
+def test_storage_ttl_includes_stale_window():
+    """Testa que a chave sobrevive ao TTL lógico pela janela de stale."""
+    assert RefreshPolicy(stale_ttl=600).storage_ttl(3600) == 4200
+
+
+@pytest.mark.asyncio
+async def test_refresh_is_deduplicated():
+    """Testa que só uma renovação por chave roda ao mesmo tempo."""
+    policy = RefreshPolicy()
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+
+    for _ in range(10):
+        policy.refresh("key", loader)
+        await asyncio.sleep(0)
+    await policy.join()
+
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_errors_are_counted():
+    """Testa que falhas na renovação não se propagam."""
+    policy = RefreshPolicy()
+
+    async def loader():
+        raise RuntimeError("falhou")
+
+    policy.refresh("key", loader)
+    await policy.join()
+
+    assert policy.get_stats()["refresh_errors"] == 1
@@ -0,0 +1,115 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.config.exceptions import ResourceNotFoundError
+from src.domain.entities.character import Character
+from src.domain.entities.film import Film
+from src.domain.entities.planet import Planet
+from src.infrastructure.database.dataset import Dataset
+from src.infrastructure.database.relationships import RelationshipGraph, RelationshipIndex
+
+
+def build_dataset(entity_class, items, version=1):
+    """Cria um dataset a partir de dicionários da SWAPI."""
+    entities = [entity_class(**item) for item in items]
+    return Dataset(entities, fields=entity_class.model_fields.keys(), version=version)
+
+
+@pytest.fixture
+def datasets(mock_swapi_character, mock_swapi_film, mock_swapi_planet):
+    """Fixture com datasets de personagens, filmes e planetas relacionados."""
+    leia = {
+        **mock_swapi_character,
+        "name": "Leia Organa",
+        "url": "https://swapi.dev/api/people/5/",
+        "homeworld": "https://swapi.dev/api/planets/2/",
+        "films": ["https://swapi.dev/api/films/1/"],
+    }
+    film = {
+        **mock_swapi_film,
+        "characters": ["https://swapi.dev/api/people/1/", "https://swapi.dev/api/people/5/"],
+    }
+    return {
+        "people": build_dataset(Character, [mock_swapi_character, leia]),
+        "films": build_dataset(Film, [film]),
+        "planets": build_dataset(Planet, [mock_swapi_planet]),
+    }
+
+
+def test_forward_and_backward_edges(datasets):
+    """Testa arestas nas duas direções com IDs inteiros."""
+    index = RelationshipIndex(datasets)
+
+    assert index.neighbors("films", 1, "people") == (1, 5)
+    assert index.neighbors("people", 1, "films") == (1, 2)
+    assert index.neighbors("people", 5, "films") == (1,)
+
+
+def test_single_url_relation(datasets):
+    """Testa relacionamento de URL única (planeta natal)."""
+    index = RelationshipIndex(datasets)
+
+    assert index.neighbors("people", 5, "planets") == (2,)
+    assert index.neighbors("planets", 1, "people") == (1,)
+    assert index.neighbors("planets", 2, "people") == (5,)
+
+
+def test_unknown_node(datasets):
+    """Testa consulta de recurso inexistente."""
+    index = RelationshipIndex(datasets)
+
+    assert index.neighbors("films", 99, "people") == ()
+
+
+def make_repositories(datasets, loaded=True):
+    """Cria repositórios mockados que servem os datasets informados."""
+    repositories = []
+    for resource_type, dataset in datasets.items():
+        repository = AsyncMock()
+        repository.resource_type = resource_type
+        repository.get_dataset.return_value = dataset
+        repository.get_by_id.side_effect = lambda resource_id, dataset=dataset: dataset.get(
+            resource_id
+        )
+        repository.has_dataset = MagicMock(return_value=loaded)
+        repositories.append(repository)
+    return repositories
+
+
+@pytest.mark.asyncio
+async def test_graph_rebuilds_only_on_new_versions(datasets):
+    """Testa que o grafo é reconstruído apenas quando as coleções mudam."""
+    graph = RelationshipGraph(make_repositories(datasets))
+
+    first = await graph.get_index()
+    assert await graph.get_index() is first
+    assert await graph.get_related_ids("films", "1", "people") == ["1", "5"]
+
+    datasets["films"].version = 2
+    assert await graph.get_index() is not first
+
+
+@pytest.mark.asyncio
+async def test_unknown_source_raises_not_found(datasets):
+    """Testa que uma origem inexistente gera 404 em vez de lista vazia."""
+    repositories = make_repositories(datasets)
+    graph = RelationshipGraph(repositories)
+    graph.repositories["films"].get_by_id.side_effect = ResourceNotFoundError("films", "9999")
+
+    with pytest.raises(ResourceNotFoundError):
+        await graph.get_related_ids("films", "9999", "people")
+    with pytest.raises(ResourceNotFoundError):
+        await graph.get_related_ids("films", "abc", "people")
+
+
+@pytest.mark.asyncio
+async def test_reads_source_fields_until_collections_are_loaded(datasets):
+    """Testa que, sem as coleções carregadas, o índice não é montado."""
+    repositories = make_repositories(datasets, loaded=False)
+    graph = RelationshipGraph(repositories)
+
+    assert await graph.get_related_ids("films", "1", "people") == ["1", "5"]
+    assert await graph.get_related_ids("people", "5", "planets") == ["2"]
+    for repository in repositories:
+        repository.get_dataset.assert_not_called()
@@ -113,3 +113,11 @@ class TestSettings:
         """Testa que método is_development existe."""
         assert hasattr(Settings, "is_development")
         assert callable(Settings.is_development)
+
+
+def test_parse_ttls():
+    """Testa a leitura dos TTLs por recurso."""
+    from src.config.settings import _parse_ttls
+
+    assert _parse_ttls("films=86400, planets = 7200") == {"films": 86400, "planets": 7200}
+    assert _parse_ttls("") == {}
@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from src.infrastructure.http.single_flight import SingleFlight
+
+
+@pytest.fixture
+def single_flight():
+    """Fixture para agrupador de chamadas."""
+    return SingleFlight()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_coalesced(single_flight):
+    """Testa que chamadas concorrentes com a mesma chave executam uma vez."""
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"name": "Luke Skywalker"}
+
+    results = await asyncio.gather(*[single_flight.do("people/1", fetch) for _ in range(10)])
+
+    assert calls == 1
+    assert all(result["name"] == "Luke Skywalker" for result in results)
+    stats = single_flight.get_stats()
+    assert stats["requests"] == 10
+    assert stats["executions"] == 1
+    assert stats["coalesced"] == 9
+    assert stats["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_different_keys_are_not_coalesced(single_flight):
+    """Testa que chaves diferentes executam separadamente."""
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return {}
+
+    await asyncio.gather(single_flight.do("people/1", fetch), single_flight.do("people/2", fetch))
+
+    assert single_flight.get_stats()["executions"] == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_and_not_cached(single_flight):
+    """Testa que erros chegam a todos os chamadores e não ficam registrados."""
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("erro")
+
+    results = await asyncio.gather(
+        single_flight.do("people/1", fail),
+        single_flight.do("people/1", fail),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+    async def succeed():
+        return {"ok": True}
+
+    assert await single_flight.do("people/1", succeed) == {"ok": True}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_others(single_flight):
+    """Testa que cancelar um chamador não afeta os demais."""
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return {"ok": True}
+
+    first = asyncio.ensure_future(single_flight.do("people/1", fetch))
+    second = asyncio.ensure_future(single_flight.do("people/1", fetch))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert await second == {"ok": True}
@@ -173,3 +173,205 @@ async def test_get_list_response(swapi_client):
 
         assert result["count"] == 2
         assert len(result["results"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_coalesces_concurrent_requests(swapi_client):
+    """Testa que GETs concorrentes para a mesma URL fazem uma única chamada."""
+    import asyncio
+
+    async def slow_get(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return httpx.Response(
+            200,
+            json={"name": "Luke Skywalker"},
+            request=httpx.Request("GET", "https://swapi.dev/api/people/1/"),
+        )
+
+    with patch.object(swapi_client.client, "get", side_effect=slow_get) as mock_get:
+        results = await asyncio.gather(
+            *[swapi_client.get("https://swapi.dev/api/people/1/") for _ in range(5)]
+        )
+
+        assert mock_get.call_count == 1
+        assert all(result["name"] == "Luke Skywalker" for result in results)
+        assert swapi_client.get_stats()["single_flight"]["coalesced"] == 4
+
+
+def make_client(handler, **kwargs):
+    """Cria um cliente SWAPI cujas requisições são atendidas por handler."""
+    from src.infrastructure.http.retry import RetryPolicy
+
+    retry_policy = kwargs.pop(
+        "retry_policy", RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.001)
+    )
+    client = SwapiClient(retry_policy=retry_policy, **kwargs)
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.mark.asyncio
+async def test_get_retries_transient_errors():
+    """Testa que 5xx transitórios são repetidos até o sucesso."""
+    responses = iter([503, 502, 200])
+
+    def handler(request):
+        status = next(responses)
+        return httpx.Response(status, json={"name": "Luke Skywalker"} if status == 200 else {})
+
+    client = make_client(handler)
+    result = await client.get("https://swapi.dev/api/people/1/")
+
+    assert result["name"] == "Luke Skywalker"
+    stats = client.get_stats()
+    assert stats["retry"]["attempts"] == 3
+    assert stats["retry"]["retries"] == 2
+    assert stats["circuit_breakers"]["swapi.dev"]["state"] == "closed"
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_does_not_retry_not_found():
+    """Testa que um 404 não é repetido."""
+    calls = 0
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        return httpx.Response(404, json={"detail": "Not found"})
+
+    client = make_client(handler)
+    with pytest.raises(ExternalAPIError) as exc_info:
+        await client.get("https://swapi.dev/api/people/9999/")
+
+    assert exc_info.value.status_code == 404
+    assert calls == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_gives_up_after_max_attempts():
+    """Testa que as tentativas param no limite configurado."""
+    client = make_client(lambda request: httpx.Response(500))
+
+    with pytest.raises(ExternalAPIError) as exc_info:
+        await client.get("https://swapi.dev/api/people/1/")
+
+    assert exc_info.value.status_code == 500
+    assert client.get_stats()["retry"]["exhausted"] == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_respects_request_deadline():
+    """Testa que não há nova tentativa quando a espera estouraria o prazo."""
+    from src.infrastructure.http.retry import RetryPolicy
+
+    calls = 0
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        return httpx.Response(503)
+
+    policy = RetryPolicy(max_attempts=5, base_delay=10, max_delay=10, deadline=0.5)
+    client = make_client(handler, retry_policy=policy)
+    with patch("src.infrastructure.http.retry.random.uniform", return_value=10):
+        with pytest.raises(ExternalAPIError):
+            await client.get("https://swapi.dev/api/people/1/")
+
+    assert calls == 1
+    assert client.get_stats()["retry"]["deadline_exceeded"] == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast():
+    """Testa que, com o circuito aberto, nenhuma requisição chega ao host."""
+    calls = 0
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        return httpx.Response(503)
+
+    client = make_client(handler, failure_threshold=3)
+    with pytest.raises(ExternalAPIError):
+        await client.get("https://swapi.dev/api/people/1/")
+    assert calls == 3
+
+    with pytest.raises(ExternalAPIError) as exc_info:
+        await client.get("https://swapi.dev/api/people/2/")
+
+    assert exc_info.value.status_code == 503
+    assert calls == 3
+    stats = client.get_stats()
+    assert stats["circuit_breakers"]["swapi.dev"]["state"] == "open"
+    assert stats["short_circuited"] == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_client_uses_configured_pool_and_timeouts():
+    """Testa que limites do pool e timeouts por fase vêm das configurações."""
+    from src.config.settings import settings
+
+    client = SwapiClient()
+
+    assert client.limits.max_connections == settings.SWAPI_MAX_CONNECTIONS
+    assert client.limits.max_keepalive_connections == settings.SWAPI_MAX_KEEPALIVE_CONNECTIONS
+    assert client.limits.keepalive_expiry == settings.SWAPI_KEEPALIVE_EXPIRY
+    assert client.timeouts.connect == settings.SWAPI_CONNECT_TIMEOUT
+    assert client.timeouts.read == settings.SWAPI_READ_TIMEOUT
+    assert client.timeouts.pool == settings.SWAPI_POOL_TIMEOUT
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_attempt_timeout_caps_every_phase():
+    """Testa que o tempo restante da tentativa limita todas as fases."""
+    client = SwapiClient(timeouts=httpx.Timeout(10, connect=3, read=10, pool=5))
+
+    timeout = client._timeout_for(2)
+
+    assert timeout.connect == 2
+    assert timeout.read == 2
+    assert timeout.pool == 2
+    assert client._timeout_for(20).connect == 3
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_http2_falls_back_without_h2():
+    """Testa que, sem o pacote h2, o cliente usa HTTP/1.1."""
+    with patch("src.infrastructure.http.swapi_client.h2", None):
+        client = SwapiClient(http2=True)
+
+    assert client.http2 is False
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_half_open_trial_frees_the_circuit():
+    """Testa que cancelar a chamada de teste do circuito libera a próxima."""
+    import asyncio
+
+    async def handler(request):
+        await asyncio.sleep(1)
+        return httpx.Response(200, json={})
+
+    client = make_client(handler, failure_threshold=1, recovery_timeout=0)
+    breaker = client._get_breaker("https://swapi.dev/api/people/1/")
+    breaker.record_failure()
+
+    # O cancelamento do chamador não chega à busca (single flight), mas o da busca sim
+    task = asyncio.create_task(client._fetch("https://swapi.dev/api/people/1/"))
+    await asyncio.sleep(0.01)
+    assert breaker.trial_calls == 1
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert breaker.trial_calls == 0
+    assert breaker.allow()
+    await client.close()
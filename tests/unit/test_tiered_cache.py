@@ -0,0 +1,184 @@
+import asyncio
+import time
+
+import pytest
+
+from src.infrastructure.cache.memory_cache import MemoryCache
+from src.infrastructure.cache.redis_cache import RedisCache
+from src.infrastructure.cache.tiered_cache import CLEAR_ALL, RedisInvalidationBus, TieredCache
+from tests.unit.fake_redis import FakeRedis, FakeRedisServer
+
+
+def make_worker(server):
+    """Cria o cache de um worker conectado ao servidor falso."""
+    redis_cache = RedisCache("redis://fake")
+    redis_cache.client = FakeRedis(server)
+    return TieredCache(
+        l1=MemoryCache(max_entries=100),
+        l2=redis_cache,
+        bus=RedisInvalidationBus(redis_cache, "invalidate"),
+        l1_ttl=30,
+    )
+
+
+async def settle():
+    """Deixa as tarefas de escuta processarem as mensagens pendentes."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+async def workers():
+    """Fixture com dois workers compartilhando o mesmo Redis falso."""
+    server = FakeRedisServer()
+    caches = [make_worker(server), make_worker(server)]
+    for cache in caches:
+        await cache.start()
+    await settle()
+    yield caches
+    for cache in caches:
+        await cache.stop()
+
+
+@pytest.mark.asyncio
+async def test_get_fills_l1_from_l2(workers):
+    """Testa que uma leitura no L2 preenche o L1."""
+    first, second = workers
+    await first.set("key", {"value": 1}, 3600)
+
+    assert await second.get("key") == {"value": 1}
+    assert await second.get("key") == {"value": 1}
+
+    stats = second.get_stats()
+    assert stats["l2_hits"] == 1
+    assert stats["l1_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_l1_copy_does_not_outlive_l2_entry(workers):
+    """Testa que o L1 preenchido pelo L2 expira junto com a chave no L2."""
+    first, second = workers
+    await first.set_many({"short": "value", "long": "value"}, 3600)
+    await first.l2.set("short", "value", 5)
+    await first.l2.set("expiring", "value", 1)
+
+    assert await second.get("short") == "value"
+    assert await second.get_many(["long", "expiring"]) == ["value", "value"]
+
+    now = time.monotonic()
+    assert second.l1.cache["short"][1] <= now + 5
+    assert second.l1.cache["long"][1] > now + 25
+    assert "expiring" not in second.l1.cache
+
+
+@pytest.mark.asyncio
+async def test_set_invalidates_other_workers(workers):
+    """Testa que uma escrita invalida o L1 dos outros workers."""
+    first, second = workers
+    await first.set("key", "old", 3600)
+    assert await second.get("key") == "old"
+
+    await first.set("key", "new", 3600)
+    await settle()
+
+    assert await second.get("key") == "new"
+    assert second.get_stats()["invalidations_received"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_delete_invalidates_other_workers(workers):
+    """Testa que uma remoção não deixa dados antigos no L1 remoto."""
+    first, second = workers
+    await first.set("key", "value", 3600)
+    assert await second.get("key") == "value"
+
+    await first.delete("key")
+    await settle()
+
+    assert await second.get("key") is None
+
+
+@pytest.mark.asyncio
+async def test_clear_invalidates_other_workers(workers):
+    """Testa que limpar o cache esvazia o L1 dos outros workers."""
+    first, second = workers
+    await first.set("key", "value", 3600)
+    assert await second.get("key") == "value"
+
+    await first.clear()
+    await settle()
+
+    assert await second.l1.get("key") is None
+
+
+@pytest.mark.asyncio
+async def test_own_messages_are_ignored(workers):
+    """Testa que um worker não invalida o próprio L1 ao publicar."""
+    first, _ = workers
+    await first.set("key", "value", 3600)
+    await settle()
+
+    assert first.bus.received == 0
+    assert await first.l1.get("key") == "value"
+
+
+@pytest.mark.asyncio
+async def test_redis_batch_operations_use_single_round_trip():
+    """Testa que as operações em lote do Redis usam MGET, pipeline e um DEL."""
+    cache = RedisCache("redis://fake")
+    cache.client = FakeRedis(FakeRedisServer())
+
+    await cache.set_many({"a": 1, "b": {"value": 2}}, 60)
+    assert cache.client.pipelines == 1
+
+    assert await cache.get_many(["a", "missing", "b"]) == [1, None, {"value": 2}]
+    assert cache.client.mgets == 1
+
+    await cache.delete_many(["a", "b"])
+    assert await cache.get_many(["a", "b"]) == [None, None]
+
+
+@pytest.mark.asyncio
+async def test_get_many_reads_l2_only_for_l1_misses(workers):
+    """Testa que o lote consulta o L2 só para as chaves ausentes no L1."""
+    first, second = workers
+    await first.set_many({"a": 1, "b": 2}, 3600)
+    await second.set("c", 3, 3600)
+    await settle()
+
+    assert await second.get_many(["a", "c", "missing"]) == [1, 3, None]
+    assert second.l2.client.mgets == 1
+    assert second.get_stats()["l1_hits"] == 1
+
+    await first.delete_many(["a"])
+    await settle()
+    assert await second.get_many(["a"]) == [None]
+
+
+@pytest.mark.asyncio
+async def test_bus_backs_off_and_clears_l1_once_per_outage():
+    """Testa que a queda do Redis gera backoff e uma única limpeza do L1."""
+    server = FakeRedisServer()
+    redis_cache = RedisCache("redis://fake")
+    redis_cache.client = FakeRedis(server)
+    bus = RedisInvalidationBus(redis_cache, "invalidate", retry_delay=0.01, max_retry_delay=0.04)
+    invalidated = []
+
+    async def on_invalidate(key):
+        invalidated.append(key)
+
+    await bus.start(on_invalidate)
+    await settle()
+    server.disconnect()
+    await asyncio.sleep(0.2)
+
+    assert bus.outages == 1
+    assert invalidated == []
+
+    server.down = False
+    await asyncio.sleep(0.1)
+    await FakeRedis(server).publish("invalidate", '{"origin": "other", "keys": ["key"]}')
+    await settle()
+    await bus.stop()
+
+    assert invalidated == [CLEAR_ALL, "key"]